@@ -2,15 +2,65 @@
 """
 Process arrow and number placement JSON from HTML editor
 and match them to SVG paths for use in Flutter app.
+
+Every item is snapped to the nearest point of the letter's stroke centre:
+the placement JSON's centerlinePath (drawn in centerline_editor.html) when
+it has one, otherwise the SVG's paths, which are the filled outline and so
+pull items off-centre onto the letter's edge. The path is flattened once
+into dense arc-length samples, a grid index over the samples lists the
+candidates near each cell, and all items of the file are looked up in one
+vectorized query. Each output entry gets the snapped point and the path's
+tangent angle there; with --snap the snapped point (and, for arrows, the
+tangent) replaces the hand-placed one. metadata.snap_target says which
+path was used. Number labels are never moved, only reported, and an arrow
+or line more than --max-snap (a fraction of the path's longer side) from
+the path stays where it was placed and is flagged with snap_too_far.
+
+`batch` processes a whole folder of placement exports in one run: each is
+matched by letter name to an SVG (ka_custom_positions.json or
+ka_placement.json -> ka_extracted.svg or ka.svg), SVGs are shared out over
+a pool of worker processes, and every SVG is parsed and sampled once for
+all of its placement files. It writes <letter>_arrow_numbers.json/.dart
+per letter and batch_summary.json. Two placement files for the same letter
+(say ka_custom_positions.json and ka_placement.json) would write the same
+outputs, so such a letter is reported as a conflict and neither is
+processed.
 """
 
 import json
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from xml.etree import ElementTree as ET
 import re
 
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+CENTER_LINE_DIR = SCRIPT_DIR.parent / 'center_line_generator'
+SVG_GENERATOR_DIR = SCRIPT_DIR.parent / 'svg_generator'
+for path in (CENTER_LINE_DIR, SVG_GENERATOR_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from centerline_to_points import flatten_strokes
+from extract_centerline import resample_polyline
+from cli_options import pop_flag, pop_int_option, pop_option
+
+# Distance between path samples, as a fraction of the paths' longer side
+SAMPLE_SPACING = 0.002
+
+# Grid index cells per side
+INDEX_CELLS = 32
+
+# Farthest an item is moved by --snap, as a fraction of the paths' longer side
+MAX_SNAP_DISTANCE = 0.1
+
+# File name endings stripped to get the letter name in batch mode
+PLACEMENT_SUFFIXES = ('_custom_positions', '_arrow_number_placement', '_placement')
+SVG_SUFFIXES = ('_extracted',)
+
 def parse_svg_path(svg_file):
     """Parse SVG file and extract path data."""
     try:
@@ -66,36 +116,258 @@ def normalize_coordinates(x, y, svg_viewbox, target_size=(200, 200)):
     
     return target_x, target_y, norm_x, norm_y
 
-def find_nearest_path_point(x, y, path_data, svg_viewbox):
-    """Find the nearest point on the SVG path to the given coordinates."""
-    # This is a simplified version - in practice, you'd need to:
-    # 1. Parse the path data
-    # 2. Sample points along the path
-    # 3. Find the closest point
-    
-    # For now, return the input coordinates (you can enhance this)
-    return x, y
+def sample_svg_paths(paths, spacing=SAMPLE_SPACING):
+    """Flatten SVG path strings into evenly spaced samples.
+
+    Returns:
+        dict with 'points' (N, 2), 'angles' (N,) tangent angles in radians
+        (SVG Y-down, like the editor's arrow angles), 'path_index' (N,) and
+        'extent' (the paths' longer side), or None if the paths draw nothing
+    """
+    # A coarse pass (segment ends only) sizes the sample spacing; the curves
+    # are then flattened to a quarter of that spacing
+    coarse = [stroke for path_data in paths
+              for stroke in flatten_strokes(path_data, tolerance=float('inf'))]
+    if not coarse:
+        return None
+    all_points = np.vstack(coarse)
+    extent = max(np.ptp(all_points[:, 0]), np.ptp(all_points[:, 1]))
+    step = extent * spacing if extent > 0 else 1.0
+
+    points, angles, path_ids = [], [], []
+    for path_index, path_data in enumerate(paths):
+        for stroke in flatten_strokes(path_data, tolerance=step / 4):
+            samples = resample_polyline(stroke, step)
+            direction = np.gradient(samples, axis=0)
+            points.append(samples)
+            angles.append(np.arctan2(direction[:, 1], direction[:, 0]))
+            path_ids.append(np.full(len(samples), path_index))
+    return {
+        'points': np.vstack(points),
+        'angles': np.concatenate(angles),
+        'path_index': np.concatenate(path_ids),
+        'extent': float(extent),
+    }
+
+def build_path_index(samples, cells=INDEX_CELLS):
+    """Grid index over path samples for exact nearest-sample queries.
+
+    For every cell, 'candidates' lists each sample that can be the nearest
+    one for some spot in the cell: those within (distance from the cell
+    center to its nearest sample) + a cell diagonal of the center. Rows are
+    padded with -1.
+    """
+    points = samples['points']
+    low = points.min(axis=0)
+    size = np.maximum(points.max(axis=0) - low, 1e-9) / cells
+    xs = low[0] + (np.arange(cells) + 0.5) * size[0]
+    ys = low[1] + (np.arange(cells) + 0.5) * size[1]
+    gx, gy = np.meshgrid(xs, ys)
+    centers = np.column_stack([gx.ravel(), gy.ravel()])
+    diagonal = float(np.hypot(*size))
+
+    rows = []
+    for chunk in range(0, len(centers), 64):
+        block = centers[chunk:chunk + 64]
+        distances = np.hypot(block[:, None, 0] - points[None, :, 0],
+                             block[:, None, 1] - points[None, :, 1])
+        limit = distances.min(axis=1, keepdims=True) + diagonal + 1e-9
+        rows.extend(np.nonzero(row)[0] for row in distances <= limit)
+
+    candidates = np.full((len(rows), max(len(row) for row in rows)), -1, dtype=int)
+    for i, row in enumerate(rows):
+        candidates[i, :len(row)] = row
+    return {'low': low, 'cell_size': size, 'cells': cells, 'candidates': candidates}
+
+def snap_points(samples, index, query):
+    """Nearest path sample of every query point, in one vectorized pass.
+
+    Args:
+        query: (M, 2) array in the paths' coordinates
+
+    Returns:
+        (sample indices (M,), distances (M,))
+    """
+    points = samples['points']
+    query = np.asarray(query, dtype=float).reshape(-1, 2)
+    cells = index['cells']
+    cell = np.floor((query - index['low']) / index['cell_size']).astype(int)
+    inside = ((cell >= 0) & (cell < cells)).all(axis=1)
+
+    nearest = np.zeros(len(query), dtype=int)
+    distance = np.zeros(len(query))
+    if inside.any():
+        candidates = index['candidates'][cell[inside, 1] * cells + cell[inside, 0]]
+        d = np.hypot(points[candidates, 0] - query[inside, None, 0],
+                     points[candidates, 1] - query[inside, None, 1])
+        d[candidates < 0] = np.inf
+        best = np.argmin(d, axis=1)
+        rows = np.arange(len(best))
+        nearest[inside] = candidates[rows, best]
+        distance[inside] = d[rows, best]
+    if (~inside).any():
+        # Outside the grid: compare with every sample
+        d = np.hypot(points[None, :, 0] - query[~inside, None, 0],
+                     points[None, :, 1] - query[~inside, None, 1])
+        nearest[~inside] = np.argmin(d, axis=1)
+        distance[~inside] = d.min(axis=1)
+    return nearest, distance
+
+def prepare_svg_paths(svg_data):
+    """Samples and grid index of a parsed SVG, built once and kept on svg_data."""
+    if 'path_samples' not in svg_data:
+        samples = sample_svg_paths(svg_data['paths'])
+        svg_data['path_samples'] = samples
+        svg_data['path_index'] = build_path_index(samples) if samples else None
+    return svg_data['path_samples'], svg_data['path_index']
+
+def find_nearest_path_point(x, y, path_data, svg_viewbox=None):
+    """Find the nearest point on the SVG path to the given coordinates.
+
+    Args:
+        path_data: path string, list of path strings, or parse_svg_path()
+            output (whose samples are then reused between calls)
+
+    Returns:
+        (x, y, tangent angle in radians, distance), or the input point with
+        angle and distance None if the path draws nothing
+    """
+    if isinstance(path_data, dict):
+        svg_data = path_data
+    else:
+        svg_data = {'paths': [path_data] if isinstance(path_data, str) else list(path_data)}
+    samples, index = prepare_svg_paths(svg_data)
+    if samples is None:
+        return x, y, None, None
+    nearest, distance = snap_points(samples, index, [(x, y)])
+    px, py = samples['points'][nearest[0]]
+    return float(px), float(py), float(samples['angles'][nearest[0]]), float(distance[0])
+
+def snap_target(placement_data, svg_data):
+    """Path data to snap a placement's items to, and its name.
+
+    The placement's own centerlinePath runs along the middle of the strokes;
+    the SVG's paths are the letter's outline, so they are only the fallback
+    for exports without a centerline.
+
+    Returns:
+        (dict with 'paths' to pass to snap_items, 'centerline' or 'svg_paths')
+    """
+    centerline = placement_data.get('centerlinePath')
+    if isinstance(centerline, str) and centerline.strip():
+        target = {'paths': [centerline]}
+        samples, _ = prepare_svg_paths(target)
+        if samples is not None:
+            return target, 'centerline'
+    return svg_data, 'svg_paths'
+
+def _item_point(item):
+    """x/y of an item; the editor exports lines with x2/y2 as their end."""
+    if 'x' not in item and 'x2' in item:
+        return item['x2'], item['y2']
+    return item['x'], item['y']
+
+def snap_items(items, svg_data, max_distance=MAX_SNAP_DISTANCE):
+    """Snap every item position (line ends included) in one query.
+
+    Args:
+        max_distance: snaps farther than this fraction of the paths' longer
+            side are marked too far
 
-def process_placement_json(json_file, svg_file, output_file=None):
-    """Process the arrow/number placement JSON and generate Flutter-compatible data."""
+    Returns:
+        {(item index, point key): (x, y, angle, distance, too far)} where
+        point key is '' for x/y and '1' for x1/y1; empty if the SVG draws
+        nothing
+    """
+    samples, index = prepare_svg_paths(svg_data)
+    keys, query = [], []
+    for i, item in enumerate(items):
+        keys.append((i, ''))
+        query.append(_item_point(item))
+        if item['type'] == 'line':
+            keys.append((i, '1'))
+            query.append((item['x1'], item['y1']))
+    if samples is None or not query:
+        return {}
+    nearest, distance = snap_points(samples, index, query)
+    limit = max_distance * samples['extent']
+    return {key: (float(samples['points'][n, 0]), float(samples['points'][n, 1]),
+                  float(samples['angles'][n]), float(d), bool(d > limit))
+            for key, n, d in zip(keys, nearest, distance)}
+
+def _facing(tangent, angle):
+    """The tangent direction (tangent or tangent + pi) closest to angle."""
+    if np.cos(tangent - angle) < 0:
+        tangent += np.pi
+    return float(np.arctan2(np.sin(tangent), np.cos(tangent)))
+
+def _snap_fields(snap, suffix=''):
+    x, y, angle, distance, too_far = snap
+    return {
+        f'snapped_x{suffix}': x,
+        f'snapped_y{suffix}': y,
+        f'tangent_angle{suffix}': angle,
+        f'snap_distance{suffix}': distance,
+        f'snap_too_far{suffix}': too_far,
+    }
+
+def process_placement_json(json_file, svg_file, output_file=None, snap=False,
+                           svg_data=None, quiet=False, max_snap=MAX_SNAP_DISTANCE):
+    """Process the arrow/number placement JSON and generate Flutter-compatible data.
+
+    With snap, arrows and lines are moved onto the nearest point of the
+    placement's centerlinePath, or of the SVG's paths without one (arrows
+    also take the path's direction there), unless that point is more than
+    max_snap of the path's longer side away. Number labels, and everything
+    without snap, keep their position; the snapped point is only reported
+    next to the placed one. svg_data is parse_svg_path() output to
+    reuse (its samples are kept on it); quiet skips the progress prints.
+    """
     
     # Load placement JSON
     with open(json_file, 'r', encoding='utf-8') as f:
         placement_data = json.load(f)
     
     # Parse SVG
-    svg_data = parse_svg_path(svg_file)
+    if svg_data is None:
+        svg_data = parse_svg_path(svg_file)
     if not svg_data:
         print("Failed to parse SVG file")
         return None
     
+    # Snap every item in one query against the centerline (or the SVG's paths)
+    items = placement_data.get('items', [])
+    target, target_name = snap_target(placement_data, svg_data)
+    snaps = snap_items(items, target, max_snap)
+    
     # Group items by stroke number (for numbers) and type
     arrows = []
     lines = []
     numbers_by_stroke = {}
     
-    for item in placement_data.get('items', []):
-        x, y = item['x'], item['y']
+    for item_index, item in enumerate(items):
+        # Hand-placed values stay in original_*; x/y/angle get the snapped ones
+        original_x, original_y = _item_point(item)
+        original_angle = item.get('angle', 0)
+        x, y, angle = original_x, original_y, original_angle
+        if item['type'] == 'line':
+            original_x1, original_y1 = item['x1'], item['y1']
+            x1, y1 = original_x1, original_y1
+        item_snap = snaps.get((item_index, ''))
+        if item_snap and item['type'] == 'arrow':
+            # Point the tangent the way the arrow was placed
+            item_snap = item_snap[:2] + (_facing(item_snap[2], original_angle),) + item_snap[3:]
+        line_snap = snaps.get((item_index, '1'))
+        # Labels sit beside the stroke on purpose; far snaps are likely wrong
+        movable = (item['type'] != 'number' and item_snap is not None and not item_snap[4]
+                   and not (line_snap and line_snap[4]))
+        if snap and movable:
+            x, y = item_snap[0], item_snap[1]
+            if item['type'] == 'arrow':
+                angle = item_snap[2]
+            if line_snap:
+                x1, y1 = line_snap[0], line_snap[1]
+                angle = float(np.arctan2(y - y1, x - x1))
         
         # Normalize coordinates
         target_x, target_y, norm_x, norm_y = normalize_coordinates(
@@ -110,13 +382,14 @@ def process_placement_json(json_file, svg_file, output_file=None):
                 'y': target_y,
                 'normalized_x': norm_x,
                 'normalized_y': norm_y,
-                'original_x': x,
-                'original_y': y,
-                'angle': item.get('angle', 0),
-                'arrowType': item.get('arrowType', 'triangle')
+                'original_x': original_x,
+                'original_y': original_y,
+                'angle': angle,
+                'original_angle': original_angle,
+                'arrowType': item.get('arrowType', 'triangle'),
+                **(_snap_fields(item_snap) if item_snap else {})
             })
         elif item['type'] == 'line':
-            x1, y1 = item['x1'], item['y1']
             target_x1, target_y1, norm_x1, norm_y1 = normalize_coordinates(
                 x1, y1,
                 placement_data.get('svgViewBox', {}).get('viewBox', '0 0 200 200') or '0 0 200 200',
@@ -131,12 +404,15 @@ def process_placement_json(json_file, svg_file, output_file=None):
                 'normalized_y1': norm_y1,
                 'normalized_x2': norm_x,
                 'normalized_y2': norm_y,
-                'original_x1': x1,
-                'original_y1': y1,
-                'original_x2': x,
-                'original_y2': y,
-                'angle': item.get('angle', 0),
-                'arrowType': item.get('arrowType', 'triangle')
+                'original_x1': original_x1,
+                'original_y1': original_y1,
+                'original_x2': original_x,
+                'original_y2': original_y,
+                'angle': angle,
+                'original_angle': original_angle,
+                'arrowType': item.get('arrowType', 'triangle'),
+                **(_snap_fields(line_snap, '1') if line_snap else {}),
+                **(_snap_fields(item_snap, '2') if item_snap else {})
             })
         elif item['type'] == 'number':
             stroke_num = item.get('strokeNumber', 1)
@@ -148,9 +424,10 @@ def process_placement_json(json_file, svg_file, output_file=None):
                 'y': target_y,
                 'normalized_x': norm_x,
                 'normalized_y': norm_y,
-                'original_x': x,
-                'original_y': y,
-                'strokeNumber': stroke_num
+                'original_x': original_x,
+                'original_y': original_y,
+                'strokeNumber': stroke_num,
+                **(_snap_fields(item_snap) if item_snap else {})
             })
     
     # Generate output structure
@@ -164,7 +441,15 @@ def process_placement_json(json_file, svg_file, output_file=None):
             'total_arrows': len(arrows),
             'total_lines': len(lines),
             'total_numbers': sum(len(nums) for nums in numbers_by_stroke.values()),
-            'strokes_with_numbers': list(numbers_by_stroke.keys())
+            'strokes_with_numbers': list(numbers_by_stroke.keys()),
+            'snapped': bool(snap and snaps),
+            'max_snap': max_snap,
+            'snap_target': target_name,
+            # Arrows and lines only: numbers are never moved
+            'max_snap_distance': max((v[3] for (i, _), v in snaps.items()
+                                      if items[i]['type'] != 'number'), default=None),
+            'snaps_too_far': sum(1 for (i, _), v in snaps.items()
+                                 if v[4] and items[i]['type'] != 'number')
         }
     }
     
@@ -172,8 +457,9 @@ def process_placement_json(json_file, svg_file, output_file=None):
     if output_file:
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(output, f, indent=2)
-        print(f"Output written to: {output_file}")
-    else:
+        if not quiet:
+            print(f"Output written to: {output_file}")
+    elif not quiet:
         # Print to stdout
         print(json.dumps(output, indent=2))
     
@@ -223,11 +509,186 @@ class {letter_name.capitalize()}ArrowNumbers {{
     
     return dart_code
 
+def letter_key(file_path, suffixes):
+    """Letter name of a file: its stem without one of the known suffixes."""
+    stem = Path(file_path).stem
+    for suffix in suffixes:
+        if stem.endswith(suffix) and len(stem) > len(suffix):
+            return stem[:-len(suffix)]
+    return stem
+
+def is_placement_file(json_file):
+    """True for editor exports (a JSON object with an 'items' list)."""
+    try:
+        with open(json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return isinstance(data, dict) and isinstance(data.get('items'), list)
+
+def match_batch(placement_dir, svg_dir):
+    """Pair placement exports with SVGs by letter name.
+
+    Letters with more than one placement file are left out of the groups
+    and returned as conflicts, since their outputs would overwrite each
+    other.
+
+    Returns:
+        ({svg_file: [(letter, placement_file), ...]}, placements without an
+        SVG, number of other JSON files skipped,
+        {letter: [placement files]} of conflicting letters)
+    """
+    svgs = {}
+    for svg_file in sorted(Path(svg_dir).glob('*.svg')):
+        svgs.setdefault(letter_key(svg_file, SVG_SUFFIXES), svg_file)
+
+    by_letter = {}
+    skipped = 0
+    for json_file in sorted(Path(placement_dir).glob('*.json')):
+        if not is_placement_file(json_file):
+            skipped += 1
+            continue
+        by_letter.setdefault(letter_key(json_file, PLACEMENT_SUFFIXES), []).append(json_file)
+
+    groups = {}
+    unmatched = []
+    conflicts = {}
+    for letter, json_files in sorted(by_letter.items()):
+        if len(json_files) > 1:
+            conflicts[letter] = json_files
+        elif letter in svgs:
+            groups.setdefault(svgs[letter], []).append((letter, json_files[0]))
+        else:
+            unmatched.append(json_files[0])
+    return groups, unmatched, skipped, conflicts
+
+def process_svg_group(svg_file, placements, output_dir, snap=False, max_snap=MAX_SNAP_DISTANCE):
+    """Process every placement file of one SVG, parsing and sampling it once.
+
+    Returns:
+        list of summary dicts, one per placement file
+    """
+    svg_data = parse_svg_path(svg_file)
+    results = []
+    for letter, json_file in placements:
+        result = {'letter': letter, 'placement_file': str(json_file), 'svg_file': str(svg_file)}
+        output_json = Path(output_dir) / f'{letter}_arrow_numbers.json'
+        output_dart = Path(output_dir) / f'{letter}_arrow_numbers.dart'
+        try:
+            output_data = process_placement_json(json_file, svg_file, output_json, snap,
+                                                 svg_data=svg_data, quiet=True, max_snap=max_snap)
+            if output_data is None:
+                raise ValueError('could not parse the SVG')
+            with open(output_dart, 'w', encoding='utf-8') as f:
+                f.write(generate_dart_code(output_data, letter))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            result['error'] = str(e)
+            results.append(result)
+            continue
+        metadata = output_data['metadata']
+        result.update({
+            'output_json': str(output_json),
+            'output_dart': str(output_dart),
+            'arrows': metadata['total_arrows'],
+            'lines': metadata['total_lines'],
+            'numbers': metadata['total_numbers'],
+            'max_snap_distance': metadata['max_snap_distance'],
+            'snaps_too_far': metadata['snaps_too_far'],
+            'error': None,
+        })
+        results.append(result)
+    return results
+
+def run_batch(placement_dir, svg_dir, output_dir, snap=False, jobs=None,
+              max_snap=MAX_SNAP_DISTANCE):
+    """Process a folder of placement exports; returns the summary dict."""
+    groups, unmatched, skipped, conflicts = match_batch(placement_dir, svg_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    svg_files = list(groups)
+    args = [svg_files, [groups[s] for s in svg_files],
+            [output_dir] * len(svg_files), [snap] * len(svg_files),
+            [max_snap] * len(svg_files)]
+    if len(svg_files) <= 1 or jobs == 1:
+        batches = list(map(process_svg_group, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            batches = list(pool.map(process_svg_group, *args))
+
+    results = sorted((r for batch in batches for r in batch), key=lambda r: r['letter'])
+    summary = {
+        'placement_dir': str(placement_dir),
+        'svg_dir': str(svg_dir),
+        'snapped': snap,
+        'max_snap': max_snap,
+        'processed': sum(1 for r in results if not r['error']),
+        'failed': sum(1 for r in results if r['error']),
+        'unmatched_placements': [str(p) for p in unmatched],
+        'conflicts': {letter: [str(p) for p in files] for letter, files in conflicts.items()},
+        'skipped_json_files': skipped,
+        'letters': results,
+    }
+    with open(Path(output_dir) / 'batch_summary.json', 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+def print_batch_summary(summary, output_dir):
+    print(f"\n{'letter':<16}{'arrows':>7}{'lines':>7}{'numbers':>9}{'max snap':>10}{'too far':>9}")
+    for result in summary['letters']:
+        if result['error']:
+            print(f"  ✗ {result['letter']}: {result['error']}")
+            continue
+        snap = result['max_snap_distance']
+        print(f"{result['letter']:<16}{result['arrows']:>7}{result['lines']:>7}{result['numbers']:>9}"
+              f"{'-' if snap is None else f'{snap:.1f}':>10}{result['snaps_too_far']:>9}")
+    for placement in summary['unmatched_placements']:
+        print(f"  ✗ No SVG for {placement}")
+    for letter, files in summary['conflicts'].items():
+        print(f"  ✗ {letter}: {len(files)} placement files would write the same outputs, "
+              f"none processed: {', '.join(Path(f).name for f in files)}")
+    print(f"\n✓ Processed {summary['processed']}/{summary['processed'] + summary['failed']} "
+          f"placement file(s) into {output_dir}")
+    print(f"  Summary: {Path(output_dir) / 'batch_summary.json'}")
+
+def batch_main(argv, snap, max_snap):
+    jobs = pop_int_option(argv, '--jobs')
+    if len(argv) < 5:
+        print("Usage: python process_arrow_numbers.py batch <placement_dir> <svg_dir> <output_dir> [--jobs N] [--snap] [--max-snap F]")
+        print("\nExample:")
+        print("  python process_arrow_numbers.py batch ../../lib/assets/phontics_assets_points/telugu_phontics ../svg_generator/output out --snap")
+        sys.exit(1)
+
+    placement_dir, svg_dir, output_dir = Path(argv[2]), Path(argv[3]), Path(argv[4])
+    for folder in (placement_dir, svg_dir):
+        if not folder.is_dir():
+            print(f"Error: Folder not found: {folder}")
+            sys.exit(1)
+
+    summary = run_batch(placement_dir, svg_dir, output_dir, snap, jobs, max_snap)
+    if not (summary['letters'] or summary['unmatched_placements'] or summary['conflicts']):
+        print(f"Error: No placement JSON files in {placement_dir}")
+        sys.exit(1)
+    print_batch_summary(summary, output_dir)
+    if summary['failed'] or summary['conflicts']:
+        sys.exit(1)
+
 def main():
+    # --snap: move arrows and lines onto the placement's centerlinePath (the
+    # SVG's outline paths when the export has none) instead of only
+    # reporting it; --max-snap: farthest move, fraction of the path's size
+    snap = pop_flag(sys.argv, '--snap')
+    max_snap = float(pop_option(sys.argv, '--max-snap', MAX_SNAP_DISTANCE))
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        batch_main(sys.argv, snap, max_snap)
+        return
     if len(sys.argv) < 3:
-        print("Usage: python process_arrow_numbers.py <placement_json> <svg_file> [output_json] [output_dart] [letter_name]")
+        print("Usage: python process_arrow_numbers.py <placement_json> <svg_file> [output_json] [output_dart] [letter_name] [--snap] [--max-snap F]")
+        print("       python process_arrow_numbers.py batch <placement_dir> <svg_dir> <output_dir> [--jobs N] [--snap] [--max-snap F]")
         print("\nExample:")
-        print("  python process_arrow_numbers.py placement.json letter.svg output.json output.dart ka")
+        print("  python process_arrow_numbers.py placement.json letter.svg output.json output.dart ka --snap")
+        print("\n--snap moves arrows and lines onto the placement's centerlinePath, or onto the")
+        print("SVG's outline paths when the export has no centerline; numbers stay put, and")
+        print(f"items farther than --max-snap (default {MAX_SNAP_DISTANCE:g} of the path's size) stay put")
         sys.exit(1)
     
     json_file = Path(sys.argv[1])
@@ -245,7 +706,7 @@ def main():
         sys.exit(1)
     
     # Process the data
-    output_data = process_placement_json(json_file, svg_file, output_json)
+    output_data = process_placement_json(json_file, svg_file, output_json, snap, max_snap=max_snap)
     
     if output_data and output_dart:
         dart_code = generate_dart_code(output_data, letter_name)
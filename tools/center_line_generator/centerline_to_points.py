@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+centerline_to_points.py - Build *_PointsInfo.json files from custom_positions
+
+Every `<name>_custom_positions.json` exported by the arrow number editor
+already carries the letter's `svgPath`, its `svgBounds` and the stroke
+centerline drawn in centerline_editor.html (`centerlinePath`, one `M` per
+stroke). The `<name>_big_PointsInfo.json` / `<name>_small_PointsInfo.json`
+files the app loads hold the same strokes in 0..1 space, and were made by
+hand. This script regenerates both from the centerline:
+
+  1. flatten   every segment of centerlinePath becomes a polyline; curves
+               (C/S/Q/T) are split into just enough pieces to stay within
+               --tolerance of the true curve, all segments of a file in one
+               vectorized NumPy pass (lines stay single pieces)
+  2. resample  each stroke gets evenly spaced points by arc length,
+               --spacing apart (a fraction of the letter's longer side);
+               --spacing 0 keeps the drawn points as they are
+  3. normalize points map into svgBounds exactly like json_generator.html
+               ((x - bounds.x) / bounds.width, clamped to 0..1, 4 decimals)
+
+For Telugu and Hindi the big and small shapes are the same path, so both
+files get the same points.
+
+Usage:
+  python3 tools/center_line_generator/centerline_to_points.py telugu
+  python3 tools/center_line_generator/centerline_to_points.py all --spacing 0.03
+  python3 tools/center_line_generator/centerline_to_points.py path/to/ka_custom_positions.json [output_dir]
+
+The first argument is a script (telugu, hindi, all), a folder of
+*_custom_positions.json files or one such file. Point files are written
+next to their custom_positions file unless an output_dir is given (one
+subfolder per asset folder, e.g. output_dir/telugu_phontics, so letters of
+different scripts with the same name never overwrite each other).
+
+Options:
+  --spacing F     distance between points as a fraction of the letter's
+                  longer side (default 0.035); 0 keeps the drawn points
+  --tolerance F   max distance of a flattened curve from the true curve,
+                  in SVG units (default 0.5)
+
+Dependencies: numpy
+"""
+
+import os
+import sys
+import json
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SVG_GENERATOR_DIR = SCRIPT_DIR.parent / "svg_generator"
+for path in (SCRIPT_DIR, SVG_GENERATOR_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from cli_options import pop_option
+from extract_centerline import DEFAULT_SPACING, points_info, resample_polyline
+from path_ir import (ARC, ARG_COUNTS, CLOSE, CUBIC, HLINE, LINE, MOVE, QUAD,
+                     SMOOTH_CUBIC, SMOOTH_QUAD, VLINE, parse_path, path_bounds)
+
+
+ASSETS_DIR = SCRIPT_DIR.parent.parent / "lib" / "assets" / "phontics_assets_points"
+SCRIPT_DIRS = {
+    "telugu": ASSETS_DIR / "telugu_phontics",
+    "hindi": ASSETS_DIR / "hindi_phontics",
+}
+CUSTOM_POSITIONS_SUFFIX = "_custom_positions.json"
+
+DEFAULT_TOLERANCE = 0.5
+
+# Upper bound on pieces per curve segment
+MAX_CURVE_PIECES = 64
+
+
+def path_segments(path_d):
+    """Every drawing segment of a path as a cubic, grouped by stroke.
+
+    Lines become cubics with their control points on the line and are
+    marked as straight; quadratics are degree-elevated exactly.
+
+    Returns:
+        (starts, controls, straight, stroke_ids) where starts is (K, 2) with
+        each stroke's first point, controls is (S, 4, 2) cubic control
+        points, straight is (S,) bool and stroke_ids is (S,) int (index into
+        starts) -- or None if the path draws nothing
+    """
+    ir = parse_path(path_d)
+    coords = ir.coords
+    starts, controls, straight, stroke_ids = [], [], [], []
+    cur = start = (0.0, 0.0)
+    last = (None, None)
+    i = 0
+
+    def add(p0, p1, p2, p3, is_line):
+        controls.append((p0, p1, p2, p3))
+        straight.append(is_line)
+        stroke_ids.append(len(starts) - 1)
+
+    for code in ir.commands:
+        args = coords[i:i + ARG_COUNTS[code]]
+        i += ARG_COUNTS[code]
+        ctrl = None
+        if code == MOVE:
+            cur = start = (args[0], args[1])
+            starts.append(cur)
+        else:
+            if not starts:
+                starts.append(cur)
+            if code in (LINE, HLINE, VLINE, ARC, CLOSE):
+                if code == HLINE:
+                    end = (args[0], cur[1])
+                elif code == VLINE:
+                    end = (cur[0], args[0])
+                elif code == CLOSE:
+                    end = start
+                else:
+                    # Arcs are not drawn by the editor; their chord is used
+                    end = (args[-2], args[-1])
+                if end != cur or code != CLOSE:
+                    add(cur, _lerp(cur, end, 1 / 3), _lerp(cur, end, 2 / 3), end, True)
+                cur = end
+            elif code in (QUAD, SMOOTH_QUAD):
+                ctrl = (args[0], args[1]) if code == QUAD else _reflect(last, cur, (QUAD, SMOOTH_QUAD))
+                end = (args[-2], args[-1])
+                add(cur, _lerp(cur, ctrl, 2 / 3), _lerp(end, ctrl, 2 / 3), end, False)
+                cur = end
+            elif code in (CUBIC, SMOOTH_CUBIC):
+                if code == CUBIC:
+                    c1, ctrl = (args[0], args[1]), (args[2], args[3])
+                else:
+                    c1, ctrl = _reflect(last, cur, (CUBIC, SMOOTH_CUBIC)), (args[0], args[1])
+                end = (args[-2], args[-1])
+                add(cur, c1, ctrl, end, False)
+                cur = end
+        last = (code, ctrl)
+
+    if not starts:
+        return None
+    return (np.array(starts, dtype=float), np.array(controls, dtype=float).reshape(-1, 4, 2),
+            np.array(straight, dtype=bool), np.array(stroke_ids, dtype=int))
+
+
+def _lerp(a, b, t):
+    return (a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t)
+
+
+def _reflect(last, cur, smooth_of):
+    """First control point of a smooth (S/T) segment."""
+    code, ctrl = last
+    if ctrl is None or code not in smooth_of:
+        return cur
+    return (2 * cur[0] - ctrl[0], 2 * cur[1] - ctrl[1])
+
+
+def curve_pieces(controls, straight, tolerance):
+    """Pieces per cubic so the flattened polyline stays within tolerance.
+
+    Uses the standard bound for uniform subdivision of a cubic:
+    n = sqrt(3/4 * max(|p0 - 2p1 + p2|, |p1 - 2p2 + p3|) / tolerance).
+    """
+    p0, p1, p2, p3 = (controls[:, k] for k in range(4))
+    bend = np.maximum(np.hypot(*(p0 - 2 * p1 + p2).T), np.hypot(*(p1 - 2 * p2 + p3).T))
+    pieces = np.ceil(np.sqrt(0.75 * bend / max(tolerance, 1e-9)))
+    pieces = np.clip(pieces, 1, MAX_CURVE_PIECES).astype(int)
+    pieces[straight] = 1
+    return pieces
+
+
+def flatten_strokes(path_d, tolerance=DEFAULT_TOLERANCE):
+    """Polyline of every stroke (subpath) of a centerline path.
+
+    Returns:
+        list of (N, 2) arrays in SVG coordinates
+    """
+    segments = path_segments(path_d)
+    if segments is None:
+        return []
+    starts, controls, straight, stroke_ids = segments
+    if not len(controls):
+        return []
+
+    # Evaluate every piece end of every segment in one go
+    pieces = curve_pieces(controls, straight, tolerance)
+    segment_of = np.repeat(np.arange(len(controls)), pieces)
+    first_piece = np.repeat(np.cumsum(pieces) - pieces, pieces)
+    t = ((np.arange(len(segment_of)) - first_piece + 1) / pieces[segment_of])[:, None]
+    c = controls[segment_of]
+    points = ((1 - t) ** 3 * c[:, 0] + 3 * (1 - t) ** 2 * t * c[:, 1]
+              + 3 * (1 - t) * t ** 2 * c[:, 2] + t ** 3 * c[:, 3])
+    point_stroke = stroke_ids[segment_of]
+
+    strokes = []
+    for stroke_id in np.unique(point_stroke):
+        stroke = np.vstack([starts[stroke_id], points[point_stroke == stroke_id]])
+        strokes.append(stroke)
+    return strokes
+
+
+def normalize_points(points, bounds):
+    """Map SVG points into 0..1 within bounds (x, y, width, height)."""
+    x, y, width, height = bounds
+    scale = np.array([width or 1.0, height or 1.0])
+    return np.clip((points - (x, y)) / scale, 0.0, 1.0)
+
+
+def letter_bounds(data):
+    """(x, y, width, height) of the letter: svgBounds, else the svgPath's."""
+    bounds = data.get("svgBounds") or {}
+    if bounds.get("width") and bounds.get("height"):
+        return bounds["x"], bounds["y"], bounds["width"], bounds["height"]
+    if data.get("svgPath"):
+        box = path_bounds(data["svgPath"])
+        if box:
+            return box[0], box[1], box[2] - box[0], box[3] - box[1]
+    return None
+
+
+def centerline_points(data, spacing=DEFAULT_SPACING, tolerance=DEFAULT_TOLERANCE):
+    """Normalized strokes of one custom_positions object.
+
+    Raises:
+        ValueError: if there is no centerline or no bounds to map it into
+    """
+    centerline = (data.get("centerlinePath") or "").strip()
+    if not centerline:
+        raise ValueError("no centerlinePath")
+    bounds = letter_bounds(data)
+    if bounds is None:
+        raise ValueError("no svgBounds or svgPath")
+
+    step = spacing * max(bounds[2], bounds[3])
+    strokes = []
+    for stroke in flatten_strokes(centerline, tolerance):
+        if step > 0 and len(stroke) > 1:
+            stroke = resample_polyline(stroke, step)
+        strokes.append(normalize_points(stroke, bounds))
+    if not strokes:
+        raise ValueError("centerlinePath draws no strokes")
+    return strokes
+
+
+def convert_file(custom_positions_file, output_dir=None, spacing=DEFAULT_SPACING,
+                 tolerance=DEFAULT_TOLERANCE):
+    """Write the big and small PointsInfo files for one custom_positions file.
+
+    Returns:
+        (name, [written files], message)
+    """
+    name = os.path.basename(custom_positions_file)[:-len(CUSTOM_POSITIONS_SUFFIX)]
+    try:
+        with open(custom_positions_file, "r", encoding="utf-8") as f:
+            strokes = centerline_points(json.load(f), spacing, tolerance)
+    except (OSError, ValueError) as e:
+        return name, [], str(e)
+
+    output_dir = output_dir or os.path.dirname(custom_positions_file)
+    os.makedirs(output_dir, exist_ok=True)
+    info = points_info(strokes)
+    written = []
+    for size in ("big", "small"):
+        output_file = os.path.join(output_dir, f"{name}_{size}_PointsInfo.json")
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(info, f, indent=2)
+        written.append(output_file)
+    counts = "+".join(str(len(stroke)) for stroke in strokes)
+    return name, written, f"{len(strokes)} stroke(s), {counts} points"
+
+
+def custom_positions_files(target):
+    """(group name, file) pairs for a script name, 'all', a folder or a single file."""
+    if target.lower() == "all":
+        return [pair for key in SCRIPT_DIRS for pair in custom_positions_files(key)]
+    folder = SCRIPT_DIRS.get(target.lower())
+    if folder is None and os.path.isfile(target):
+        return [(os.path.basename(os.path.dirname(os.path.abspath(target))), target)]
+    folder = Path(folder or target)
+    if not folder.is_dir():
+        return []
+    return [(folder.name, str(p)) for p in sorted(folder.glob(f"*{CUSTOM_POSITIONS_SUFFIX}"))]
+
+
+def main():
+    argv = sys.argv
+    spacing = float(pop_option(argv, "--spacing", DEFAULT_SPACING))
+    tolerance = float(pop_option(argv, "--tolerance", DEFAULT_TOLERANCE))
+
+    if len(argv) < 2:
+        print("Usage: python3 centerline_to_points.py <telugu|hindi|all|folder|file> [output_dir]"
+              " [--spacing F] [--tolerance F]")
+        print("Example: python3 centerline_to_points.py telugu --spacing 0.03")
+        sys.exit(1)
+
+    files = custom_positions_files(argv[1])
+    output_dir = argv[2] if len(argv) > 2 else None
+    if not files:
+        print(f"Error: No *{CUSTOM_POSITIONS_SUFFIX} files for '{argv[1]}'")
+        sys.exit(1)
+
+    print(f"Converting {len(files)} centerline(s)"
+          + (f" (spacing {spacing:g}, tolerance {tolerance:g})" if spacing else " (drawn points kept)")
+          + "...")
+    converted = skipped = 0
+    for group, custom_positions_file in files:
+        group_dir = os.path.join(output_dir, group) if output_dir else None
+        name, written, message = convert_file(custom_positions_file, group_dir, spacing, tolerance)
+        if written:
+            print(f"  ✓ {group}/{name}: {message}")
+            converted += 1
+        else:
+            print(f"  ✗ {group}/{name}: {message}")
+            skipped += 1
+
+    print(f"\n✓ Wrote big/small PointsInfo for {converted} letter(s)"
+          + (f" into {output_dir}" if output_dir else "")
+          + (f"; {skipped} skipped" if skipped else ""))
+    if not converted:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
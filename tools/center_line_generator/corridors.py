@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+corridors.py - Tolerance corridors around PointsInfo strokes
+
+Whether a trace is "on the letter" is decided by measuring the pointer's
+distance to stroke points against a radius. This script works that out
+ahead of time: for every stroke of a PointsInfo file and every tolerance
+level it builds the corridor (all spots within the tolerance of the stroke
+polyline) as simplified polygons and as an occupancy bitmap, and writes
+them next to the file as `<name>_Corridors.json`. On device a pointer
+sample then needs one point-in-polygon or one bitmap test.
+
+How a corridor is built:
+
+  1. distance field: distance from every node of a grid (--resolution
+     steps across 0..1, padded so every corridor fits) to the stroke
+     polyline, measured in the letter's real proportions (svgBounds of the
+     sibling custom_positions file, as in resample_points.py)
+  2. contour: marching squares on tolerance - distance gives closed rings
+     (a stroke that loops back gives an outer ring and a hole)
+  3. simplify: Douglas-Peucker on each ring (--simplify)
+  4. bitmap: a cell of the --bitmap-size grid is set if its center is
+     within the tolerance
+
+Tolerances and --simplify are fractions of the letter's longer side.
+
+  {
+    "tolerances": [0.04, 0.08, 0.12],
+    "bounds": [x0, y0, x1, y1],         0..1 area the bitmaps cover
+    "bitmapSize": 64,
+    "strokes": [                         in PointsInfo order
+      {"levels": [                       one per tolerance
+        {"polygons": [["x,y", ...], ...],
+         "bitmap": "<base64>"}
+      ]}
+    ]
+  }
+
+Rings are in the 0..1 space of the PointsInfo file, not closed by a repeated
+point; use the even-odd rule over all rings of a level. A bitmap is
+bitmapSize x bitmapSize bits, row-major from the top-left of bounds, 8 bits
+per byte with the leftmost cell in the high bit. The cell of (x, y) is
+column floor((x - x0) / (x1 - x0) * bitmapSize), row likewise with y.
+
+Usage:
+  python3 tools/center_line_generator/corridors.py build telugu
+  python3 tools/center_line_generator/corridors.py build all --tolerances 0.05,0.1
+  python3 tools/center_line_generator/corridors.py verify hindi
+  python3 tools/center_line_generator/corridors.py report path/to/ka_big_PointsInfo.json
+
+  build    write the _Corridors.json files and print the report
+  verify   check every _Corridors.json is current with its PointsInfo file
+  report   polygon sizes and how often the polygon and bitmap tests agree
+           with the exact distance test, per asset folder (writes nothing)
+
+The target is a script (telugu, hindi, arabic, english, english_upper,
+numbers, math_shapes or all), a folder or one PointsInfo file.
+
+Options:
+  --tolerances A,B,...  corridor half-widths (default 0.04,0.08,0.12)
+  --resolution N        distance-field steps across 0..1 (default 128)
+  --bitmap-size N       bitmap cells per side (default 64)
+  --simplify F          Douglas-Peucker tolerance (default 0.003)
+
+Dependencies: numpy
+"""
+
+import os
+import sys
+import json
+import base64
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SVG_GENERATOR_DIR = SCRIPT_DIR.parent / "svg_generator"
+for path in (SCRIPT_DIR, SVG_GENERATOR_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from cli_options import pop_int_option, pop_option
+from resample_points import POINTS_SUFFIX, letter_aspect, points_files
+from points_binary import json_strokes
+
+
+CORRIDORS_SUFFIX = "_Corridors.json"
+DEFAULT_TOLERANCES = (0.04, 0.08, 0.12)
+DEFAULT_RESOLUTION = 128
+DEFAULT_BITMAP_SIZE = 64
+DEFAULT_SIMPLIFY = 0.003
+
+# Extra grid steps around the widest corridor, so every contour closes
+PAD_STEPS = 2
+
+# Random samples per file for the report (fixed seed, so runs repeat)
+CHECK_SAMPLES = 400
+CHECK_SEED = 1
+
+# Marching squares: corner bits tl=8, tr=4, br=2, bl=1 -> pairs of cell
+# edges the contour joins. Saddles (5, 10) are resolved by the center value.
+CASE_EDGES = {
+    1: (("left", "bottom"),), 2: (("bottom", "right"),), 3: (("left", "right"),),
+    4: (("top", "right"),), 6: (("top", "bottom"),), 7: (("left", "top"),),
+    8: (("left", "top"),), 9: (("top", "bottom"),), 11: (("top", "right"),),
+    12: (("left", "right"),), 13: (("bottom", "right"),), 14: (("left", "bottom"),),
+}
+SADDLE_EDGES = {
+    # case: (center inside, center outside)
+    5: ((("left", "top"), ("bottom", "right")), (("top", "right"), ("left", "bottom"))),
+    10: ((("top", "right"), ("left", "bottom")), (("left", "top"), ("bottom", "right"))),
+}
+
+
+def polyline_distances(stroke, spots, aspect):
+    """Distance from every spot to a polyline.
+
+    Args:
+        stroke: (N, 2) array in 0..1
+        spots: (M, 2) array in 0..1
+        aspect: (width, height) scale of the 0..1 space
+
+    Returns:
+        (M,) array, in units of the letter's longer side
+    """
+    scale = np.asarray(aspect, dtype=float)
+    points = np.asarray(stroke, dtype=float).reshape(-1, 2) * scale
+    spots = np.asarray(spots, dtype=float).reshape(-1, 2) * scale
+
+    if len(points) == 1:
+        return np.hypot(*(spots - points[0]).T)
+    best = np.full(len(spots), np.inf)
+    for a, b in zip(points[:-1], points[1:]):
+        d = b - a
+        length_sq = d @ d
+        rel = spots - a
+        t = np.zeros(len(spots)) if length_sq == 0 else np.clip(rel @ d / length_sq, 0.0, 1.0)
+        np.minimum(best, np.hypot(rel[:, 0] - t * d[0], rel[:, 1] - t * d[1]), out=best)
+    return best
+
+
+def distance_field(stroke, xs, ys, aspect):
+    """polyline_distances for every (ys[i], xs[j]) grid node, as a (len(ys), len(xs)) array."""
+    gx, gy = np.meshgrid(xs, ys)
+    spots = np.stack([gx.ravel(), gy.ravel()], axis=1)
+    return polyline_distances(stroke, spots, aspect).reshape(gx.shape)
+
+
+def _edge_key(i, j, side):
+    # Shared edges get the same key from both cells
+    if side == "top":
+        return ("h", i, j)
+    if side == "bottom":
+        return ("h", i + 1, j)
+    if side == "left":
+        return ("v", i, j)
+    return ("v", i, j + 1)
+
+
+def _edge_point(values, xs, ys, key):
+    kind, i, j = key
+    i2, j2 = (i, j + 1) if kind == "h" else (i + 1, j)
+    v0, v1 = values[i, j], values[i2, j2]
+    t = v0 / (v0 - v1)
+    return (xs[j] + t * (xs[j2] - xs[j]), ys[i] + t * (ys[i2] - ys[i]))
+
+
+def contour_rings(values, xs, ys):
+    """Closed rings around values > 0 (marching squares).
+
+    The border of values must be <= 0 so every ring closes.
+
+    Returns:
+        list of (N, 2) arrays in xs/ys coordinates
+    """
+    inside = values > 0
+    cases = (inside[:-1, :-1] * 8 + inside[:-1, 1:] * 4
+             + inside[1:, 1:] * 2 + inside[1:, :-1] * 1)
+
+    links = {}
+    for i, j in zip(*np.nonzero((cases > 0) & (cases < 15))):
+        case = int(cases[i, j])
+        if case in SADDLE_EDGES:
+            center = values[i:i + 2, j:j + 2].mean()
+            pairs = SADDLE_EDGES[case][0 if center > 0 else 1]
+        else:
+            pairs = CASE_EDGES[case]
+        for side_a, side_b in pairs:
+            a, b = _edge_key(i, j, side_a), _edge_key(i, j, side_b)
+            links.setdefault(a, []).append(b)
+            links.setdefault(b, []).append(a)
+
+    rings = []
+    while links:
+        start = next(iter(links))
+        ring = [start]
+        previous, current = None, start
+        while True:
+            options = links.pop(current)
+            following = options[0] if options[0] != previous or len(options) == 1 else options[1]
+            if following == start or following not in links:
+                break
+            ring.append(following)
+            previous, current = current, following
+        if len(ring) >= 3:
+            rings.append(np.array([_edge_point(values, xs, ys, key) for key in ring]))
+    return rings
+
+
+def _simplify_chain(points, epsilon, scale):
+    """Douglas-Peucker keep-mask of an open chain (ends always kept)."""
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    scaled = points * scale
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        a, b = scaled[first], scaled[last]
+        d = b - a
+        rel = scaled[first + 1:last] - a
+        length = np.hypot(*d)
+        if length == 0:
+            distances = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            distances = np.abs(rel[:, 0] * d[1] - rel[:, 1] * d[0]) / length
+        index = int(np.argmax(distances))
+        if distances[index] > epsilon:
+            split = first + 1 + index
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return keep
+
+
+def simplify_ring(ring, epsilon, aspect=(1.0, 1.0)):
+    """Douglas-Peucker of a closed ring; None if it collapses below 3 points."""
+    if epsilon <= 0 or len(ring) <= 3:
+        return ring
+    scale = np.asarray(aspect, dtype=float)
+    # Split the ring at the point farthest from its first point
+    far = int(np.argmax(np.hypot(*((ring - ring[0]) * scale).T)))
+    first = _simplify_chain(ring[:far + 1], epsilon, scale)
+    second = _simplify_chain(np.vstack([ring[far:], ring[:1]]), epsilon, scale)
+    keep = np.concatenate([first, second[1:-1]])
+    simplified = ring[keep]
+    return simplified if len(simplified) >= 3 else None
+
+
+def pack_mask(mask):
+    """Row-major bits of a boolean mask, leftmost cell in the high bit, as base64."""
+    return base64.b64encode(np.packbits(mask.astype(np.uint8), axis=None).tobytes()).decode("ascii")
+
+
+def unpack_mask(text, size):
+    bits = np.unpackbits(np.frombuffer(base64.b64decode(text), dtype=np.uint8))
+    return bits[:size * size].reshape(size, size).astype(bool)
+
+
+def corridor_bounds(strokes, tolerances, aspect, resolution):
+    """0..1 area covering 0..1, every stroke and the widest corridor."""
+    step = 1.0 / resolution
+    points = np.vstack([np.asarray(s, dtype=float).reshape(-1, 2) for s in strokes if len(s)]
+                       + [np.array([[0.0, 0.0], [1.0, 1.0]])])
+    margin_x = max(tolerances) / aspect[0] + PAD_STEPS * step
+    margin_y = max(tolerances) / aspect[1] + PAD_STEPS * step
+    low = np.floor((points.min(axis=0) - [margin_x, margin_y]) / step) * step
+    high = np.ceil((points.max(axis=0) + [margin_x, margin_y]) / step) * step
+    return float(low[0]), float(low[1]), float(high[0]), float(high[1])
+
+
+def format_ring(ring):
+    return [f"{x:.4f},{y:.4f}" for x, y in ring]
+
+
+def build_corridors(strokes, aspect=(1.0, 1.0), tolerances=DEFAULT_TOLERANCES,
+                    resolution=DEFAULT_RESOLUTION, bitmap_size=DEFAULT_BITMAP_SIZE,
+                    simplify=DEFAULT_SIMPLIFY):
+    """Corridor data of one letter, as written to JSON.
+
+    Args:
+        strokes: lists of (x, y) in 0..1
+    """
+    x0, y0, x1, y1 = corridor_bounds(strokes, tolerances, aspect, resolution)
+    step = 1.0 / resolution
+    xs = np.arange(int(round((x1 - x0) / step)) + 1) * step + x0
+    ys = np.arange(int(round((y1 - y0) / step)) + 1) * step + y0
+    cell_x = x0 + (np.arange(bitmap_size) + 0.5) * (x1 - x0) / bitmap_size
+    cell_y = y0 + (np.arange(bitmap_size) + 0.5) * (y1 - y0) / bitmap_size
+
+    result = []
+    for stroke in strokes:
+        if not len(stroke):
+            result.append({"levels": [{"polygons": [], "bitmap": pack_mask(
+                np.zeros((bitmap_size, bitmap_size), dtype=bool))} for _ in tolerances]})
+            continue
+        field = distance_field(stroke, xs, ys, aspect)
+        cells = distance_field(stroke, cell_x, cell_y, aspect)
+        levels = []
+        for tolerance in tolerances:
+            rings = [simplify_ring(ring, simplify, aspect)
+                     for ring in contour_rings(tolerance - field, xs, ys)]
+            levels.append({
+                "polygons": [format_ring(ring) for ring in rings if ring is not None],
+                "bitmap": pack_mask(cells <= tolerance),
+            })
+        result.append({"levels": levels})
+
+    return {
+        "tolerances": [float(t) for t in tolerances],
+        "bounds": [round(v, 6) for v in (x0, y0, x1, y1)],
+        "bitmapSize": bitmap_size,
+        "strokes": result,
+    }
+
+
+def point_in_rings(rings, x, y):
+    """Even-odd point-in-polygon over all rings (each an (N, 2) array)."""
+    inside = False
+    for ring in rings:
+        ax, ay = ring[:, 0], ring[:, 1]
+        bx, by = np.roll(ax, -1), np.roll(ay, -1)
+        crosses = (ay > y) != (by > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            at_x = ax + (y - ay) * (bx - ax) / (by - ay)
+        inside ^= bool(np.count_nonzero(crosses & (x < at_x)) % 2)
+    return inside
+
+
+def bitmap_hit(corridors, mask, x, y):
+    x0, y0, x1, y1 = corridors["bounds"]
+    size = corridors["bitmapSize"]
+    column = int(np.floor((x - x0) / (x1 - x0) * size))
+    row = int(np.floor((y - y0) / (y1 - y0) * size))
+    return 0 <= column < size and 0 <= row < size and bool(mask[row, column])
+
+
+def check_samples(corridors, strokes, aspect, samples=CHECK_SAMPLES):
+    """How often the polygon and bitmap tests agree with the exact distance test.
+
+    Samples are random spots around the strokes, for every stroke and level.
+
+    Returns:
+        (polygon agreement, bitmap agreement) as fractions
+    """
+    rng = np.random.default_rng(CHECK_SEED)
+    size = corridors["bitmapSize"]
+    agree = [0, 0]
+    total = 0
+    for stroke, data in zip(strokes, corridors["strokes"]):
+        if not len(stroke):
+            continue
+        stroke = np.asarray(stroke, dtype=float).reshape(-1, 2)
+        for tolerance, level in zip(corridors["tolerances"], data["levels"]):
+            rings = [np.array([[float(v) for v in p.split(",")] for p in ring])
+                     for ring in level["polygons"]]
+            mask = unpack_mask(level["bitmap"], size)
+            spread = np.array([2 * tolerance / aspect[0], 2 * tolerance / aspect[1]])
+            spots = (stroke[rng.integers(len(stroke), size=samples)]
+                     + rng.uniform(-1, 1, size=(samples, 2)) * spread)
+            exact = polyline_distances(stroke, spots, aspect) <= tolerance
+            agree[0] += sum(point_in_rings(rings, x, y) == e for (x, y), e in zip(spots, exact))
+            agree[1] += sum(bitmap_hit(corridors, mask, x, y) == e
+                            for (x, y), e in zip(spots, exact))
+            total += samples
+    if not total:
+        return 1.0, 1.0
+    return agree[0] / total, agree[1] / total
+
+
+def corridors_path(points_file):
+    return points_file[:-len(POINTS_SUFFIX)] + CORRIDORS_SUFFIX
+
+
+def _letter(points_file):
+    with open(points_file, "r", encoding="utf-8") as f:
+        return json_strokes(f.read()), letter_aspect(points_file)
+
+
+def _vertex_count(corridors):
+    return sum(len(ring) for stroke in corridors["strokes"]
+               for level in stroke["levels"] for ring in level["polygons"])
+
+
+def build_file(points_file, options):
+    """Write one _Corridors.json.
+
+    Returns:
+        (error or None, report row values)
+    """
+    strokes, aspect = _letter(points_file)
+    corridors = build_corridors(strokes, aspect, **options)
+    with open(corridors_path(points_file), "w", encoding="utf-8") as f:
+        json.dump(corridors, f, separators=(",", ":"))
+    return None, (_vertex_count(corridors), *check_samples(corridors, strokes, aspect))
+
+
+def verify_file(points_file, options):
+    """Error if the _Corridors.json is missing or out of date, else None."""
+    strokes, aspect = _letter(points_file)
+    with open(corridors_path(points_file), "r", encoding="utf-8") as f:
+        corridors = json.load(f)
+    # Rebuild with the file's own settings; resolution and simplify are not
+    # stored, so those come from the command line
+    options = dict(options, tolerances=tuple(corridors.get("tolerances", ())),
+                   bitmap_size=corridors.get("bitmapSize", DEFAULT_BITMAP_SIZE))
+    if corridors != build_corridors(strokes, aspect, **options):
+        return "out of date with its PointsInfo file (or built with other options)", None
+    return None, None
+
+
+def report_file(points_file, options):
+    strokes, aspect = _letter(points_file)
+    corridors = build_corridors(strokes, aspect, **options)
+    return None, (_vertex_count(corridors), *check_samples(corridors, strokes, aspect))
+
+
+def print_report(rows, options):
+    """Polygon size and test agreement per asset folder.
+
+    Args:
+        rows: [(group, (vertices, polygon agreement, bitmap agreement)), ...]
+    """
+    groups = {}
+    for group, values in rows:
+        groups.setdefault(group, []).append(values)
+
+    print(f"\ntolerances {', '.join(f'{t:g}' for t in options['tolerances'])}, "
+          f"{options['bitmap_size']}x{options['bitmap_size']} bitmaps")
+    print(f"{'folder':<26}{'files':>6}{'vertices/file':>15}{'polygon ok':>12}{'bitmap ok':>11}")
+    for group, items in groups.items():
+        count = len(items)
+        print(f"{group:<26}{count:>6}{sum(v for v, _, _ in items) / count:>15.1f}"
+              f"{100 * sum(p for _, p, _ in items) / count:>11.1f}%"
+              f"{100 * sum(b for _, _, b in items) / count:>10.1f}%")
+
+
+def main():
+    argv = sys.argv
+    tolerances = pop_option(argv, "--tolerances")
+    options = {
+        "tolerances": (tuple(float(t) for t in tolerances.split(",") if t.strip())
+                       if tolerances else DEFAULT_TOLERANCES),
+        "resolution": pop_int_option(argv, "--resolution") or DEFAULT_RESOLUTION,
+        "bitmap_size": pop_int_option(argv, "--bitmap-size") or DEFAULT_BITMAP_SIZE,
+        "simplify": float(pop_option(argv, "--simplify", DEFAULT_SIMPLIFY)),
+    }
+
+    if len(argv) < 3 or argv[1] not in ("build", "verify", "report"):
+        print("Usage: python3 corridors.py <build|verify|report> <script|all|folder|file>"
+              " [--tolerances A,B] [--resolution N] [--bitmap-size N] [--simplify F]")
+        print("Example: python3 corridors.py build telugu")
+        sys.exit(1)
+    if not options["tolerances"] or min(options["tolerances"]) <= 0:
+        print("Error: --tolerances must be positive numbers")
+        sys.exit(1)
+
+    command, target = argv[1], argv[2]
+    files = points_files(target)
+    if not files:
+        print(f"Error: No *{POINTS_SUFFIX} files for '{target}'")
+        sys.exit(1)
+
+    action = {"build": build_file, "verify": verify_file, "report": report_file}[command]
+    print({"build": "Building", "verify": "Verifying", "report": "Checking"}[command]
+          + f" {len(files)} file(s)...")
+    rows = []
+    failed = 0
+    for group, points_file in files:
+        try:
+            error, values = action(points_file, options)
+        except (OSError, ValueError, KeyError) as e:
+            error, values = str(e), None
+        if error:
+            name = os.path.basename(points_file)[:-len(POINTS_SUFFIX)]
+            print(f"  ✗ {group}/{name}: {error}")
+            failed += 1
+            continue
+        rows.append((group, values))
+
+    if command == "build":
+        print(f"✓ Wrote {len(rows)}/{len(files)} corridor file(s)")
+    elif command == "verify":
+        print(f"✓ {len(rows)}/{len(files)} corridor file(s) current")
+    if rows and command != "verify":
+        print_report(rows, options)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
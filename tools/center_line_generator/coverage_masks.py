@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+coverage_masks.py - Coverage masks for "percent traced" completion scoring
+
+Scoring how much of a letter has been traced currently walks the stroke
+points on the Dart side. This script rasterizes each letter's stroke
+corridor (every spot within --tolerance of a stroke polyline, as in
+corridors.py) into a small packed bitmask and stores the number of set
+cells with it, in `<name>_Coverage.json` next to each PointsInfo file:
+
+  {
+    "size": 64,                       mask is size x size cells
+    "bounds": [x0, y0, x1, y1],       0..1 area the mask covers
+    "tolerance": 0.06,
+    "letter": {"mask": "<base64>", "cells": 812},
+    "strokes": [{"mask": "<base64>", "cells": 301}, ...]
+  }
+
+Masks use the bit layout of the corridors.py bitmaps: row-major from the
+top-left of bounds, leftmost cell in the high bit of each byte; the cell of
+(x, y) is column floor((x - x0) / (x1 - x0) * size), row likewise with y.
+On device the app sets a bit in a visited mask of the same layout for
+every pointer sample; completion is then
+
+  popcount(visited & mask) / cells
+
+a few hundred bytes of AND + popcount, whatever the number of points.
+
+The app is expected to mark the cells within a small brush of each pointer
+sample. As a guide for the completion threshold, the report scores a trace
+that follows the strokes exactly with a brush of half the tolerance.
+
+Usage:
+  python3 tools/center_line_generator/coverage_masks.py build all
+  python3 tools/center_line_generator/coverage_masks.py build telugu --size 32 --tolerance 0.05
+  python3 tools/center_line_generator/coverage_masks.py verify hindi
+  python3 tools/center_line_generator/coverage_masks.py report path/to/ka_big_PointsInfo.json
+
+  build    write the _Coverage.json files and print the report
+  verify   check every _Coverage.json is current with its PointsInfo file
+  report   cells per mask and the centre-trace score, per asset folder
+           (writes nothing)
+
+The target is a script (telugu, hindi, arabic, english, english_upper,
+numbers, math_shapes or all), a folder or one PointsInfo file; `all`
+batch-generates every script folder.
+
+Options:
+  --size N          cells per side (default 64)
+  --tolerance F     corridor half-width, fraction of the letter's longer
+                    side (default 0.06)
+
+Dependencies: numpy
+"""
+
+import os
+import sys
+import json
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SVG_GENERATOR_DIR = SCRIPT_DIR.parent / "svg_generator"
+for path in (SCRIPT_DIR, SVG_GENERATOR_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from cli_options import pop_int_option, pop_option
+from resample_points import POINTS_SUFFIX, letter_aspect, points_files
+from points_binary import json_strokes
+from corridors import corridor_bounds, distance_field, pack_mask, unpack_mask
+
+
+COVERAGE_SUFFIX = "_Coverage.json"
+DEFAULT_SIZE = 64
+DEFAULT_TOLERANCE = 0.06
+
+# Brush of the report's centre trace, as a fraction of the tolerance
+CENTRE_TRACE_BRUSH = 0.5
+
+
+def cell_centers(bounds, size):
+    """(xs, ys) of the mask's cell centers in 0..1 space."""
+    x0, y0, x1, y1 = bounds
+    return (x0 + (np.arange(size) + 0.5) * (x1 - x0) / size,
+            y0 + (np.arange(size) + 0.5) * (y1 - y0) / size)
+
+
+def stroke_masks(strokes, aspect, bounds, size, tolerance):
+    """Boolean (size, size) corridor mask of every stroke."""
+    xs, ys = cell_centers(bounds, size)
+    return [distance_field(stroke, xs, ys, aspect) <= tolerance if len(stroke)
+            else np.zeros((size, size), dtype=bool) for stroke in strokes]
+
+
+def build_coverage(strokes, aspect=(1.0, 1.0), size=DEFAULT_SIZE, tolerance=DEFAULT_TOLERANCE):
+    """Coverage data of one letter, as written to JSON.
+
+    Args:
+        strokes: lists of (x, y) in 0..1
+    """
+    # Covers 0..1 and every corridor, edges rounded out to multiples of 1/size
+    bounds = corridor_bounds(strokes, (tolerance,), aspect, size)
+    masks = stroke_masks(strokes, aspect, bounds, size, tolerance)
+    letter = np.logical_or.reduce(masks) if masks else np.zeros((size, size), dtype=bool)
+    return {
+        "size": size,
+        "bounds": [round(v, 6) for v in bounds],
+        "tolerance": float(tolerance),
+        "letter": {"mask": pack_mask(letter), "cells": int(letter.sum())},
+        "strokes": [{"mask": pack_mask(mask), "cells": int(mask.sum())} for mask in masks],
+    }
+
+
+def completion(coverage, visited, stroke=None):
+    """Fraction of a mask covered by a visited (size, size) boolean array.
+
+    The reference for the app's popcount(visited & mask) / cells.
+    """
+    entry = coverage["letter"] if stroke is None else coverage["strokes"][stroke]
+    if not entry["cells"]:
+        return 1.0
+    mask = unpack_mask(entry["mask"], coverage["size"])
+    return int(np.count_nonzero(visited & mask)) / entry["cells"]
+
+
+def centre_trace(coverage, strokes, aspect, brush=CENTRE_TRACE_BRUSH):
+    """Visited cells of a trace along every stroke with a brush of brush x tolerance."""
+    size = coverage["size"]
+    masks = stroke_masks(strokes, aspect, coverage["bounds"], size, coverage["tolerance"] * brush)
+    return np.logical_or.reduce(masks) if masks else np.zeros((size, size), dtype=bool)
+
+
+def coverage_path(points_file):
+    return points_file[:-len(POINTS_SUFFIX)] + COVERAGE_SUFFIX
+
+
+def _letter(points_file):
+    with open(points_file, "r", encoding="utf-8") as f:
+        return json_strokes(f.read()), letter_aspect(points_file)
+
+
+def _report_values(coverage, strokes, aspect):
+    return coverage["letter"]["cells"], completion(coverage, centre_trace(coverage, strokes, aspect))
+
+
+def build_file(points_file, options):
+    """Write one _Coverage.json.
+
+    Returns:
+        (error or None, (cells, centre-trace score))
+    """
+    strokes, aspect = _letter(points_file)
+    coverage = build_coverage(strokes, aspect, **options)
+    with open(coverage_path(points_file), "w", encoding="utf-8") as f:
+        json.dump(coverage, f, separators=(",", ":"))
+    return None, _report_values(coverage, strokes, aspect)
+
+
+def verify_file(points_file, options):
+    """Error if the _Coverage.json is missing or out of date, else None."""
+    strokes, aspect = _letter(points_file)
+    with open(coverage_path(points_file), "r", encoding="utf-8") as f:
+        coverage = json.load(f)
+    expected = build_coverage(strokes, aspect, coverage.get("size", DEFAULT_SIZE),
+                              coverage.get("tolerance", DEFAULT_TOLERANCE))
+    if coverage != expected:
+        return "out of date with its PointsInfo file", None
+    return None, None
+
+
+def report_file(points_file, options):
+    strokes, aspect = _letter(points_file)
+    coverage = build_coverage(strokes, aspect, **options)
+    return None, _report_values(coverage, strokes, aspect)
+
+
+def print_report(rows, options):
+    """Mask cells and centre-trace score per asset folder.
+
+    Args:
+        rows: [(group, (cells, centre-trace score)), ...]
+    """
+    groups = {}
+    for group, values in rows:
+        groups.setdefault(group, []).append(values)
+
+    size = options["size"]
+    print(f"\n{size}x{size} masks ({size * size // 8} bytes each), "
+          f"tolerance {options['tolerance']:g}")
+    print(f"{'folder':<26}{'files':>6}{'cells/mask':>12}{'fill':>7}{'centre trace':>15}{'min':>7}")
+    for group, items in groups.items():
+        cells = sum(c for c, _ in items) / len(items)
+        print(f"{group:<26}{len(items):>6}{cells:>12.1f}{100 * cells / (size * size):>6.1f}%"
+              f"{100 * sum(s for _, s in items) / len(items):>14.1f}%"
+              f"{100 * min(s for _, s in items):>6.1f}%")
+
+
+def main():
+    argv = sys.argv
+    options = {
+        "size": pop_int_option(argv, "--size") or DEFAULT_SIZE,
+        "tolerance": float(pop_option(argv, "--tolerance", DEFAULT_TOLERANCE)),
+    }
+
+    if len(argv) < 3 or argv[1] not in ("build", "verify", "report"):
+        print("Usage: python3 coverage_masks.py <build|verify|report> <script|all|folder|file>"
+              " [--size N] [--tolerance F]")
+        print("Example: python3 coverage_masks.py build all")
+        sys.exit(1)
+    if options["size"] < 1 or options["tolerance"] <= 0:
+        print("Error: --size and --tolerance must be positive")
+        sys.exit(1)
+
+    command, target = argv[1], argv[2]
+    files = points_files(target)
+    if not files:
+        print(f"Error: No *{POINTS_SUFFIX} files for '{target}'")
+        sys.exit(1)
+
+    action = {"build": build_file, "verify": verify_file, "report": report_file}[command]
+    print({"build": "Building", "verify": "Verifying", "report": "Checking"}[command]
+          + f" {len(files)} file(s)...")
+    rows = []
+    failed = 0
+    for group, points_file in files:
+        try:
+            error, values = action(points_file, options)
+        except (OSError, ValueError, KeyError) as e:
+            error, values = str(e), None
+        if error:
+            name = os.path.basename(points_file)[:-len(POINTS_SUFFIX)]
+            print(f"  ✗ {group}/{name}: {error}")
+            failed += 1
+            continue
+        rows.append((group, values))
+
+    if command == "build":
+        print(f"✓ Wrote {len(rows)}/{len(files)} coverage file(s)")
+    elif command == "verify":
+        print(f"✓ {len(rows)}/{len(files)} coverage file(s) current")
+    if rows and command != "verify":
+        print_report(rows, options)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,754 @@
+#!/usr/bin/env python3
+"""
+extract_centerline.py - Generate stroke points from glyph outlines, headless
+
+The `*_PointsInfo.json` stroke points under lib/assets/phontics_assets_points
+are clicked in by hand in json_generator.html / centerline_editor.html. This
+script derives a first version of them from the normalized glyph paths that
+tools/svg_generator writes (`<name>_path.txt`):
+
+  1. rasterize   fill the outline (nonzero winding) into a NumPy bitmap
+  2. skeletonize Zhang-Suen thinning down to a one-pixel medial axis
+  3. trace       turn the skeleton into a graph (end points, junctions and
+                 the pixel runs between them), drop short spurs, and join
+                 branches through junctions where the line runs straight on
+  4. resample    smooth each stroke and space its points evenly by arc length
+
+The points are normalized to the outline's bounding box exactly like
+json_generator.html does (x and y each scaled to 0..1, 4 decimals), so the
+files drop into the app as they are:
+
+  {"strokes": [{"points": ["0.1457,0.4286", ...]}, ...]}
+
+Stroke order and direction follow a simple writing heuristic (start at the
+end nearest the top-left); review the result in json_generator.html before
+shipping it.
+
+Usage:
+  python3 tools/center_line_generator/extract_centerline.py telugu all
+  python3 tools/center_line_generator/extract_centerline.py hindi ka [output_dir]
+  python3 tools/center_line_generator/extract_centerline.py telugu all --jobs 4 --spacing 0.04
+
+Options:
+  --paths-dir DIR     read <name>_path.txt from DIR instead of the script's
+                      svg_generator output folder
+  --resolution N      raster size in pixels for the longer side (default 256)
+  --spacing F         distance between points as a fraction of the glyph's
+                      longer side (default 0.035)
+  --jobs N            worker processes for `all` (default: CPU count)
+
+Output: <output_dir>/<name>_big_PointsInfo.json
+(default output_dir: tools/center_line_generator/output/<script>)
+
+Dependencies: numpy
+"""
+
+import os
+import sys
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SVG_GENERATOR_DIR = SCRIPT_DIR.parent / "svg_generator"
+for path in (SCRIPT_DIR, SVG_GENERATOR_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from cli_options import pop_int_option, pop_option
+from path_ir import (ARC, CLOSE, CUBIC, HLINE, LINE, MOVE, QUAD, SMOOTH_CUBIC,
+                     SMOOTH_QUAD, VLINE, ARG_COUNTS, parse_path)
+
+
+# Normalized glyph paths per script (written by tools/svg_generator)
+SCRIPT_PATH_DIRS = {
+    "telugu": SVG_GENERATOR_DIR / "output",
+    "hindi": SVG_GENERATOR_DIR / "out_hin",
+}
+DEFAULT_OUTPUT_DIR = SCRIPT_DIR / "output"
+
+DEFAULT_RESOLUTION = 256
+DEFAULT_SPACING = 0.035
+
+# Line segments per curve when flattening
+CURVE_STEPS = 12
+
+# Spurs shorter than this many stroke widths are dropped
+SPUR_WIDTHS = 1.5
+
+# A separate piece whose skeleton is shorter than this many stroke widths is
+# a dot (anusvara, nukta, ...): it gets one short stroke across it
+DOT_WIDTHS = 1.5
+
+# Branches meeting at a junction are joined when they turn by less than this
+MAX_JOIN_TURN_DEGREES = 50
+
+# A branch's direction at a junction is measured this many stroke widths out
+# (at least MIN_DIRECTION_PIXELS), past the blob the thinning leaves there
+DIRECTION_WIDTHS = 1.0
+MIN_DIRECTION_PIXELS = 6
+
+# 8-neighbourhood offsets (row, col)
+NEIGHBOURS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+# ---------------------------------------------------------------- outline
+
+def flatten_path(path_d, steps=CURVE_STEPS):
+    """Flatten an SVG path into closed polygons.
+
+    Returns:
+        list of (N, 2) float arrays, one per subpath
+    """
+    ir = parse_path(path_d)
+    coords = ir.coords
+    polygons = []
+    current = []
+    cur = start = (0.0, 0.0)
+    last_ctrl = None
+    t = np.linspace(0.0, 1.0, steps + 1)[1:, None]
+    i = 0
+
+    def close():
+        if len(current) > 2:
+            polygons.append(np.array(current, dtype=float))
+        current.clear()
+
+    for code in ir.commands:
+        args = coords[i:i + ARG_COUNTS[code]]
+        i += ARG_COUNTS[code]
+        ctrl = None
+        if code == MOVE:
+            close()
+            cur = start = (args[0], args[1])
+            current.append(cur)
+        elif code in (LINE, ARC):
+            # Arcs do not occur in glyph outlines; their chord is used
+            cur = (args[-2], args[-1])
+            current.append(cur)
+        elif code == HLINE:
+            cur = (args[0], cur[1])
+            current.append(cur)
+        elif code == VLINE:
+            cur = (cur[0], args[0])
+            current.append(cur)
+        elif code in (QUAD, SMOOTH_QUAD):
+            if code == QUAD:
+                ctrl = (args[0], args[1])
+            else:
+                ctrl = _reflect(last_ctrl, cur, quadratic=True)
+            end = (args[-2], args[-1])
+            p0, p1, p2 = (np.array(p) for p in (cur, ctrl, end))
+            points = (1 - t) ** 2 * p0 + 2 * (1 - t) * t * p1 + t ** 2 * p2
+            current.extend(map(tuple, points))
+            cur = end
+        elif code in (CUBIC, SMOOTH_CUBIC):
+            if code == CUBIC:
+                c1, ctrl = (args[0], args[1]), (args[2], args[3])
+            else:
+                c1, ctrl = _reflect(last_ctrl, cur, quadratic=False), (args[0], args[1])
+            end = (args[-2], args[-1])
+            p0, p1, p2, p3 = (np.array(p) for p in (cur, c1, ctrl, end))
+            points = ((1 - t) ** 3 * p0 + 3 * (1 - t) ** 2 * t * p1
+                      + 3 * (1 - t) * t ** 2 * p2 + t ** 3 * p3)
+            current.extend(map(tuple, points))
+            cur = end
+        elif code == CLOSE:
+            close()
+            cur = start
+        last_ctrl = (code, ctrl)
+    close()
+    return polygons
+
+
+def _reflect(last_ctrl, cur, quadratic):
+    """First control point of a smooth (S/T) segment."""
+    code, ctrl = last_ctrl or (None, None)
+    smooth_of = (QUAD, SMOOTH_QUAD) if quadratic else (CUBIC, SMOOTH_CUBIC)
+    if ctrl is None or code not in smooth_of:
+        return cur
+    return (2 * cur[0] - ctrl[0], 2 * cur[1] - ctrl[1])
+
+
+def polygons_bounds(polygons):
+    """(min_x, min_y, max_x, max_y) of flattened outlines."""
+    points = np.concatenate(polygons)
+    return (*points.min(axis=0), *points.max(axis=0))
+
+
+# --------------------------------------------------------------- rasterize
+
+def rasterize(polygons, bounds, resolution=DEFAULT_RESOLUTION, margin=2):
+    """Fill polygons (nonzero winding) into a boolean bitmap.
+
+    The glyph's longer side spans `resolution` pixels; a `margin` of empty
+    pixels is kept around it so the thinning never touches the border.
+
+    Returns:
+        (bitmap, scale, origin) where pixel (row, col) has its center at
+        x = origin[0] + (col + 0.5) / scale, y = origin[1] + (row + 0.5) / scale
+    """
+    min_x, min_y, max_x, max_y = bounds
+    scale = resolution / max(max_x - min_x, max_y - min_y, 1e-9)
+    origin = (min_x - margin / scale, min_y - margin / scale)
+    width = int(math.ceil((max_x - min_x) * scale)) + 2 * margin
+    height = int(math.ceil((max_y - min_y) * scale)) + 2 * margin
+
+    # Every polygon edge, in pixel units
+    starts = np.concatenate(polygons)
+    ends = np.concatenate([np.roll(poly, -1, axis=0) for poly in polygons])
+    x0, y0 = (starts[:, 0] - origin[0]) * scale, (starts[:, 1] - origin[1]) * scale
+    x1, y1 = (ends[:, 0] - origin[0]) * scale, (ends[:, 1] - origin[1]) * scale
+    keep = y0 != y1
+    x0, y0, x1, y1 = x0[keep], y0[keep], x1[keep], y1[keep]
+    direction = np.where(y1 > y0, 1, -1)
+
+    # Crossings of every scanline (row centers) with every edge
+    rows = np.arange(height) + 0.5
+    low, high = np.minimum(y0, y1), np.maximum(y0, y1)
+    hit = (rows[:, None] >= low) & (rows[:, None] < high)
+    row_index, edge_index = np.nonzero(hit)
+    cross_x = (x0[edge_index] + (rows[row_index] - y0[edge_index])
+               * (x1[edge_index] - x0[edge_index]) / (y1[edge_index] - y0[edge_index]))
+
+    order = np.lexsort((cross_x, row_index))
+    row_index, cross_x = row_index[order], cross_x[order]
+    # Each row's crossings sum to zero, so one running sum is every row's winding
+    winding = np.cumsum(direction[edge_index[order]])
+
+    # Fill [crossing i, crossing i+1) wherever the winding there is nonzero
+    spans = np.nonzero((winding[:-1] != 0) & (row_index[:-1] == row_index[1:]))[0]
+    first = np.clip(np.ceil(cross_x[spans] - 0.5), 0, width).astype(int)
+    last = np.clip(np.ceil(cross_x[spans + 1] - 0.5), 0, width).astype(int)
+    coverage = np.zeros((height, width + 1), dtype=np.int32)
+    np.add.at(coverage, (row_index[spans], first), 1)
+    np.add.at(coverage, (row_index[spans], last), -1)
+    bitmap = np.cumsum(coverage, axis=1)[:, :width] > 0
+    return bitmap, scale, origin
+
+
+# ------------------------------------------------------------- skeletonize
+
+def _neighbour_planes(image):
+    """P2..P9 (N, NE, E, SE, S, SW, W, NW) of every pixel of a padded image."""
+    p = np.pad(image, 1)
+    return (p[:-2, 1:-1], p[:-2, 2:], p[1:-1, 2:], p[2:, 2:],
+            p[2:, 1:-1], p[2:, :-2], p[1:-1, :-2], p[:-2, :-2])
+
+
+def skeletonize(bitmap):
+    """Zhang-Suen thinning of a boolean bitmap to a one-pixel skeleton."""
+    image = bitmap.astype(np.uint8)
+    while True:
+        changed = False
+        for step in (0, 1):
+            planes = _neighbour_planes(image)
+            p2, p3, p4, p5, p6, p7, p8, p9 = planes
+            count = sum(planes)
+            sequence = planes + (p2,)
+            transitions = sum(((a == 0) & (b == 1)).astype(np.uint8)
+                              for a, b in zip(sequence, sequence[1:]))
+            if step == 0:
+                side = (p2 * p4 * p6 == 0) & (p4 * p6 * p8 == 0)
+            else:
+                side = (p2 * p4 * p8 == 0) & (p2 * p6 * p8 == 0)
+            remove = (image == 1) & (count >= 2) & (count <= 6) & (transitions == 1) & side
+            if remove.any():
+                image[remove] = 0
+                changed = True
+        if not changed:
+            return remove_staircases(image.astype(bool))
+
+
+def remove_staircases(skeleton):
+    """Drop corner pixels Zhang-Suen leaves on diagonal runs.
+
+    A pixel with two 4-neighbours at a right angle (an "L" step) gives the
+    line a spurious third neighbour and reads as a junction. It is removed
+    when its neighbours stay 8-connected without it. Removal is sequential,
+    so two corners of one step never vanish together.
+    """
+    image = np.pad(skeleton, 1).astype(np.uint8)
+    for row, col in zip(*np.nonzero(image)):
+        around = [(dr, dc) for dr, dc in NEIGHBOURS if image[row + dr, col + dc]]
+        if len(around) < 2:
+            continue
+        orthogonal = {offset for offset in around if 0 in offset}
+        corner = any((a[0] + b[0], a[1] + b[1]) in ((-1, -1), (-1, 1), (1, -1), (1, 1))
+                     for a in orthogonal for b in orthogonal)
+        if corner and _connected(around):
+            image[row, col] = 0
+    return image[1:-1, 1:-1].astype(bool)
+
+
+def _connected(offsets):
+    """True if neighbour offsets form one 8-connected group."""
+    seen = {offsets[0]}
+    stack = [offsets[0]]
+    while stack:
+        r, c = stack.pop()
+        for other in offsets:
+            if other not in seen and abs(other[0] - r) <= 1 and abs(other[1] - c) <= 1:
+                seen.add(other)
+                stack.append(other)
+    return len(seen) == len(offsets)
+
+
+def stroke_width(bitmap, skeleton):
+    """Typical stroke width in pixels, from how deep the skeleton lies.
+
+    Each erosion peels one pixel off the ink; a skeleton pixel that survives
+    d erosions sits d pixels from the edge, in a stroke about 2d - 1 wide.
+    """
+    depth = np.zeros(bitmap.shape, dtype=np.int32)
+    current = bitmap.copy()
+    while current.any():
+        depth += current
+        p = np.pad(current, 1)
+        current &= p[:-2, 1:-1] & p[2:, 1:-1] & p[1:-1, :-2] & p[1:-1, 2:]
+    return max(2.0 * float(np.median(depth[skeleton])) - 1.0, 1.0)
+
+
+# ------------------------------------------------------------------- trace
+
+class SkeletonGraph:
+    """Skeleton pixels as nodes (end points, junction clusters) and edges.
+
+    Each edge is a list of (row, col) pixels from one node to another;
+    `ends[edge_id]` holds the two node ids (equal for a loop through a node).
+    Closed rings without any node become edges from and to node None.
+    """
+
+    def __init__(self, skeleton):
+        self.pixels = set(zip(*np.nonzero(skeleton)))
+        self.node_of = {}
+        self.node_pixels = []
+        self.edges = []
+        self.ends = []
+        self._build()
+
+    def neighbours(self, pixel):
+        row, col = pixel
+        return [(row + dr, col + dc) for dr, dc in NEIGHBOURS
+                if (row + dr, col + dc) in self.pixels]
+
+    def _build(self):
+        # End points and junction pixels; touching junction pixels form one node
+        special = [p for p in self.pixels if len(self.neighbours(p)) != 2]
+        for pixel in sorted(special):
+            if pixel in self.node_of:
+                continue
+            node_id = len(self.node_pixels)
+            cluster = [pixel]
+            self.node_of[pixel] = node_id
+            if len(self.neighbours(pixel)) > 2:
+                stack = [pixel]
+                while stack:
+                    for other in self.neighbours(stack.pop()):
+                        if other not in self.node_of and len(self.neighbours(other)) > 2:
+                            self.node_of[other] = node_id
+                            cluster.append(other)
+                            stack.append(other)
+            self.node_pixels.append(cluster)
+
+        visited = set()
+        touching = set()
+        for node_id, cluster in enumerate(self.node_pixels):
+            for pixel in cluster:
+                for first in self.neighbours(pixel):
+                    other = self.node_of.get(first)
+                    if other is not None:
+                        # Two nodes touching directly
+                        pair = tuple(sorted((pixel, first)))
+                        if other != node_id and pair not in touching:
+                            touching.add(pair)
+                            self._add_edge([pixel, first])
+                    elif first not in visited:
+                        self._add_edge(self._walk(pixel, first, visited))
+
+        # Rings with no end point or junction
+        for pixel in sorted(self.pixels):
+            if pixel in visited or pixel in self.node_of:
+                continue
+            ring = self._walk(None, pixel, visited)
+            self.edges.append(ring + [ring[0]])
+            self.ends.append((None, None))
+
+    def _walk(self, previous, pixel, visited):
+        """Follow degree-2 pixels from `pixel` until a node (or back around)."""
+        path = [] if previous is None else [previous]
+        while True:
+            path.append(pixel)
+            if pixel in self.node_of:
+                return path
+            visited.add(pixel)
+            step = [p for p in self.neighbours(pixel) if p != previous and p not in visited]
+            if not step:
+                return path
+            # Prefer a node, then a 4-neighbour, to follow the line tightly
+            step.sort(key=lambda p: (p not in self.node_of,
+                                     abs(p[0] - pixel[0]) + abs(p[1] - pixel[1])))
+            previous, pixel = pixel, step[0]
+
+    def _add_edge(self, path):
+        self.edges.append(path)
+        self.ends.append((self.node_of.get(path[0]), self.node_of.get(path[-1])))
+
+
+def prune_spurs(graph, min_length):
+    """Ids of the edges left after repeatedly removing short dangling edges."""
+    alive = set(range(len(graph.edges)))
+    while True:
+        degree = {}
+        for edge_id in alive:
+            for node_id in graph.ends[edge_id]:
+                if node_id is not None:
+                    degree[node_id] = degree.get(node_id, 0) + 1
+        spurs = [edge_id for edge_id in alive
+                 if len(graph.edges[edge_id]) < min_length
+                 and any(node is not None and degree[node] == 1 for node in graph.ends[edge_id])
+                 # never remove a segment that is the whole stroke
+                 and not all(node is None or degree[node] == 1 for node in graph.ends[edge_id])]
+        if not spurs:
+            return alive
+        # Shortest first, one per junction per round so both sides of a fork
+        # are not removed together
+        spurs.sort(key=lambda edge_id: len(graph.edges[edge_id]))
+        touched = set()
+        for edge_id in spurs:
+            junctions = {node for node in graph.ends[edge_id]
+                         if node is not None and degree[node] > 1}
+            if junctions & touched:
+                continue
+            touched |= junctions
+            alive.discard(edge_id)
+
+
+def _node_center(graph, node_id):
+    return np.mean(graph.node_pixels[node_id], axis=0)
+
+
+def _departure(graph, edge_id, at_start, reach):
+    """Unit direction of an edge leaving its start (or end) node."""
+    path = graph.edges[edge_id] if at_start else graph.edges[edge_id][::-1]
+    node_id = graph.ends[edge_id][0 if at_start else 1]
+    origin = _node_center(graph, node_id) if node_id is not None else np.array(path[0], float)
+    target = np.array(path[min(reach, len(path) - 1)], dtype=float)
+    vector = target - origin
+    norm = np.hypot(*vector)
+    return vector / norm if norm else vector
+
+
+def join_strokes(graph, alive, width):
+    """Chain the surviving edges into strokes through junctions.
+
+    Two branches meeting at a node (e.g. where a spur was pruned) always
+    continue into each other. At real junctions the pairs of branches that
+    continue most nearly straight are joined, best pair first. Each stroke
+    is a list of pixels.
+    """
+    # (edge_id, at_start) ends per node
+    ends_at = {}
+    for edge_id in sorted(alive):
+        a, b = graph.ends[edge_id]
+        if a is not None:
+            ends_at.setdefault(a, []).append((edge_id, True))
+        if b is not None:
+            ends_at.setdefault(b, []).append((edge_id, False))
+
+    max_dot = -math.cos(math.radians(MAX_JOIN_TURN_DEGREES))
+    reach = max(MIN_DIRECTION_PIXELS, int(round(DIRECTION_WIDTHS * width)))
+    link = {}
+    for node_id, node_ends in ends_at.items():
+        if len(node_ends) < 2:
+            continue
+        if len(node_ends) == 2:
+            link[node_ends[0]] = node_ends[1]
+            link[node_ends[1]] = node_ends[0]
+            continue
+        directions = {end: _departure(graph, *end, reach) for end in node_ends}
+        pairs = []
+        for i, first in enumerate(node_ends):
+            for second in node_ends[i + 1:]:
+                if first[0] == second[0] and len(node_ends) > 2:
+                    continue
+                dot = float(np.dot(directions[first], directions[second]))
+                if dot <= max_dot:
+                    pairs.append((dot, first, second))
+        for _, first, second in sorted(pairs):
+            if first in link or second in link:
+                continue
+            link[first] = second
+            link[second] = first
+
+    strokes = []
+    used = set()
+
+    def chain_from(edge_id, at_start):
+        pixels = []
+        while edge_id not in used:
+            used.add(edge_id)
+            path = graph.edges[edge_id] if at_start else graph.edges[edge_id][::-1]
+            pixels.extend(path if not pixels else path[1:])
+            exit_end = (edge_id, not at_start)
+            if exit_end not in link:
+                break
+            edge_id, at_start = link[exit_end]
+        return pixels
+
+    # Open chains start at an end without a link; what is left are loops
+    for edge_id in sorted(alive):
+        for at_start in (True, False):
+            if edge_id not in used and (edge_id, at_start) not in link:
+                strokes.append(chain_from(edge_id, at_start))
+    for edge_id in sorted(alive):
+        if edge_id not in used:
+            strokes.append(chain_from(edge_id, True))
+    return [stroke for stroke in strokes if len(stroke) > 1]
+
+
+def label_ink(bitmap):
+    """Label the 8-connected pieces of ink.
+
+    Works on horizontal runs of ink rather than pixels: runs in neighbouring
+    rows that overlap (or touch diagonally) are merged with a union-find.
+
+    Returns:
+        (labels, count): int array with 1..count on ink and 0 elsewhere
+    """
+    edges = np.diff(np.pad(bitmap, ((0, 0), (1, 1))).astype(np.int8), axis=1)
+    run_rows, run_starts = np.nonzero(edges == 1)
+    _, run_ends = np.nonzero(edges == -1)     # exclusive
+    parent = list(range(len(run_rows)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    row_first = np.searchsorted(run_rows, np.arange(bitmap.shape[0] + 1))
+    for row in range(1, bitmap.shape[0]):
+        above = range(row_first[row - 1], row_first[row])
+        for i in range(row_first[row], row_first[row + 1]):
+            for j in above:
+                if run_starts[j] <= run_ends[i] and run_starts[i] <= run_ends[j]:
+                    root_i, root_j = find(i), find(j)
+                    if root_i != root_j:
+                        parent[root_j] = root_i
+
+    labels = np.zeros(bitmap.shape, dtype=np.int32)
+    numbers = {}
+    for i, (row, start, end) in enumerate(zip(run_rows, run_starts, run_ends)):
+        labels[row, start:end] = numbers.setdefault(find(i), len(numbers) + 1)
+    return labels, len(numbers)
+
+
+def dot_stroke(blob):
+    """Short stroke across an ink blob, along its long axis.
+
+    Args:
+        blob: (N, 2) array of the blob's (row, col) pixels
+
+    Returns:
+        [(row, col), (row, col)] through the blob's center, half as long as
+        the blob (a disc of radius r gives a stroke of length r)
+    """
+    center = blob.mean(axis=0)
+    if len(blob) < 2:
+        return [tuple(center), tuple(center)]
+    values, vectors = np.linalg.eigh(np.cov(blob.T.astype(float)))
+    half = math.sqrt(max(values[-1], 0.0)) * vectors[:, -1]
+    return [tuple(center - half), tuple(center + half)]
+
+
+# ---------------------------------------------------------------- resample
+
+def smooth_polyline(points, window=5):
+    """Moving average that keeps both end points (and closes loops smoothly)."""
+    if len(points) <= window:
+        return points
+    closed = np.allclose(points[0], points[-1])
+    half = window // 2
+    kernel = np.ones(window) / window
+    if closed:
+        ring = points[:-1]
+        padded = np.concatenate([ring[-half:], ring, ring[:half]])
+        smoothed = np.column_stack([np.convolve(padded[:, k], kernel, "valid") for k in (0, 1)])
+        return np.vstack([smoothed, smoothed[:1]])
+    padded = np.concatenate([np.repeat(points[:1], half, 0), points, np.repeat(points[-1:], half, 0)])
+    smoothed = np.column_stack([np.convolve(padded[:, k], kernel, "valid") for k in (0, 1)])
+    smoothed[0], smoothed[-1] = points[0], points[-1]
+    return smoothed
+
+
+def arc_lengths(points):
+    """Cumulative distance along a polyline, starting at 0."""
+    segments = np.hypot(*np.diff(points, axis=0).T)
+    return np.concatenate([[0.0], np.cumsum(segments)])
+
+
+def resample_to_count(points, count, distance=None):
+    """`count` points evenly spaced by arc length (ends always kept).
+
+    Args:
+        distance: arc_lengths(points), if already known (e.g. measured in
+            another space than the points themselves)
+    """
+    if distance is None:
+        distance = arc_lengths(points)
+    targets = np.linspace(0.0, distance[-1], count)
+    return np.column_stack([np.interp(targets, distance, points[:, k]) for k in (0, 1)])
+
+
+def resample_polyline(points, spacing):
+    """Points spaced `spacing` apart along a polyline (ends always kept)."""
+    distance = arc_lengths(points)
+    count = max(int(round(distance[-1] / spacing)), 1) + 1
+    return resample_to_count(points, count, distance)
+
+
+def orient_and_order(strokes):
+    """Start every stroke at its end nearest the top-left; order by start."""
+    oriented = []
+    for stroke in strokes:
+        if stroke[-1].sum() < stroke[0].sum() and not np.allclose(stroke[0], stroke[-1]):
+            stroke = stroke[::-1]
+        oriented.append(stroke)
+    return sorted(oriented, key=lambda s: (round(float(s[0][1]), 2), float(s[0][0])))
+
+
+# ------------------------------------------------------------------ driver
+
+def extract_strokes(path_d, resolution=DEFAULT_RESOLUTION, spacing=DEFAULT_SPACING):
+    """Stroke polylines of a glyph path, normalized to its bounding box.
+
+    Returns:
+        list of (N, 2) arrays with x and y in 0..1
+    """
+    polygons = flatten_path(path_d)
+    if not polygons:
+        raise ValueError("path has no closed outlines")
+    bounds = polygons_bounds(polygons)
+    bitmap, scale, origin = rasterize(polygons, bounds, resolution)
+    skeleton = skeletonize(bitmap)
+    if not skeleton.any():
+        raise ValueError("outline is empty at this resolution")
+
+    graph = SkeletonGraph(skeleton)
+    width = stroke_width(bitmap, skeleton)
+    alive = prune_spurs(graph, SPUR_WIDTHS * width)
+
+    # Pieces of ink with (almost) no skeleton are dots and get one stroke
+    # across them; thinning can erase a round dot entirely
+    labels, pieces = label_ink(bitmap)
+    skeleton_length = np.bincount(labels[skeleton], minlength=pieces + 1)
+    dots = {piece for piece in range(1, pieces + 1)
+            if skeleton_length[piece] < DOT_WIDTHS * width}
+    # Short leftovers between junctions are dropped
+    pixel_strokes = [pixels for pixels in join_strokes(graph, alive, width)
+                     if labels[pixels[0]] not in dots and len(pixels) >= width]
+    for piece in sorted(dots):
+        pixel_strokes.append(dot_stroke(np.argwhere(labels == piece)))
+
+    min_x, min_y, max_x, max_y = bounds
+    size = np.array([max(max_x - min_x, 1e-9), max(max_y - min_y, 1e-9)])
+    step = spacing * max(size) * scale
+    strokes = []
+    for pixels in pixel_strokes:
+        rows_cols = np.array(pixels, dtype=float)
+        xy = rows_cols[:, ::-1] + 0.5
+        xy = resample_polyline(smooth_polyline(xy), step)
+        font_xy = xy / scale + np.array(origin)
+        strokes.append(np.clip((font_xy - (min_x, min_y)) / size, 0.0, 1.0))
+    return orient_and_order(strokes)
+
+
+def points_info(strokes):
+    """The PointsInfo JSON object for normalized strokes."""
+    return {"strokes": [{"points": [f"{x:.4f},{y:.4f}" for x, y in stroke]}
+                        for stroke in strokes]}
+
+
+def read_path(paths_dir, name):
+    with open(os.path.join(paths_dir, f"{name}_path.txt"), "r", encoding="utf-8") as f:
+        return f.read().strip()
+
+
+def extract_letter(name, paths_dir, output_dir, resolution=DEFAULT_RESOLUTION,
+                   spacing=DEFAULT_SPACING):
+    """Write <output_dir>/<name>_big_PointsInfo.json for one letter.
+
+    Returns:
+        (name, output_file_or_None, message)
+    """
+    try:
+        strokes = extract_strokes(read_path(paths_dir, name), resolution, spacing)
+    except (OSError, ValueError) as e:
+        return name, None, str(e)
+
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = os.path.join(output_dir, f"{name}_big_PointsInfo.json")
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(points_info(strokes), f, indent=2)
+    counts = "+".join(str(len(stroke)) for stroke in strokes)
+    return name, output_file, f"{len(strokes)} stroke(s), {counts} points"
+
+
+def available_letters(paths_dir):
+    return sorted(p.name[:-len("_path.txt")] for p in Path(paths_dir).glob("*_path.txt"))
+
+
+def main():
+    argv = sys.argv
+    paths_dir = pop_option(argv, "--paths-dir")
+    resolution = pop_int_option(argv, "--resolution", DEFAULT_RESOLUTION)
+    spacing = float(pop_option(argv, "--spacing", DEFAULT_SPACING))
+    jobs = pop_int_option(argv, "--jobs")
+
+    if len(argv) < 3 or argv[1].lower() not in SCRIPT_PATH_DIRS:
+        print("Usage: python3 extract_centerline.py <telugu|hindi> <letter_name|all> [output_dir]"
+              " [--paths-dir DIR] [--resolution N] [--spacing F] [--jobs N]")
+        print("Example: python3 extract_centerline.py telugu all --jobs 4")
+        sys.exit(1)
+
+    script = argv[1].lower()
+    which = argv[2]
+    paths_dir = paths_dir or str(SCRIPT_PATH_DIRS[script])
+    output_dir = argv[3] if len(argv) > 3 else str(DEFAULT_OUTPUT_DIR / script)
+
+    if not os.path.isdir(paths_dir):
+        print(f"Error: Path folder not found: {paths_dir}")
+        sys.exit(1)
+
+    letters = available_letters(paths_dir) if which.lower() == "all" else [which]
+    if not letters:
+        print(f"Error: No *_path.txt files in {paths_dir}")
+        sys.exit(1)
+
+    print(f"Extracting centerlines for {len(letters)} letter(s) from {paths_dir}...")
+    args = (paths_dir, output_dir, resolution, spacing)
+    if len(letters) == 1 or jobs == 1:
+        results = [extract_letter(name, *args) for name in letters]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(extract_letter, letters, *[[a] * len(letters) for a in args]))
+
+    failed = 0
+    for name, output_file, message in results:
+        if output_file:
+            print(f"  ✓ {name}: {message} -> {output_file}")
+        else:
+            print(f"  ✗ {name}: {message}")
+            failed += 1
+
+    print(f"\n✓ Extracted {len(results) - failed}/{len(results)} letter(s) into {output_dir}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
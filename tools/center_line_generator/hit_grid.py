@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+hit_grid.py - Precomputed hit-test grids for PointsInfo stroke points
+
+tracing_cubit.dart compares every pointer position with every point of the
+active stroke, so each event costs O(points), more on the big Telugu and
+Hindi letters. This script buckets a letter's points, and the segments
+between them, into a uniform cells x cells grid over the 0..1 space of the
+PointsInfo file and writes it next to the file as `<name>_HitGrid.json`:
+
+  {
+    "cells": 16,                      grid is cells x cells over 0..1
+    "strokeStarts": [0, 34, 61],      global index of each stroke's first
+                                      point, plus the total at the end
+    "pointCells":   {"start": [...], "items": [...]},
+    "segmentCells": {"start": [...], "items": [...]}
+  }
+
+Points are numbered across strokes in file order (stroke s owns indices
+strokeStarts[s] .. strokeStarts[s+1]-1). Both tables are CSR arrays: cell
+(cx, cy) is index cy * cells + cx, and its entries are
+items[start[cell] : start[cell + 1]]. A point is listed in the one cell it
+falls in; segment i (from point i to point i + 1 of the same stroke) is
+listed in every cell its bounding box touches. Coordinates outside 0..1
+count as the edge cell.
+
+A query at (x, y) with radius r only looks at the cells the box
+[x - r, x + r] x [y - r, y + r] touches, so the work depends on r and the
+local point density, not the letter's size. On device, where a point is
+drawn at (x * sx + cx, y * sy + cy), a pixel radius is r / sx across and
+r / sy down. nearest_point and distance_to_path below are the reference
+for that lookup; `verify` checks them against a brute-force search.
+
+Usage:
+  python3 tools/center_line_generator/hit_grid.py build telugu
+  python3 tools/center_line_generator/hit_grid.py build all --cells 24
+  python3 tools/center_line_generator/hit_grid.py verify hindi
+  python3 tools/center_line_generator/hit_grid.py report path/to/ka_big_PointsInfo.json
+
+  build    write the _HitGrid.json sidecars, verify them and print the report
+  verify   check every sidecar is current and agrees with brute force
+  report   points checked per query, brute force vs grid, per asset folder
+
+The target is a script (telugu, hindi, arabic, english, english_upper,
+numbers, math_shapes or all), a folder or one PointsInfo file.
+
+Options:
+  --cells N     grid size (default 16)
+  --radius F    query radius for verify/report, in 0..1 units (default 0.08)
+
+Dependencies: none
+"""
+
+import os
+import sys
+import json
+import math
+import random
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SVG_GENERATOR_DIR = SCRIPT_DIR.parent / "svg_generator"
+for path in (SCRIPT_DIR, SVG_GENERATOR_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from cli_options import pop_int_option, pop_option
+from resample_points import POINTS_SUFFIX, points_files
+from points_binary import json_strokes
+
+
+GRID_SUFFIX = "_HitGrid.json"
+DEFAULT_CELLS = 16
+DEFAULT_RADIUS = 0.08
+
+# Random queries per file for verify/report (fixed seed, so runs repeat)
+CHECK_QUERIES = 200
+CHECK_SEED = 1
+
+
+def _cell(value, cells):
+    return min(max(int(value * cells), 0), cells - 1)
+
+
+def _csr(buckets):
+    start = [0]
+    items = []
+    for bucket in buckets:
+        items.extend(bucket)
+        start.append(len(items))
+    return {"start": start, "items": items}
+
+
+def build_grid(strokes, cells=DEFAULT_CELLS):
+    """Hit-test grid of strokes (lists of (x, y) in 0..1), as written to JSON."""
+    point_buckets = [[] for _ in range(cells * cells)]
+    segment_buckets = [[] for _ in range(cells * cells)]
+    stroke_starts = [0]
+    index = 0
+    for stroke in strokes:
+        for i, (x, y) in enumerate(stroke):
+            point_buckets[_cell(y, cells) * cells + _cell(x, cells)].append(index + i)
+            if i + 1 < len(stroke):
+                nx, ny = stroke[i + 1]
+                for cy in range(_cell(min(y, ny), cells), _cell(max(y, ny), cells) + 1):
+                    for cx in range(_cell(min(x, nx), cells), _cell(max(x, nx), cells) + 1):
+                        segment_buckets[cy * cells + cx].append(index + i)
+        index += len(stroke)
+        stroke_starts.append(index)
+    return {
+        "cells": cells,
+        "strokeStarts": stroke_starts,
+        "pointCells": _csr(point_buckets),
+        "segmentCells": _csr(segment_buckets),
+    }
+
+
+def _query_cells(grid, x, y, radius, scale):
+    cells = grid["cells"]
+    rx, ry = radius / scale[0], radius / scale[1]
+    for cy in range(_cell(y - ry, cells), _cell(y + ry, cells) + 1):
+        for cx in range(_cell(x - rx, cells), _cell(x + rx, cells) + 1):
+            yield cy * cells + cx
+
+
+def _candidates(table, cell_ids):
+    start, items = table["start"], table["items"]
+    for cell in cell_ids:
+        yield from items[start[cell]:start[cell + 1]]
+
+
+def _segment_distance(px, py, ax, ay, bx, by, scale):
+    sx, sy = scale
+    dx, dy = (bx - ax) * sx, (by - ay) * sy
+    qx, qy = (px - ax) * sx, (py - ay) * sy
+    length_sq = dx * dx + dy * dy
+    t = 0.0 if length_sq == 0 else min(max((qx * dx + qy * dy) / length_sq, 0.0), 1.0)
+    return math.hypot(qx - t * dx, qy - t * dy)
+
+
+def nearest_point(grid, points, x, y, radius, scale=(1.0, 1.0), stroke=None):
+    """Index of the closest point within radius of (x, y), or None.
+
+    Args:
+        points: all points of the letter, flattened in stroke order
+        radius: in the units of scale (0..1 units for the default scale)
+        scale: (sx, sy) from 0..1 space to the radius' units
+        stroke: only consider this stroke's points, if given
+
+    Returns:
+        (global point index, distance) or None
+    """
+    starts = grid["strokeStarts"]
+    low, high = (starts[stroke], starts[stroke + 1]) if stroke is not None else (0, starts[-1])
+    best = None
+    for index in _candidates(grid["pointCells"], _query_cells(grid, x, y, radius, scale)):
+        if low <= index < high:
+            px, py = points[index]
+            distance = math.hypot((px - x) * scale[0], (py - y) * scale[1])
+            if distance <= radius and (best is None or distance < best[1]):
+                best = (index, distance)
+    return best
+
+
+def distance_to_path(grid, points, x, y, radius, scale=(1.0, 1.0), stroke=None):
+    """Distance from (x, y) to the stroke polylines if it is within radius, else None.
+
+    Same arguments as nearest_point; single-point strokes count as points.
+    """
+    starts = grid["strokeStarts"]
+    low, high = (starts[stroke], starts[stroke + 1]) if stroke is not None else (0, starts[-1])
+    best = None
+    for index in _candidates(grid["segmentCells"], _query_cells(grid, x, y, radius, scale)):
+        if low <= index < high:
+            (ax, ay), (bx, by) = points[index], points[index + 1]
+            distance = _segment_distance(x, y, ax, ay, bx, by, scale)
+            if distance <= radius and (best is None or distance < best):
+                best = distance
+    for s in range(len(starts) - 1):
+        if starts[s + 1] - starts[s] == 1 and low <= starts[s] < high:
+            px, py = points[starts[s]]
+            distance = math.hypot((px - x) * scale[0], (py - y) * scale[1])
+            if distance <= radius and (best is None or distance < best):
+                best = distance
+    return best
+
+
+def _brute_nearest(points, x, y, radius):
+    best = None
+    for index, (px, py) in enumerate(points):
+        distance = math.hypot(px - x, py - y)
+        if distance <= radius and (best is None or distance < best[1]):
+            best = (index, distance)
+    return best
+
+
+def _brute_path(strokes, x, y, radius):
+    best = None
+    for stroke in strokes:
+        pairs = zip(stroke, stroke[1:]) if len(stroke) > 1 else [(stroke[0], stroke[0])]
+        for (ax, ay), (bx, by) in pairs:
+            distance = _segment_distance(x, y, ax, ay, bx, by, (1.0, 1.0))
+            if distance <= radius and (best is None or distance < best):
+                best = distance
+    return best
+
+
+def check_queries(grid, strokes, radius, queries=CHECK_QUERIES):
+    """Compare grid lookups with brute force at random spots near the strokes.
+
+    Returns:
+        (error description or None, mean point candidates per query)
+    """
+    points = [point for stroke in strokes for point in stroke]
+    if not points:
+        return None, 0.0
+    rng = random.Random(CHECK_SEED)
+    looked_at = 0
+    for _ in range(queries):
+        px, py = rng.choice(points)
+        x = px + rng.uniform(-2 * radius, 2 * radius)
+        y = py + rng.uniform(-2 * radius, 2 * radius)
+
+        got = nearest_point(grid, points, x, y, radius)
+        want = _brute_nearest(points, x, y, radius)
+        if (got is None) != (want is None) or (got and abs(got[1] - want[1]) > 1e-12):
+            return f"nearest point at ({x:.4f}, {y:.4f}): {got} instead of {want}", 0.0
+
+        got = distance_to_path(grid, points, x, y, radius)
+        want = _brute_path(strokes, x, y, radius)
+        if (got is None) != (want is None) or (got is not None and abs(got - want) > 1e-12):
+            return f"path distance at ({x:.4f}, {y:.4f}): {got} instead of {want}", 0.0
+
+        looked_at += sum(1 for _ in _candidates(grid["pointCells"],
+                                                _query_cells(grid, x, y, radius, (1.0, 1.0))))
+    return None, looked_at / queries
+
+
+def grid_path(points_file):
+    return points_file[:-len(POINTS_SUFFIX)] + GRID_SUFFIX
+
+
+def _read_strokes(points_file):
+    with open(points_file, "r", encoding="utf-8") as f:
+        return json_strokes(f.read())
+
+
+def build_file(points_file, cells, radius):
+    """Write one sidecar and check it.
+
+    Returns:
+        (error description or None, points, mean candidates per query)
+    """
+    strokes = _read_strokes(points_file)
+    grid = build_grid(strokes, cells)
+    with open(grid_path(points_file), "w", encoding="utf-8") as f:
+        json.dump(grid, f, separators=(",", ":"))
+    error, looked_at = check_queries(grid, strokes, radius)
+    return error, sum(len(stroke) for stroke in strokes), looked_at
+
+
+def verify_file(points_file, cells, radius):
+    """Like build_file, but checks the existing sidecar instead of writing one."""
+    strokes = _read_strokes(points_file)
+    with open(grid_path(points_file), "r", encoding="utf-8") as f:
+        grid = json.load(f)
+    if grid != build_grid(strokes, grid.get("cells", cells)):
+        return "out of date with its PointsInfo file", 0, 0.0
+    error, looked_at = check_queries(grid, strokes, radius)
+    return error, sum(len(stroke) for stroke in strokes), looked_at
+
+
+def report_file(points_file, cells, radius):
+    """Like build_file, without writing anything."""
+    strokes = _read_strokes(points_file)
+    error, looked_at = check_queries(build_grid(strokes, cells), strokes, radius)
+    return error, sum(len(stroke) for stroke in strokes), looked_at
+
+
+def print_report(rows, cells, radius):
+    """Points a query checks, brute force (all) vs grid, per asset folder.
+
+    Args:
+        rows: [(group, points, mean grid candidates), ...]
+    """
+    groups = {}
+    for group, points, looked_at in rows:
+        groups.setdefault(group, []).append((points, looked_at))
+
+    print(f"\n{cells}x{cells} grid, radius {radius:g}")
+    print(f"{'folder':<26}{'files':>6}{'points/file':>13}{'max':>6}{'grid/query':>12}")
+    for group, items in groups.items():
+        print(f"{group:<26}{len(items):>6}"
+              f"{sum(p for p, _ in items) / len(items):>13.1f}{max(p for p, _ in items):>6}"
+              f"{sum(c for _, c in items) / len(items):>12.1f}")
+
+
+def main():
+    argv = sys.argv
+    cells = pop_int_option(argv, "--cells") or DEFAULT_CELLS
+    radius = float(pop_option(argv, "--radius", DEFAULT_RADIUS))
+
+    if len(argv) < 3 or argv[1] not in ("build", "verify", "report"):
+        print("Usage: python3 hit_grid.py <build|verify|report> <script|all|folder|file>"
+              " [--cells N] [--radius F]")
+        print("Example: python3 hit_grid.py build telugu")
+        sys.exit(1)
+
+    command, target = argv[1], argv[2]
+    files = points_files(target)
+    if not files:
+        print(f"Error: No *{POINTS_SUFFIX} files for '{target}'")
+        sys.exit(1)
+
+    action = {"build": build_file, "verify": verify_file, "report": report_file}[command]
+    print({"build": "Building", "verify": "Verifying", "report": "Checking"}[command]
+          + f" {len(files)} file(s)...")
+    rows = []
+    failed = 0
+    for group, points_file in files:
+        try:
+            error, points, looked_at = action(points_file, cells, radius)
+        except (OSError, ValueError, KeyError) as e:
+            error = str(e)
+        if error:
+            name = os.path.basename(points_file)[:-len(POINTS_SUFFIX)]
+            print(f"  ✗ {group}/{name}: {error}")
+            failed += 1
+            continue
+        rows.append((group, points, looked_at))
+
+    if command != "report":
+        print(f"✓ {len(rows)}/{len(files)} grid(s) "
+              + ("written and checked" if command == "build" else "current and correct"))
+    if rows and command != "verify":
+        print_report(rows, cells, radius)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+pack_assets.py - Pack one script's point assets into a single bundle file
+
+Every letter ships as several small files (`a_big_PointsInfo.json`,
+`a_small_PointsInfo.json`, `a_custom_positions.json`), and each one is a
+separate asset-bundle open at runtime. This script packs a whole asset
+folder into one `<folder>.bundle`, with a table up front that says where
+every (letter id, variant) lives:
+
+  offset  size  field                       (integers little-endian)
+  0       4     magic b"PAB1"
+  4       2     folder name length, then the UTF-8 folder name
+          4     number of entries
+          per entry:
+            1     letter id length, then the UTF-8 id
+            1     variant length, then the UTF-8 variant
+            1     encoding: 0 = the file's bytes, 1 = PTS1 points
+            4     offset of the data from the start of the bundle
+            4     length of the data
+  ...           data of every entry, in table order
+
+Variants are `big`, `small`, `points` (plain `<id>_PointsInfo.json`) and
+`custom_positions`; the letter id is the rest of the file name (so
+`b_lower_PointsInfo.json` is id `b_lower`, variant `points`). Entries are
+sorted by letter id, so all variants of a letter are contiguous: a reader
+reads the table once, then fetches a letter, or a lesson's run of letters,
+with one ranged read from its first offset to its last end.
+
+With --binary the PointsInfo entries are stored in the PTS1 format of
+points_binary.py (encoding 1) instead of as JSON; keys other than the
+strokes (id, style, char) are then not kept.
+
+Usage:
+  python3 tools/center_line_generator/pack_assets.py pack telugu
+  python3 tools/center_line_generator/pack_assets.py pack all [output_dir] [--binary]
+  python3 tools/center_line_generator/pack_assets.py list telugu_phontics.bundle [--letters a,aa,i]
+  python3 tools/center_line_generator/pack_assets.py verify telugu_phontics.bundle [asset_folder]
+  python3 tools/center_line_generator/pack_assets.py unpack telugu_phontics.bundle output_dir
+
+  pack     write <output_dir>/<folder>.bundle (default output_dir:
+           tools/center_line_generator/output/bundles) and verify it
+  list     print the table; --letters prints the byte range covering them
+  verify   check the table, and that every entry matches its source file
+           (asset_folder defaults to the folder named in the bundle)
+  unpack   write every entry back out as a file (PTS1 entries as .bin)
+
+Dependencies: none
+"""
+
+import os
+import sys
+import struct
+from collections import namedtuple
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SVG_GENERATOR_DIR = SCRIPT_DIR.parent / "svg_generator"
+for path in (SCRIPT_DIR, SVG_GENERATOR_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from cli_options import pop_flag, pop_option
+from resample_points import ASSETS_DIR, ASSET_FOLDERS
+from points_binary import (BINARY_SUFFIX, check_round_trip, decode_strokes,
+                           encode_strokes, json_strokes)
+
+
+MAGIC = b"PAB1"
+DEFAULT_OUTPUT_DIR = SCRIPT_DIR / "output" / "bundles"
+BUNDLE_SUFFIX = ".bundle"
+
+RAW = 0
+PTS1 = 1
+
+# Variant name -> file name suffix; longest suffixes are matched first
+VARIANT_SUFFIXES = {
+    "big": "_big_PointsInfo.json",
+    "small": "_small_PointsInfo.json",
+    "custom_positions": "_custom_positions.json",
+    "points": "_PointsInfo.json",
+}
+POINTS_VARIANTS = ("big", "small", "points")
+
+Entry = namedtuple("Entry", ["letter_id", "variant", "encoding", "offset", "length"])
+
+
+def split_asset_name(file_name):
+    """(letter id, variant) of an asset file name, or None if it is not one."""
+    for variant, suffix in sorted(VARIANT_SUFFIXES.items(), key=lambda item: -len(item[1])):
+        if file_name.endswith(suffix) and len(file_name) > len(suffix):
+            return file_name[:-len(suffix)], variant
+    return None
+
+
+def asset_name(letter_id, variant, encoding=RAW):
+    name = letter_id + VARIANT_SUFFIXES[variant]
+    if encoding == PTS1:
+        name = name[:-len("_PointsInfo.json")] + BINARY_SUFFIX
+    return name
+
+
+def folder_assets(folder):
+    """[(letter id, variant, path)] of a folder, sorted by letter id then variant."""
+    assets = []
+    for path in Path(folder).iterdir():
+        parts = split_asset_name(path.name) if path.is_file() else None
+        if parts:
+            assets.append((parts[0], parts[1], str(path)))
+    return sorted(assets)
+
+
+def _short_string(text):
+    data = text.encode("utf-8")
+    if len(data) > 0xFF:
+        raise ValueError(f"name too long for the bundle table: {text}")
+    return struct.pack("<B", len(data)) + data
+
+
+def pack_folder(folder, binary=False):
+    """Bundle bytes for every asset of one folder.
+
+    Returns:
+        (bundle bytes, list of Entry)
+    """
+    payloads = []
+    for letter_id, variant, path in folder_assets(folder):
+        with open(path, "rb") as f:
+            data = f.read()
+        encoding = RAW
+        if binary and variant in POINTS_VARIANTS:
+            data = encode_strokes(json_strokes(data.decode("utf-8")))
+            encoding = PTS1
+        payloads.append((letter_id, variant, encoding, data))
+
+    folder_name = Path(folder).name.encode("utf-8")
+    header_size = 4 + 2 + len(folder_name) + 4 + sum(
+        len(_short_string(letter_id)) + len(_short_string(variant)) + 1 + 8
+        for letter_id, variant, _, _ in payloads)
+
+    table = bytearray(MAGIC)
+    table += struct.pack("<H", len(folder_name)) + folder_name
+    table += struct.pack("<I", len(payloads))
+    entries = []
+    offset = header_size
+    for letter_id, variant, encoding, data in payloads:
+        table += _short_string(letter_id) + _short_string(variant)
+        table += struct.pack("<BII", encoding, offset, len(data))
+        entries.append(Entry(letter_id, variant, encoding, offset, len(data)))
+        offset += len(data)
+    assert len(table) == header_size
+    return bytes(table) + b"".join(data for _, _, _, data in payloads), entries
+
+
+def read_table(data):
+    """(folder name, list of Entry) from the start of a bundle.
+
+    Raises:
+        ValueError: on a wrong magic, a truncated table or entries that
+            point outside the bundle
+    """
+    if data[:4] != MAGIC:
+        raise ValueError("not an asset bundle (bad magic)")
+    pos = 4
+
+    def take(size):
+        nonlocal pos
+        if pos + size > len(data):
+            raise ValueError("truncated bundle table")
+        chunk = data[pos:pos + size]
+        pos += size
+        return chunk
+
+    def short_string():
+        return take(take(1)[0]).decode("utf-8")
+
+    folder_name = take(struct.unpack("<H", take(2))[0]).decode("utf-8")
+    entries = []
+    for _ in range(struct.unpack("<I", take(4))[0]):
+        letter_id = short_string()
+        variant = short_string()
+        encoding, offset, length = struct.unpack("<BII", take(9))
+        if offset + length > len(data):
+            raise ValueError(f"{letter_id}/{variant}: data outside the bundle")
+        entries.append(Entry(letter_id, variant, encoding, offset, length))
+    if any(entry.offset < pos for entry in entries):
+        raise ValueError("entry data overlaps the bundle table")
+    return folder_name, entries
+
+
+def entry_data(data, entry):
+    return data[entry.offset:entry.offset + entry.length]
+
+
+def lesson_range(entries, letter_ids):
+    """(offset, length) of the one read that covers all variants of letter_ids."""
+    wanted = [entry for entry in entries if entry.letter_id in letter_ids]
+    if not wanted:
+        return None
+    start = min(entry.offset for entry in wanted)
+    end = max(entry.offset + entry.length for entry in wanted)
+    return start, end - start
+
+
+def verify_bundle(data, folder):
+    """Problems found comparing a bundle with its source folder (empty if none)."""
+    _, entries = read_table(data)
+    problems = []
+    by_key = {(entry.letter_id, entry.variant): entry for entry in entries}
+    sources = {(letter_id, variant): path for letter_id, variant, path in folder_assets(folder)}
+
+    for key in sorted(set(sources) - set(by_key)):
+        problems.append(f"{key[0]}/{key[1]}: missing from the bundle")
+    for key in sorted(set(by_key) - set(sources)):
+        problems.append(f"{key[0]}/{key[1]}: no source file in {folder}")
+
+    for key in sorted(set(sources) & set(by_key)):
+        entry = by_key[key]
+        with open(sources[key], "rb") as f:
+            source = f.read()
+        packed = entry_data(data, entry)
+        if entry.encoding == PTS1:
+            try:
+                error = check_round_trip(json_strokes(source.decode("utf-8")),
+                                         decode_strokes(packed))
+            except ValueError as e:
+                error = str(e)
+        elif entry.encoding == RAW:
+            error = None if packed == source else "differs from its source file"
+        else:
+            error = f"unknown encoding {entry.encoding}"
+        if error:
+            problems.append(f"{key[0]}/{key[1]}: {error}")
+    return problems
+
+
+def resolve_folders(target):
+    """Asset folders for a script key, 'all' or a folder path."""
+    if target.lower() == "all":
+        return [ASSETS_DIR / folder for folder in ASSET_FOLDERS.values()]
+    folder = ASSET_FOLDERS.get(target.lower())
+    return [ASSETS_DIR / folder if folder else Path(target)]
+
+
+def pack_command(argv, binary):
+    if len(argv) < 3:
+        print("Usage: python3 pack_assets.py pack <script|all|folder> [output_dir] [--binary]")
+        sys.exit(1)
+    output_dir = Path(argv[3]) if len(argv) > 3 else DEFAULT_OUTPUT_DIR
+
+    failed = 0
+    for folder in resolve_folders(argv[2]):
+        if not folder.is_dir():
+            print(f"  ✗ {folder}: not a folder")
+            failed += 1
+            continue
+        data, entries = pack_folder(folder, binary)
+        if not entries:
+            print(f"  ✗ {folder.name}: no point assets")
+            failed += 1
+            continue
+        os.makedirs(output_dir, exist_ok=True)
+        bundle_file = output_dir / (folder.name + BUNDLE_SUFFIX)
+        with open(bundle_file, "wb") as f:
+            f.write(data)
+
+        problems = verify_bundle(data, folder)
+        source_size = sum(os.path.getsize(path) for _, _, path in folder_assets(folder))
+        letters = len({entry.letter_id for entry in entries})
+        mark = "✗" if problems else "✓"
+        print(f"  {mark} {folder.name}: {len(entries)} files ({letters} letters), "
+              f"{source_size / 1024:.1f} KB -> {len(data) / 1024:.1f} KB -> {bundle_file}")
+        for problem in problems:
+            print(f"      {problem}")
+        failed += bool(problems)
+
+    if failed:
+        sys.exit(1)
+
+
+def read_bundle(path):
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        return data, read_table(data)
+    except (OSError, ValueError) as e:
+        print(f"Error: {path}: {e}")
+        sys.exit(1)
+
+
+def list_command(argv, letters):
+    data, (folder_name, entries) = read_bundle(argv[2])
+    print(f"{folder_name}: {len(entries)} entries, {len(data)} bytes")
+    print(f"\n{'letter':<16}{'variant':<18}{'encoding':<10}{'offset':>9}{'length':>9}")
+    for entry in entries:
+        encoding = "PTS1" if entry.encoding == PTS1 else "raw"
+        print(f"{entry.letter_id:<16}{entry.variant:<18}{encoding:<10}"
+              f"{entry.offset:>9}{entry.length:>9}")
+
+    if letters:
+        wanted = [letter.strip() for letter in letters.split(",") if letter.strip()]
+        span = lesson_range(entries, wanted)
+        if span is None:
+            print(f"\n✗ None of {', '.join(wanted)} are in the bundle")
+            sys.exit(1)
+        missing = sorted(set(wanted) - {entry.letter_id for entry in entries})
+        print(f"\nRead for {', '.join(wanted)}: offset {span[0]}, length {span[1]}"
+              + (f" (not in the bundle: {', '.join(missing)})" if missing else ""))
+
+
+def verify_command(argv):
+    data, (folder_name, _) = read_bundle(argv[2])
+    folder = Path(argv[3]) if len(argv) > 3 else ASSETS_DIR / folder_name
+    if not folder.is_dir():
+        print(f"Error: source folder not found: {folder}")
+        sys.exit(1)
+    problems = verify_bundle(data, folder)
+    for problem in problems:
+        print(f"  ✗ {problem}")
+    if problems:
+        print(f"✗ {len(problems)} problem(s) in {argv[2]}")
+        sys.exit(1)
+    print(f"✓ {argv[2]} matches {folder}")
+
+
+def unpack_command(argv):
+    if len(argv) < 4:
+        print("Usage: python3 pack_assets.py unpack <bundle> <output_dir>")
+        sys.exit(1)
+    data, (_, entries) = read_bundle(argv[2])
+    output_dir = Path(argv[3])
+    os.makedirs(output_dir, exist_ok=True)
+    for entry in entries:
+        with open(output_dir / asset_name(entry.letter_id, entry.variant, entry.encoding), "wb") as f:
+            f.write(entry_data(data, entry))
+    print(f"✓ Wrote {len(entries)} file(s) to {output_dir}")
+
+
+def main():
+    argv = sys.argv
+    binary = pop_flag(argv, "--binary")
+    letters = pop_option(argv, "--letters")
+
+    commands = ("pack", "list", "verify", "unpack")
+    if len(argv) < 3 or argv[1] not in commands:
+        print("Usage: python3 pack_assets.py <pack|list|verify|unpack> ...")
+        print("Example: python3 pack_assets.py pack telugu")
+        sys.exit(1)
+
+    if argv[1] == "pack":
+        pack_command(argv, binary)
+    elif argv[1] == "list":
+        list_command(argv, letters)
+    elif argv[1] == "verify":
+        verify_command(argv)
+    else:
+        unpack_command(argv)
+
+
+if __name__ == "__main__":
+    main()
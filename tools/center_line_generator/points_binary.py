@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+points_binary.py - Compact binary copies of PointsInfo stroke points
+
+`*_PointsInfo.json` stores every point as a "0.1457,0.4286" string, so
+loading a letter means decoding JSON and then splitting and parsing each
+point. This script writes a `<name>_PointsInfo.bin` next to each JSON file
+with the same strokes:
+
+  offset  size     field
+  0       4        magic b"PTS1"
+  4       varint   number of strokes
+          per stroke:
+            varint   number of points
+            per point: zigzag varint dx, zigzag varint dy
+
+Coordinates are quantized to uint16 in 0..1 space (q = round(v * 65535))
+and every point is stored as the difference from the previous point of
+its stroke (the first one from (0, 0)). Varints are unsigned LEB128 (7 bits
+per byte, low bits first, high bit set on all but the last byte); zigzag
+maps a signed delta d to (d << 1) ^ (d >> 31), so small steps in either
+direction take one or two bytes. To decode: v = q / 65535.
+
+A decoded value is within half a quantization step (about 7.6e-6) of the
+JSON value; that is well below the 4-decimal precision the tools write, so
+rounding to 4 decimals gives back such a value exactly. `verify` checks the
+half-step bound for every point.
+
+Usage:
+  python3 tools/center_line_generator/points_binary.py encode all
+  python3 tools/center_line_generator/points_binary.py verify telugu
+  python3 tools/center_line_generator/points_binary.py report hindi
+  python3 tools/center_line_generator/points_binary.py encode path/to/ka_big_PointsInfo.json
+
+  encode   write the .bin files, verify them and print the report
+  verify   check that every .bin decodes to its JSON (fails on stale files)
+  report   sizes and decode times, JSON vs binary, per asset folder
+
+The target is a script (telugu, hindi, arabic, english, english_upper,
+numbers, math_shapes or all), a folder or one PointsInfo file.
+
+Dependencies: none
+"""
+
+import os
+import sys
+import json
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SVG_GENERATOR_DIR = SCRIPT_DIR.parent / "svg_generator"
+for path in (SCRIPT_DIR, SVG_GENERATOR_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from resample_points import POINTS_SUFFIX, points_files
+
+
+MAGIC = b"PTS1"
+BINARY_SUFFIX = "_PointsInfo.bin"
+QUANT_MAX = 65535
+
+# Largest round-trip error of a coordinate (half a step, plus float slack)
+ROUND_TRIP_TOLERANCE = 0.5 / QUANT_MAX + 1e-12
+
+# Decode repetitions per file when timing
+TIMING_ROUNDS = 20
+
+
+def quantize(value):
+    return min(max(int(round(value * QUANT_MAX)), 0), QUANT_MAX)
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _zigzag(value):
+    return (value << 1) ^ (value >> 31)
+
+
+def _unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def encode_strokes(strokes):
+    """Binary form of strokes given as lists of (x, y) floats in 0..1."""
+    out = bytearray(MAGIC)
+    _write_varint(out, len(strokes))
+    for stroke in strokes:
+        _write_varint(out, len(stroke))
+        prev_x = prev_y = 0
+        for x, y in stroke:
+            qx, qy = quantize(x), quantize(y)
+            _write_varint(out, _zigzag(qx - prev_x))
+            _write_varint(out, _zigzag(qy - prev_y))
+            prev_x, prev_y = qx, qy
+    return bytes(out)
+
+
+def decode_strokes(data):
+    """Strokes (lists of (x, y) floats) from encode_strokes output.
+
+    Raises:
+        ValueError: on a wrong magic or truncated data
+    """
+    if data[:4] != MAGIC:
+        raise ValueError("not a stroke point file (bad magic)")
+    pos = 4
+    size = len(data)
+
+    def varint():
+        nonlocal pos
+        value = shift = 0
+        while True:
+            if pos >= size:
+                raise ValueError("truncated stroke point file")
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    strokes = []
+    for _ in range(varint()):
+        stroke = []
+        qx = qy = 0
+        for _ in range(varint()):
+            qx += _unzigzag(varint())
+            qy += _unzigzag(varint())
+            stroke.append((qx / QUANT_MAX, qy / QUANT_MAX))
+        strokes.append(stroke)
+    if pos != size:
+        raise ValueError(f"{size - pos} trailing byte(s)")
+    return strokes
+
+
+def json_strokes(text):
+    """Strokes from PointsInfo JSON, parsed the way the app does."""
+    return [[tuple(float(v) for v in point.split(",")) for point in stroke["points"]]
+            for stroke in json.loads(text)["strokes"]]
+
+
+def binary_path(points_file):
+    return points_file[:-len(POINTS_SUFFIX)] + BINARY_SUFFIX
+
+
+def check_round_trip(strokes, decoded):
+    """None if decoded matches strokes within half a step, else a description."""
+    if len(strokes) != len(decoded):
+        return f"{len(decoded)} strokes instead of {len(strokes)}"
+    for index, (stroke, got) in enumerate(zip(strokes, decoded)):
+        if len(stroke) != len(got):
+            return f"stroke {index + 1}: {len(got)} points instead of {len(stroke)}"
+        for (x, y), (gx, gy) in zip(stroke, got):
+            # Values outside 0..1 are clamped by the encoder
+            x, y = min(max(x, 0.0), 1.0), min(max(y, 0.0), 1.0)
+            if abs(gx - x) > ROUND_TRIP_TOLERANCE or abs(gy - y) > ROUND_TRIP_TOLERANCE:
+                return f"stroke {index + 1}: ({gx:.6f}, {gy:.6f}) instead of ({x}, {y})"
+    return None
+
+
+def encode_file(points_file):
+    """Write the .bin for one JSON file and check it decodes back.
+
+    Returns:
+        error description or None
+    """
+    with open(points_file, "r", encoding="utf-8") as f:
+        strokes = json_strokes(f.read())
+    data = encode_strokes(strokes)
+    with open(binary_path(points_file), "wb") as f:
+        f.write(data)
+    return check_round_trip(strokes, decode_strokes(data))
+
+
+def verify_file(points_file):
+    """Error description if the .bin is missing, stale or corrupt, else None."""
+    try:
+        with open(points_file, "r", encoding="utf-8") as f:
+            strokes = json_strokes(f.read())
+        with open(binary_path(points_file), "rb") as f:
+            decoded = decode_strokes(f.read())
+    except OSError as e:
+        return str(e)
+    except ValueError as e:
+        return f"{os.path.basename(binary_path(points_file))}: {e}"
+    return check_round_trip(strokes, decoded)
+
+
+def _time_per_file(function, payloads):
+    start = time.perf_counter()
+    for _ in range(TIMING_ROUNDS):
+        for payload in payloads:
+            function(payload)
+    return (time.perf_counter() - start) / (TIMING_ROUNDS * max(len(payloads), 1))
+
+
+def print_report(files):
+    """JSON vs binary size and decode time per asset folder."""
+    groups = {}
+    for group, points_file in files:
+        if os.path.isfile(binary_path(points_file)):
+            groups.setdefault(group, []).append(points_file)
+    if not groups:
+        print("  No .bin files to report on (run encode first)")
+        return
+
+    print(f"\n{'folder':<26}{'files':>6}{'JSON KB':>10}{'bin KB':>9}{'ratio':>8}"
+          f"{'JSON us':>10}{'bin us':>9}")
+    totals = [0, 0]
+    for group, paths in groups.items():
+        texts = []
+        blobs = []
+        for points_file in paths:
+            with open(points_file, "r", encoding="utf-8") as f:
+                texts.append(f.read())
+            with open(binary_path(points_file), "rb") as f:
+                blobs.append(f.read())
+        json_size = sum(len(text.encode("utf-8")) for text in texts)
+        bin_size = sum(len(blob) for blob in blobs)
+        totals[0] += json_size
+        totals[1] += bin_size
+        json_time = _time_per_file(json_strokes, texts)
+        bin_time = _time_per_file(decode_strokes, blobs)
+        print(f"{group:<26}{len(paths):>6}{json_size / 1024:>10.1f}{bin_size / 1024:>9.1f}"
+              f"{json_size / max(bin_size, 1):>7.1f}x"
+              f"{json_time * 1e6:>10.1f}{bin_time * 1e6:>9.1f}")
+    print(f"{'total':<26}{sum(len(p) for p in groups.values()):>6}"
+          f"{totals[0] / 1024:>10.1f}{totals[1] / 1024:>9.1f}"
+          f"{totals[0] / max(totals[1], 1):>7.1f}x")
+    print("\n(decode time per file, in this Python; the app's JSON path also "
+          "splits and parses every point string)")
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] not in ("encode", "verify", "report"):
+        print("Usage: python3 points_binary.py <encode|verify|report> <script|all|folder|file>")
+        print("Example: python3 points_binary.py encode telugu")
+        sys.exit(1)
+
+    command, target = sys.argv[1], sys.argv[2]
+    files = points_files(target)
+    if not files:
+        print(f"Error: No *{POINTS_SUFFIX} files for '{target}'")
+        sys.exit(1)
+
+    failed = 0
+    if command in ("encode", "verify"):
+        action = encode_file if command == "encode" else verify_file
+        verb = "Encoding" if command == "encode" else "Verifying"
+        print(f"{verb} {len(files)} file(s)...")
+        for group, points_file in files:
+            try:
+                error = action(points_file)
+            except (OSError, ValueError, KeyError) as e:
+                error = str(e)
+            if error:
+                name = os.path.basename(points_file)[:-len(POINTS_SUFFIX)]
+                print(f"  ✗ {group}/{name}: {error}")
+                failed += 1
+        ok = len(files) - failed
+        print(f"✓ {ok}/{len(files)} file(s) " + ("encoded and verified" if command == "encode"
+                                                 else "match their JSON"))
+
+    if command in ("encode", "report"):
+        print_report(files)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
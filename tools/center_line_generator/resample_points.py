@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+resample_points.py - Even out and budget the stroke points of PointsInfo files
+
+The hand-made `*_PointsInfo.json` strokes have uneven spacing, and letters
+range from a handful of points to well over a hundred. The tracing code
+hit-tests every point on each pointer event, so that cost varies from
+letter to letter. This script rewrites the files so that:
+
+  - every stroke's points are evenly spaced by arc length (NumPy cumulative
+    length + interpolation; the first and last point stay where they are)
+    between its corners: a point where the stroke turns by more than
+    CORNER_ANGLE is kept as it is, so sparse hand-placed corners are not
+    cut off
+  - a letter has at most --max-points points, shared out between its strokes
+    by length (each stroke keeps at least 2), and a stroke at most
+    --stroke-points
+  - optionally, points are --spacing apart (a fraction of the letter's
+    longer side) before the budgets apply
+
+Without --spacing a stroke keeps its point count (or less, under a budget).
+A budget smaller than a stroke's corners drops its gentlest corners first.
+A file whose strokes would move by more than --max-deviation (a fraction of
+the letter's longer side, measured from every original point to the new
+polyline) is left unchanged and reported.
+Lengths are measured in the letter's real proportions when a matching
+`<name>_custom_positions.json` gives its svgBounds, otherwise in the square
+0..1 space of the file. Other keys (id, style, char) and the file's compact
+or indented layout are kept.
+
+A before/after report of point counts is printed per script.
+
+Usage:
+  python3 tools/center_line_generator/resample_points.py all --max-points 40 --dry-run
+  python3 tools/center_line_generator/resample_points.py telugu --max-points 40
+  python3 tools/center_line_generator/resample_points.py hindi --spacing 0.04 --stroke-points 20
+  python3 tools/center_line_generator/resample_points.py path/to/ka_big_PointsInfo.json [output_dir]
+
+The first argument is a script (telugu, hindi, arabic, english,
+english_upper, numbers, math_shapes or all), a folder or one file. Files are
+rewritten in place unless an output_dir is given (one subfolder per asset
+folder).
+
+Options:
+  --max-points N      point budget per letter (file)
+  --stroke-points N   point budget per stroke
+  --spacing F         target distance between points (fraction of the
+                      letter's longer side)
+  --max-deviation F   refuse to write a file whose shape moves more than
+                      this (fraction of the letter's longer side, default
+                      0.01)
+  --dry-run           only print the report
+
+Dependencies: numpy
+"""
+
+import os
+import sys
+import json
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SVG_GENERATOR_DIR = SCRIPT_DIR.parent / "svg_generator"
+for path in (SCRIPT_DIR, SVG_GENERATOR_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from cli_options import pop_flag, pop_int_option, pop_option
+from extract_centerline import arc_lengths, resample_to_count
+
+
+ASSETS_DIR = SCRIPT_DIR.parent.parent / "lib" / "assets" / "phontics_assets_points"
+ASSET_FOLDERS = {
+    "telugu": "telugu_phontics",
+    "hindi": "hindi_phontics",
+    "arabic": "arabic_phontics",
+    "english": "english_phontics",
+    "english_upper": "english_upper_phonetics",
+    "numbers": "numbers_phontics",
+    "math_shapes": "math_shapes",
+}
+POINTS_SUFFIX = "_PointsInfo.json"
+CUSTOM_POSITIONS_SUFFIX = "_custom_positions.json"
+
+# Points a stroke keeps at least (fewer only if it had fewer)
+MIN_STROKE_POINTS = 2
+
+# Turn (degrees) above which a point is a corner and is kept in place
+CORNER_ANGLE = 10.0
+
+# Largest allowed move of the stroke shape, fraction of the longer side
+DEFAULT_MAX_DEVIATION = 0.01
+
+
+def parse_points(points):
+    """["x,y", ...] -> (N, 2) float array."""
+    return np.array([[float(v) for v in point.split(",")] for point in points],
+                    dtype=float).reshape(-1, 2)
+
+
+def format_points(points):
+    return [f"{x:.4f},{y:.4f}" for x, y in points]
+
+
+def letter_aspect(points_file):
+    """(width, height) scale of a letter's 0..1 space, from custom_positions.
+
+    `ka_big_PointsInfo.json` looks for `ka_custom_positions.json` next to
+    it; without one (or its svgBounds) the space is taken as square.
+    """
+    base = os.path.basename(points_file)[:-len(POINTS_SUFFIX)]
+    for size in ("_big", "_small"):
+        if base.endswith(size):
+            base = base[:-len(size)]
+            break
+    custom = os.path.join(os.path.dirname(points_file), base + CUSTOM_POSITIONS_SUFFIX)
+    try:
+        with open(custom, "r", encoding="utf-8") as f:
+            bounds = json.load(f).get("svgBounds") or {}
+        width, height = float(bounds["width"]), float(bounds["height"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return 1.0, 1.0
+    if width <= 0 or height <= 0:
+        return 1.0, 1.0
+    longer = max(width, height)
+    return width / longer, height / longer
+
+
+def allocate_budget(lengths, wanted, budget):
+    """Share a letter's point budget between its strokes by length.
+
+    Args:
+        lengths: stroke lengths
+        wanted: points each stroke would get without the budget
+        budget: max points for the letter, or None
+
+    Returns:
+        list of point counts, each <= wanted and >= min(wanted, 2)
+    """
+    wanted = np.asarray(wanted, dtype=int)
+    if budget is None or wanted.sum() <= budget:
+        return wanted.tolist()
+
+    floor = np.minimum(wanted, MIN_STROKE_POINTS)
+    lengths = np.asarray(lengths, dtype=float)
+    total = lengths.sum()
+    share = budget * (lengths / total if total > 0 else np.full(len(lengths), 1 / len(lengths)))
+    counts = np.clip(np.floor(share).astype(int), floor, wanted)
+
+    # Hand out what is left by largest remainder, within each stroke's want
+    spare = budget - counts.sum()
+    if spare > 0:
+        for i in np.argsort(-(share - np.floor(share)), kind="stable"):
+            if spare <= 0:
+                break
+            if counts[i] < wanted[i]:
+                counts[i] += 1
+                spare -= 1
+    # Take back from the longest-served strokes if the floors overshot
+    while counts.sum() > budget and (counts > floor).any():
+        i = int(np.argmax(np.where(counts > floor, counts - share, -np.inf)))
+        counts[i] -= 1
+    return counts.tolist()
+
+
+def turn_angles(points):
+    """Turn in degrees at every point of a polyline.
+
+    0 at the ends and wherever a neighbouring segment has no length.
+    """
+    turns = np.zeros(len(points))
+    if len(points) < 3:
+        return turns
+    segments = np.diff(points, axis=0)
+    before, after = segments[:-1], segments[1:]
+    norms = np.hypot(*before.T) * np.hypot(*after.T)
+    cos = np.einsum("ij,ij->i", before, after) / np.where(norms > 0, norms, 1.0)
+    turns[1:-1] = np.where(norms > 0, np.degrees(np.arccos(np.clip(cos, -1.0, 1.0))), 0.0)
+    return turns
+
+
+def corner_indices(points, count, corner_angle=CORNER_ANGLE):
+    """Indices of the points kept in place: both ends plus the corners.
+
+    Only the sharpest corners are kept when count points cannot hold them
+    all.
+    """
+    turns = turn_angles(points)
+    corners = np.flatnonzero(turns > corner_angle)
+    if len(corners) > count - 2:
+        corners = np.sort(corners[np.argsort(-turns[corners], kind="stable")[:max(count - 2, 0)]])
+    return [0] + corners.tolist() + [len(points) - 1]
+
+
+def resample_between_corners(points, count, distance, corners):
+    """count points, evenly spaced by arc length between consecutive corners.
+
+    The points left over after the corners are shared out between the
+    sections by length (largest remainder).
+    """
+    lengths = np.diff(distance[corners])
+    spare = count - len(corners)
+    total = lengths.sum()
+    share = spare * lengths / total if total > 0 else np.zeros(len(lengths))
+    inner = np.floor(share).astype(int)
+    for i in np.argsort(-(share - inner), kind="stable")[:spare - inner.sum()]:
+        inner[i] += 1
+
+    pieces = []
+    for (start, end), extra in zip(zip(corners[:-1], corners[1:]), inner):
+        section = resample_to_count(points[start:end + 1], extra + 2,
+                                    distance[start:end + 1] - distance[start])
+        pieces.append(section[:-1])
+    pieces.append(points[-1:])
+    return np.concatenate(pieces)
+
+
+def shape_deviation(original, resampled, aspect=(1.0, 1.0)):
+    """Largest distance from a point of original to the resampled polyline.
+
+    Both are (N, 2) arrays in 0..1; distances are in units of the letter's
+    longer side.
+    """
+    if not len(original):
+        return 0.0
+    scale = np.array(aspect)
+    points = original * scale
+    line = resampled * scale
+    if len(line) < 2:
+        return float(np.hypot(*(points - line[:1]).T).max()) if len(line) else 0.0
+    start, end = line[:-1], line[1:]
+    direction = end - start
+    lengths = np.einsum("ij,ij->i", direction, direction)
+    offsets = points[:, None, :] - start[None, :, :]
+    t = np.clip(np.einsum("pij,ij->pi", offsets, direction) / np.where(lengths > 0, lengths, 1.0),
+                0.0, 1.0)
+    nearest = start[None, :, :] + t[:, :, None] * direction[None, :, :]
+    return float(np.hypot(*(points[:, None, :] - nearest).transpose(2, 0, 1)).min(axis=1).max())
+
+
+def resample_strokes(strokes, aspect=(1.0, 1.0), max_points=None, stroke_points=None,
+                     spacing=None):
+    """Evenly spaced, budgeted copies of strokes ((N, 2) arrays in 0..1).
+
+    Corners (see corner_indices) stay where they are; the points between
+    them are evenly spaced.
+
+    Returns:
+        list of (M, 2) arrays
+    """
+    scale = np.array(aspect)
+    distances = [arc_lengths(stroke * scale) if len(stroke) > 1 else np.zeros(1)
+                 for stroke in strokes]
+    lengths = [distance[-1] for distance in distances]
+
+    wanted = []
+    for stroke, length in zip(strokes, lengths):
+        count = len(stroke)
+        if spacing and count > 1:
+            count = max(int(round(length / spacing)), 1) + 1
+        if stroke_points:
+            count = min(count, max(stroke_points, MIN_STROKE_POINTS))
+        if len(stroke) > 1 and length == 0:
+            count = 1
+        wanted.append(count)
+
+    counts = allocate_budget(lengths, wanted, max_points)
+    result = []
+    for stroke, distance, count in zip(strokes, distances, counts):
+        if len(stroke) < 2 or count < 2:
+            result.append(stroke[:1].copy() if len(stroke) else stroke)
+        else:
+            corners = corner_indices(stroke * scale, count)
+            result.append(resample_between_corners(stroke, count, distance, corners))
+    return result
+
+
+def write_json(path, data, compact):
+    with open(path, "w", encoding="utf-8") as f:
+        if compact:
+            json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+        else:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def resample_file(points_file, output_file=None, dry_run=False,
+                  max_deviation=DEFAULT_MAX_DEVIATION, **options):
+    """Resample one PointsInfo file.
+
+    Nothing is written when the shape would move by more than max_deviation.
+
+    Returns:
+        (points before, points after, shape deviation, written)
+    """
+    with open(points_file, "r", encoding="utf-8") as f:
+        text = f.read()
+    data = json.loads(text)
+    strokes = [parse_points(stroke.get("points", [])) for stroke in data.get("strokes", [])]
+    before = sum(len(stroke) for stroke in strokes)
+
+    aspect = letter_aspect(points_file)
+    resampled = resample_strokes(strokes, aspect, **options)
+    after = sum(len(stroke) for stroke in resampled)
+    deviation = max((shape_deviation(stroke, points, aspect)
+                     for stroke, points in zip(strokes, resampled)), default=0.0)
+    if deviation > max_deviation:
+        return before, after, deviation, False
+
+    if not dry_run:
+        for stroke, points in zip(data["strokes"], resampled):
+            stroke["points"] = format_points(points)
+        output_file = output_file or points_file
+        os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+        write_json(output_file, data, compact="\n" not in text.strip())
+    return before, after, deviation, not dry_run
+
+
+def points_files(target):
+    """(group name, file) pairs for a script key, 'all', a folder or a file."""
+    if target.lower() == "all":
+        return [pair for key in ASSET_FOLDERS for pair in points_files(key)]
+    folder = ASSET_FOLDERS.get(target.lower())
+    if folder:
+        folder = ASSETS_DIR / folder
+    elif os.path.isfile(target):
+        return [(os.path.basename(os.path.dirname(os.path.abspath(target))), target)]
+    else:
+        folder = Path(target)
+    if not folder.is_dir():
+        return []
+    return [(folder.name, str(p)) for p in sorted(folder.glob(f"*{POINTS_SUFFIX}"))]
+
+
+def print_report(rows):
+    """Before/after point counts per asset folder.
+
+    Args:
+        rows: [(group, name, before, after), ...]
+    """
+    groups = {}
+    for group, name, before, after in rows:
+        groups.setdefault(group, []).append((name, before, after))
+
+    print(f"\n{'folder':<26}{'files':>6}{'points':>16}{'mean/file':>16}{'max/file':>14}")
+    totals = [0, 0]
+    for group, items in groups.items():
+        before = [b for _, b, _ in items]
+        after = [a for _, _, a in items]
+        totals[0] += sum(before)
+        totals[1] += sum(after)
+        print(f"{group:<26}{len(items):>6}"
+              f"{sum(before):>8} -> {sum(after):<5}"
+              f"{sum(before) / len(items):>8.1f} -> {sum(after) / len(items):<5.1f}"
+              f"{max(before):>6} -> {max(after):<5}")
+    print(f"{'total':<26}{len(rows):>6}{totals[0]:>8} -> {totals[1]:<5}")
+
+    worst = sorted(rows, key=lambda row: -row[3])[:5]
+    print("\nMost points after resampling: "
+          + ", ".join(f"{group}/{name} ({after})" for group, name, _, after in worst))
+
+
+def main():
+    argv = sys.argv
+    max_points = pop_int_option(argv, "--max-points")
+    stroke_points = pop_int_option(argv, "--stroke-points")
+    spacing = pop_option(argv, "--spacing")
+    spacing = float(spacing) if spacing else None
+    max_deviation = float(pop_option(argv, "--max-deviation", DEFAULT_MAX_DEVIATION))
+    dry_run = pop_flag(argv, "--dry-run")
+
+    if len(argv) < 2:
+        print("Usage: python3 resample_points.py <script|all|folder|file> [output_dir]"
+              " [--max-points N] [--stroke-points N] [--spacing F] [--max-deviation F] [--dry-run]")
+        print("Example: python3 resample_points.py all --max-points 40 --dry-run")
+        sys.exit(1)
+
+    files = points_files(argv[1])
+    output_dir = argv[2] if len(argv) > 2 else None
+    if not files:
+        print(f"Error: No *{POINTS_SUFFIX} files for '{argv[1]}'")
+        sys.exit(1)
+
+    options = {"max_points": max_points, "stroke_points": stroke_points, "spacing": spacing}
+    described = ", ".join(f"{k.replace('_', '-')} {v:g}" for k, v in options.items() if v)
+    print(f"Resampling {len(files)} file(s)" + (f" ({described})" if described else "")
+          + (" [dry run]" if dry_run else "") + "...")
+
+    rows = []
+    failed = refused = written = 0
+    for group, points_file in files:
+        name = os.path.basename(points_file)[:-len(POINTS_SUFFIX)]
+        output_file = os.path.join(output_dir, group, os.path.basename(points_file)) if output_dir else None
+        try:
+            before, after, deviation, wrote = resample_file(
+                points_file, output_file, dry_run, max_deviation, **options)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"  ✗ {group}/{name}: {e}")
+            failed += 1
+            continue
+        if deviation > max_deviation:
+            print(f"  ✗ {group}/{name}: shape would move by {deviation:.4f} "
+                  f"(over --max-deviation {max_deviation:g}); left unchanged")
+            refused += 1
+        written += wrote
+        rows.append((group, name, before, after))
+
+    if rows:
+        print_report(rows)
+    if not dry_run:
+        print(f"\n✓ Rewrote {written} file(s)" + (f" into {output_dir}" if output_dir else ""))
+    if refused:
+        print(f"✗ {refused} file(s) would change shape; use a larger budget or --max-deviation")
+    if failed:
+        print(f"✗ {failed} file(s) could not be read")
+    if failed or refused:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+batch_extract.py - Extract every letter of one or more scripts across a process pool
+
+Letters (and whole scripts) are split into chunks that run in worker
+processes. Each worker parses a font once, draws and normalizes its letters,
+and returns the path strings; the parent process writes all the
+`_extracted.svg` / `_path.txt` outputs. Regenerating every script therefore
+takes about as long as the slowest worker instead of the sum of all of them.
+
+Usage:
+  python3 tools/svg_generator/batch_extract.py [telugu|hindi|all] [--jobs N] [--no-cache] [--axis TAG=VALUE ...]
+
+  Examples:
+    # Regenerate Telugu and Hindi letters with one worker per CPU
+    python3 tools/svg_generator/batch_extract.py all
+
+    # Only Hindi, on 4 workers
+    python3 tools/svg_generator/batch_extract.py hindi --jobs 4
+
+    # Variable fonts drawn at wght=300 (static instance cached, see font_instance.py)
+    python3 tools/svg_generator/batch_extract.py hindi --axis wght=300
+
+The per-script `all` modes accept the same flag:
+  python3 tools/svg_generator/extract_hindi_svg.py all --jobs 4
+
+Dependencies: fonttools, requests, numpy (optional, for batch normalization)
+"""
+
+import sys
+import os
+import hashlib
+import importlib
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from cli_options import pop_flag, pop_int_option, pop_list_option
+from extraction_cache import codepoint_key, open_glyph_cache
+from font_instance import instance_font_source, parse_axis_options
+from font_session import LazyFontSession
+from path_ir import serialize_path
+from path_numpy import normalize_batch
+
+
+# Script key -> (extractor module, letter table, default output dir)
+SCRIPTS = {
+    'telugu': ('extract_telugu_svg', 'TELUGU_LETTERS', 'tools/svg_generator/output'),
+    'hindi': ('extract_hindi_svg', 'HINDI_LETTERS', 'tools/svg_generator/out_hin'),
+}
+
+# One script's worth of work: which font to use and where outputs go.
+# font_bytes may be None when font_path is set (workers then map the file
+# themselves instead of receiving the bytes through a pipe).
+BatchJob = namedtuple('BatchJob', ['script', 'font_bytes', 'font_path', 'output_dir'])
+
+# Per-process caches of open font sessions and glyph caches, keyed by
+# (script, font source)
+_SESSIONS = {}
+_GLYPH_CACHES = {}
+
+
+def load_script_module(script):
+    """Import the extractor module for a script key."""
+    return importlib.import_module(SCRIPTS[script][0])
+
+
+def script_letters(script):
+    """Return the sorted letter names for a script key."""
+    module = load_script_module(script)
+    return sorted(getattr(module, SCRIPTS[script][1]).keys())
+
+
+def split_chunks(names, count):
+    """Split names into at most `count` contiguous, similarly sized chunks."""
+    count = max(1, min(count, len(names)))
+    size, extra = divmod(len(names), count)
+    chunks = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(names[start:end])
+        start = end
+    return [chunk for chunk in chunks if chunk]
+
+
+def _worker_session(script, font_bytes, font_path):
+    """Open (once per worker process) the font session for a script.
+
+    The session is lazy: a worker whose letters are all cached never parses
+    the font.
+    """
+    key = (script, font_path or hashlib.sha256(font_bytes).hexdigest())
+    session = _SESSIONS.get(key)
+    if session is None:
+        module = load_script_module(script)
+
+        def open_session():
+            # Fonts on disk are memory-mapped by the session (font_loader.py)
+            return module.open_font_session(font_bytes, font_path)
+
+        session = LazyFontSession(open_session)
+        _SESSIONS[key] = session
+    return session
+
+
+def _worker_glyph_cache(script, font_bytes, font_path, use_cache):
+    """Bind (once per worker process) the extraction cache for a script's font."""
+    if not use_cache:
+        return None
+    key = (script, font_path or hashlib.sha256(font_bytes).hexdigest())
+    if key not in _GLYPH_CACHES:
+        _GLYPH_CACHES[key] = open_glyph_cache(font_bytes, font_path)
+    return _GLYPH_CACHES[key]
+
+
+def extract_chunk(script, font_bytes, font_path, names, use_cache=True):
+    """Worker entry point: draw and normalize a chunk of letters.
+
+    Cache misses are drawn into PathIRs first (no SVG strings) and then
+    normalized together in one path_numpy.normalize_batch call instead of
+    one glyph at a time.
+
+    Returns:
+        (script, [(letter_name, normalized_path_or_None), ...])
+    """
+    module = load_script_module(script)
+    table = getattr(module, SCRIPTS[script][1])
+    session = _worker_session(script, font_bytes, font_path)
+    glyph_cache = _worker_glyph_cache(script, font_bytes, font_path, use_cache)
+
+    paths = {}
+    drawn = []
+    for name in names:
+        key = codepoint_key(table[name])
+        cached = glyph_cache.get(key) if glyph_cache is not None else None
+        if cached:
+            paths[name] = cached
+            continue
+        result = session.draw_ir(table[name])
+        if result:
+            drawn.append((name, result[0]))
+        else:
+            paths[name] = None
+
+    if drawn:
+        normalized = normalize_batch([ir for _, ir in drawn], em=session.em)
+        for (name, _), ir in zip(drawn, normalized):
+            paths[name] = serialize_path(ir)
+            if glyph_cache is not None:
+                glyph_cache.put(codepoint_key(table[name]), paths[name])
+
+    return script, [(name, paths[name]) for name in names]
+
+
+def run_batch(batch_jobs, jobs=None, letters=None, use_cache=True):
+    """Extract all letters of every BatchJob across a pool of `jobs` processes.
+
+    Args:
+        batch_jobs: list of BatchJob (one per script)
+        jobs: number of worker processes (defaults to the CPU count)
+        letters: optional {script: [names]} to restrict the letters per script
+        use_cache: read/write the on-disk extraction cache (extraction_cache.py)
+
+    Returns:
+        True if every letter was extracted
+    """
+    jobs = jobs or os.cpu_count() or 1
+    outputs = {job.script: job for job in batch_jobs}
+
+    # Split every script into chunks; a script's share of the chunks is
+    # proportional to its letter count so workers get similar amounts of work.
+    names_by_script = {
+        job.script: (letters or {}).get(job.script) or script_letters(job.script)
+        for job in batch_jobs
+    }
+    total = sum(len(names) for names in names_by_script.values()) or 1
+    tasks = []
+    for job in batch_jobs:
+        names = names_by_script[job.script]
+        share = max(1, round(jobs * len(names) / total))
+        for chunk in split_chunks(names, share):
+            # Send bytes only when there is no file the worker could read
+            font_bytes = job.font_bytes if not job.font_path else None
+            tasks.append((job.script, font_bytes, job.font_path, chunk, use_cache))
+
+        # Hash each font once up front so workers find the digest memoized
+        if use_cache:
+            open_glyph_cache(job.font_bytes, job.font_path)
+
+    print(f"\nExtracting {total} letters from {len(batch_jobs)} script(s) "
+          f"in {len(tasks)} chunk(s) on {jobs} worker(s)...")
+
+    succeeded = {script: 0 for script in names_by_script}
+
+    def write_results(script, results):
+        module = load_script_module(script)
+        output_dir = outputs[script].output_dir
+        for name, normalized_path in results:
+            print(f"\n[{script}] {name}")
+            if not normalized_path:
+                print(f"  ✗ Failed to extract glyph")
+                continue
+            module.save_letter_outputs(name, normalized_path, output_dir)
+            succeeded[script] += 1
+
+    if jobs == 1:
+        for task in tasks:
+            write_results(*extract_chunk(*task))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(extract_chunk, *task) for task in tasks]
+            for future in as_completed(futures):
+                write_results(*future.result())
+
+    all_ok = True
+    print()
+    for script, names in names_by_script.items():
+        print(f"✓ [{script}] Successfully extracted {succeeded[script]}/{len(names)} letters")
+        all_ok = all_ok and succeeded[script] == len(names)
+    return all_ok
+
+
+def main():
+    jobs = pop_int_option(sys.argv, '--jobs', default=os.cpu_count() or 1)
+    use_cache = not pop_flag(sys.argv, '--no-cache')
+    axis_location = parse_axis_options(pop_list_option(sys.argv, '--axis'))
+
+    if len(sys.argv) < 2:
+        print("Usage: python3 batch_extract.py [telugu|hindi|all] [--jobs N] [--no-cache] [--axis TAG=VALUE ...]")
+        print(f"\nAvailable scripts: {', '.join(SCRIPTS.keys())}")
+        sys.exit(1)
+
+    which = sys.argv[1].lower()
+    if which == 'all':
+        scripts = list(SCRIPTS.keys())
+    elif which in SCRIPTS:
+        scripts = [which]
+    else:
+        print(f"Error: Unknown script '{which}'")
+        print(f"Available scripts: {', '.join(SCRIPTS.keys())}, all")
+        sys.exit(1)
+
+    batch_jobs = []
+    for script in scripts:
+        print(f"\n[{script}] Resolving font...")
+        module = load_script_module(script)
+        font_bytes, font_path = module.load_font_source()
+        font_bytes, font_path = instance_font_source(font_bytes, font_path, axis_location)
+        batch_jobs.append(BatchJob(script, font_bytes, font_path, SCRIPTS[script][2]))
+
+    if not run_batch(batch_jobs, jobs=jobs, use_cache=use_cache):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+check_barakhadi_resume.py - Dev check that barakhadi reruns resume correctly
+
+extract_hindi_ligature_svg.py barakhadi resumes from progress.jsonl, which
+is tied to the run fingerprint (font, --axis location, shaper options,
+padding; see syllable_pipeline.py). This script checks both sides of that
+on one consonant's row, in a temporary folder:
+
+  1. a first run
+  2. a rerun with the same options must not rewrite any file
+  3. a rerun at wght=300 (or, for a static font, with another padding)
+     must regenerate every file
+
+Nothing is written outside the temporary folder and the extraction cache.
+
+Usage:
+  python3 tools/svg_generator/check_barakhadi_resume.py [font_path_or_url]
+
+Dependencies: fonttools, uharfbuzz
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+import extract_hindi_ligature_svg as ligature  # type: ignore
+from font_instance import instance_font_source
+
+
+def _output_state(output_dir):
+    """{file name: (mtime_ns, contents)} of a barakhadi folder's SVG and path files."""
+    state = {}
+    for name in sorted(os.listdir(output_dir)):
+        if name.endswith(("_extracted.svg", "_path.txt")):
+            path = os.path.join(output_dir, name)
+            with open(path, "rb") as f:
+                state[name] = (os.stat(path).st_mtime_ns, f.read())
+    return state
+
+
+def check_resume(font_bytes, font_path=None):
+    """Check barakhadi resume against one consonant's row in a temporary folder.
+
+    Runs it three times: a first run, a rerun with the same options (no file
+    may be rewritten) and a rerun at wght=300 for a variable font, or with
+    another padding for a static one (every file must be regenerated).
+
+    Returns:
+        True if both reruns behaved
+    """
+    syllables = ligature.barakhadi_syllables()[:len(ligature.HINDI_MATRAS)]
+    changed_bytes, changed_path = instance_font_source(font_bytes, font_path, {"wght": 300.0})
+    if (changed_bytes, changed_path) != (font_bytes, font_path):
+        change = "--axis wght=300"
+        changed = dict(font_bytes=changed_bytes, font_path=changed_path,
+                       location={"wght": 300.0})
+    else:
+        change = "padding 0.2"
+        changed = dict(font_bytes=font_bytes, font_path=font_path, padding=0.2)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        ok = ligature.extract_barakhadi(font_bytes, output_dir, font_path, jobs=1, syllables=syllables)
+        first = _output_state(output_dir)
+        ok = ligature.extract_barakhadi(font_bytes, output_dir, font_path, jobs=1,
+                               syllables=syllables) and ok
+        rerun = _output_state(output_dir)
+        ok = ligature.extract_barakhadi(output_dir=output_dir, jobs=1, syllables=syllables,
+                               **changed) and ok
+        after_change = _output_state(output_dir)
+
+    if not ok or not first:
+        print("\n✗ Barakhadi run failed")
+        return False
+    rewritten = [name for name in first if rerun.get(name) != first[name]]
+    if rewritten:
+        print(f"\n✗ Rerun with the same options rewrote {len(rewritten)} file(s), "
+              f"e.g. {rewritten[0]}")
+        return False
+    kept = [name for name in first if after_change.get(name, first[name])[1] == first[name][1]]
+    if kept:
+        print(f"\n✗ Rerun with {change} kept {len(kept)} old file(s), e.g. {kept[0]}")
+        return False
+    print(f"\n✓ Rerun with the same options kept all {len(first)} file(s); "
+          f"rerun with {change} regenerated them")
+    return True
+
+
+def main():
+    font_arg = sys.argv[1] if len(sys.argv) > 1 else None
+    font_bytes, font_path = ligature.load_font(font_arg)
+    if not check_resume(font_bytes, font_path):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+cli_options.py - Tiny helpers for optional --flags on the positional CLIs
+
+The extractor scripts take positional arguments (letter, font, output dir).
+These helpers pull optional flags such as `--jobs 4` out of argv first, so
+the positional parsing in each script stays exactly as it was.
+"""
+
+
+def pop_flag(argv, name):
+    """Remove a boolean flag (e.g. --no-cache) from argv and report if it was set."""
+    found = False
+    while name in argv:
+        argv.remove(name)
+        found = True
+    return found
+
+
+def pop_option(argv, name, default=None):
+    """Remove `name VALUE` or `name=VALUE` from argv and return VALUE.
+
+    If the option is given more than once, the last value wins.
+    """
+    value = default
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == name:
+            if i + 1 >= len(argv):
+                raise SystemExit(f"Error: {name} needs a value")
+            value = argv[i + 1]
+            del argv[i:i + 2]
+            continue
+        if arg.startswith(name + "="):
+            value = arg[len(name) + 1:]
+            del argv[i]
+            continue
+        i += 1
+    return value
+
+
+def pop_list_option(argv, name):
+    """Like pop_option, but for repeatable options: returns every VALUE in order."""
+    values = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == name:
+            if i + 1 >= len(argv):
+                raise SystemExit(f"Error: {name} needs a value")
+            values.append(argv[i + 1])
+            del argv[i:i + 2]
+            continue
+        if arg.startswith(name + "="):
+            values.append(arg[len(name) + 1:])
+            del argv[i]
+            continue
+        i += 1
+    return values
+
+
+def pop_int_option(argv, name, default=None):
+    """Like pop_option, but converts the value to an int."""
+    value = pop_option(argv, name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise SystemExit(f"Error: {name} expects an integer, got '{value}'")
@@ -7,14 +7,14 @@ Since these are composite characters, we extract:
 - ం (U+0C02) - anusvara for 'am'  
 - ః (U+0C03) - visarga for 'aha'
 
-Then combine them properly.
+Then combine them properly: the diacritic is placed where the font's GPOS
+anchors put it, or after the base's advance width when it is a spacing mark
+(mark_attach.py).
 """
 
 import sys
 import os
-import io
-import re
-import glob
+from pathlib import Path
 
 try:
     from fontTools.ttLib import TTFont
@@ -24,19 +24,26 @@ except ImportError:
     print("Error: Install fonttools: pip3 install fonttools requests")
     sys.exit(1)
 
+SCRIPT_DIR = Path(__file__).resolve().parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from font_catalog import find_font as find_font_face
+from font_loader import open_font
+from mark_attach import mark_attacher_for
+from path_ir import serialize_path, translate_path
+
 # Unicode values
 A_BASE = 0x0C05  # అ
 ANUSVARA = 0x0C02  # ం
 VISARGA = 0x0C03  # ః
 
 def find_font():
-    """Find Telugu font."""
-    workspace_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    """Find Telugu font (downloaded_font.ttf first, then the font catalog)."""
+    workspace_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     font_path = os.path.join(workspace_root, "downloaded_font.ttf")
-    if os.path.isfile(font_path):
-        return font_path
-    return None
-
+    face = find_font_face('telugu', prefer_paths=[font_path], prefer_families=('Telugu',))
+    return face.path if face else None
 def extract_glyph(font, codepoint):
     """Extract single glyph path."""
     try:
@@ -68,106 +75,37 @@ def extract_glyph(font, codepoint):
             print(f"  ✗ Empty path for glyph {glyph_name}")
             return None
         
-        # Get glyph metrics
-        width = 0
-        try:
-            if 'hmtx' in font:
-                width = font['hmtx'].metrics[glyph_name][0]
-        except (KeyError, AttributeError):
-            # If metrics not found, estimate from bounding box
-            width = 500  # Default estimate
+        # Advance width from hmtx (the ink's right edge if there is none)
+        width = mark_attacher_for(font).advance(glyph_name)
         
         em = font['head'].unitsPerEm if 'head' in font else 1000
         
         print(f"  ✓ Extracted {glyph_name}: width={width}, em={em}")
-        return path_d, width, em
+        return path_d, width, em, glyph_name
     except Exception as e:
         import traceback
         print(f"  ✗ Error extracting glyph U+{codepoint:04X}: {e}")
         print(f"  Traceback: {traceback.format_exc()}")
         return None
 
-def translate_path_x(path_d, x_offset):
-    """Translate all X coordinates by x_offset."""
-    def transform_coord(match):
-        cmd = match.group(1)
-        args = match.group(2) if match.group(2) else ""
-        cmd_upper = cmd.upper()
-        
-        if not args:
-            return cmd
-        
-        nums = re.findall(r'([-+]?\d*\.?\d+)', args)
-        transformed = []
-        
-        if cmd_upper == 'H':
-            # Horizontal: only X
-            for num in nums:
-                try:
-                    transformed.append(f"{float(num) + x_offset:.2f}")
-                except:
-                    transformed.append(num)
-        elif cmd_upper == 'V':
-            # Vertical: only Y, no change
-            transformed = nums
-        elif cmd_upper in ['M', 'L', 'T']:
-            # (x, y) pairs
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i % 2 == 0:  # X
-                        val += x_offset
-                    transformed.append(f"{val:.2f}")
-                except:
-                    transformed.append(num)
-        elif cmd_upper == 'C':
-            # Cubic: (x1, y1, x2, y2, x, y)
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [0, 2, 4]:  # X coords
-                        val += x_offset
-                    transformed.append(f"{val:.2f}")
-                except:
-                    transformed.append(num)
-        elif cmd_upper == 'S':
-            # Smooth cubic: (x2, y2, x, y)
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [0, 2]:  # X coords
-                        val += x_offset
-                    transformed.append(f"{val:.2f}")
-                except:
-                    transformed.append(num)
-        elif cmd_upper == 'Q':
-            # Quadratic: (x1, y1, x, y)
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [0, 2]:  # X coords
-                        val += x_offset
-                    transformed.append(f"{val:.2f}")
-                except:
-                    transformed.append(num)
-        else:
-            transformed = nums
-        
-        return f"{cmd} {' '.join(transformed)}"
-    
-    return re.sub(r'([MmLlHhVvCcSsQqTtAaZz])\s*([-\d.,\s]*)', transform_coord, path_d)
-
 def normalize_path(path_d, em=1000, padding=0.1):
     """Normalize path to fit in viewBox."""
     # This is a simplified version - use the full normalize from extract_telugu_svg.py for production
     # For now, return as-is since fonts usually have reasonable coordinates
     return path_d
 
-def combine_paths(base_path, diacritic_path, base_width):
+def diacritic_offset(font, base_glyph, diacritic_glyph):
+    """(dx, dy) of the diacritic relative to the base, from mark_attach.py.
+    
+    Telugu anusvara/visarga are spacing marks, so this is normally the base's
+    advance width; a font that anchors them in GPOS gets anchor placement.
+    """
+    placed = mark_attacher_for(font).layout([base_glyph, diacritic_glyph])[-1]
+    return placed.x, placed.y
+
+def combine_paths(base_path, diacritic_path, dx, dy=0):
     """Combine base and diacritic paths."""
-    # For anusvara/visarga, they typically go to the right of the base character
-    # Translate diacritic by base_width
-    translated_diacritic = translate_path_x(diacritic_path, base_width)
+    translated_diacritic = serialize_path(translate_path(diacritic_path, dx, dy))
     return f"{base_path} {translated_diacritic}"
 
 def save_files(path_d, letter_name, output_dir):
@@ -201,7 +139,7 @@ def extract_am(font, output_dir):
         print("  ✗ Failed to extract base 'a'")
         return False
     
-    base_path, base_width, em = base_result
+    base_path, base_width, em, base_glyph = base_result
     
     # Extract anusvara
     print("  Extracting anusvara (U+0C02)...")
@@ -210,11 +148,12 @@ def extract_am(font, output_dir):
         print("  ✗ Failed to extract anusvara")
         return False
     
-    anusvara_path, anusvara_width, _ = anusvara_result
+    anusvara_path, anusvara_width, _, anusvara_glyph = anusvara_result
     
-    # Combine paths - place anusvara to the right of base
-    print(f"  Combining paths (base width: {base_width})...")
-    combined = combine_paths(base_path, anusvara_path, base_width)
+    # Combine paths - place anusvara where the font attaches it (right of base)
+    dx, dy = diacritic_offset(font, base_glyph, anusvara_glyph)
+    print(f"  Combining paths (base width: {base_width}, anusvara at dx={dx}, dy={dy})...")
+    combined = combine_paths(base_path, anusvara_path, dx, dy)
     normalized = normalize_path(combined, em)
     
     save_files(normalized, 'am', output_dir)
@@ -231,7 +170,7 @@ def extract_aha(font, output_dir):
         print("  ✗ Failed to extract base 'a'")
         return False
     
-    base_path, base_width, em = base_result
+    base_path, base_width, em, base_glyph = base_result
     
     # Extract visarga
     print("  Extracting visarga (U+0C03)...")
@@ -240,11 +179,12 @@ def extract_aha(font, output_dir):
         print("  ✗ Failed to extract visarga")
         return False
     
-    visarga_path, visarga_width, _ = visarga_result
+    visarga_path, visarga_width, _, visarga_glyph = visarga_result
     
-    # Combine paths - place visarga to the right of base
-    print(f"  Combining paths (base width: {base_width})...")
-    combined = combine_paths(base_path, visarga_path, base_width)
+    # Combine paths - place visarga where the font attaches it (right of base)
+    dx, dy = diacritic_offset(font, base_glyph, visarga_glyph)
+    print(f"  Combining paths (base width: {base_width}, visarga at dx={dx}, dy={dy})...")
+    combined = combine_paths(base_path, visarga_path, dx, dy)
     normalized = normalize_path(combined, em)
     
     save_files(normalized, 'aha', output_dir)
@@ -261,7 +201,7 @@ def main():
         sys.exit(1)
     
     print(f"Using font: {font_path}")
-    font = TTFont(font_path)
+    font = open_font(font_path)
     
     # Extract both
     success_am = extract_am(font, output_dir)
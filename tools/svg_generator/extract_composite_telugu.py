@@ -3,15 +3,24 @@
 extract_composite_telugu.py - Extract composite Telugu characters (అం, అః) as SVG paths
 
 Usage:
-  python3 tools/svg_generator/extract_composite_telugu.py [am|aha|both]
+  python3 tools/svg_generator/extract_composite_telugu.py [am|aha|ksha|all] [output_dir]
+  python3 tools/svg_generator/extract_composite_telugu.py generate [guninthalu|conjuncts|all] [output_dir] [--jobs N] [--restart]
 
 This script extracts composite Telugu characters by rendering the full Unicode string.
+
+The generate mode builds syllables in bulk from TELUGU_LETTERS:
+  guninthalu  every consonant x vowel sign (plus anusvara and visarga),
+              named like ka_aa, ka_am
+  conjuncts   every consonant + virama + consonant, named like k_ssa
+They are shaped with HarfBuzz (one Shaper per worker, see shaper.py) and
+streamed through syllable_pipeline.py: outputs are written as they are
+produced, progress.jsonl lets an interrupted run resume, and manifest.json
+lists everything. Output goes to tools/svg_generator/output/syllables by
+default. generate additionally needs uharfbuzz.
 """
 
 import sys
 import os
-import io
-import re
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -21,12 +30,25 @@ try:
     from fontTools.ttLib import TTFont
     from fontTools.pens.svgPathPen import SVGPathPen
     from fontTools.pens.recordingPen import RecordingPen
-    import requests
 except ImportError:
     print("Error: Required packages not installed")
     print("Install with: pip3 install fonttools requests")
     sys.exit(1)
 
+SCRIPT_DIR = Path(__file__).resolve().parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from cli_options import pop_flag, pop_int_option
+from extract_telugu_svg import TELUGU_LETTERS
+from font_catalog import find_font
+from font_loader import open_font
+from font_store import fetch_font
+from ligature_index import ligature_index_for
+from mark_attach import mark_attacher_for
+from path_ir import normalize_path as normalize_ir_path, serialize_path, translate_path
+from syllable_pipeline import Syllable, run_pipeline
+
 # Composite Telugu characters
 COMPOSITE_CHARS = {
     'am': 'అం',   # అ (U+0C05) + ం (U+0C02 anusvara)
@@ -34,6 +56,29 @@ COMPOSITE_CHARS = {
     'ksha': 'క్ష',  # క (U+0C15) + ్ (U+0C4D virama) + ష (U+0C37 sha)
 }
 
+# Dependent vowel signs, keyed by the vowel names used in TELUGU_LETTERS,
+# plus anusvara (am) and visarga (aha)
+TELUGU_VOWEL_SIGNS = {
+    'aa': '\u0C3E',   # ా
+    'i': '\u0C3F',    # ి
+    'ii': '\u0C40',   # ీ
+    'u': '\u0C41',    # ు
+    'uu': '\u0C42',   # ూ
+    'e': '\u0C46',    # ె
+    'ee': '\u0C47',   # ే
+    'ai': '\u0C48',   # ై
+    'o': '\u0C4A',    # ొ
+    'oo': '\u0C4B',   # ో
+    'au': '\u0C4C',   # ౌ
+    'am': '\u0C02',   # ం
+    'aha': '\u0C03',  # ః
+}
+
+TELUGU_VIRAMA = '\u0C4D'  # ్
+
+# Where the generate mode writes by default (relative to this script)
+SYLLABLES_DIR = os.path.join("output", "syllables")
+
 # Font URLs
 DEFAULT_FONT_URLS = [
     "https://github.com/google/fonts/raw/main/apache/notosanstelugu/NotoSansTelugu-Regular.ttf",
@@ -42,24 +87,20 @@ DEFAULT_FONT_URLS = [
 
 
 def find_local_font():
-    """Find local Telugu font."""
-    workspace_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    """Find local Telugu font (downloaded_font.ttf first, then the font catalog)."""
+    workspace_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     workspace_font = os.path.join(workspace_root, "downloaded_font.ttf")
-    if os.path.isfile(workspace_font):
-        return workspace_font
-    return None
+    face = find_font('telugu', prefer_paths=[workspace_font], prefer_families=('Telugu',))
+    return face.path if face else None
 
 
 def download_font(url):
-    """Download font from URL."""
-    print(f"Downloading font from: {url}")
-    try:
-        r = requests.get(url, allow_redirects=True, timeout=30)
-        r.raise_for_status()
-        return r.content
-    except Exception as e:
-        print(f"Error downloading font: {e}")
+    """Fetch a font by URL through the local font store (font_store.py)."""
+    font_path = fetch_font([url])
+    if not font_path:
         return None
+    with open(font_path, 'rb') as f:
+        return f.read()
 
 
 def process_text_with_gsub(font, text_string):
@@ -102,13 +143,27 @@ def process_text_with_gsub(font, text_string):
 
 
 def resolve_ligature(font, glyph_names, text_string):
-    """Try to resolve a ligature from GSUB table or by searching glyph names."""
-    glyph_set = font.getGlyphSet()
+    """Try to resolve a ligature from the GSUB ligature index or by searching glyph names.
     
-    # First, try to find ligature by common naming patterns
+    The index (ligature_index.py) is built once per font and covers type 4
+    lookups, extension (type 7) lookups and ligatures used from contextual
+    lookups, so this is a dict lookup rather than a walk over the GSUB table.
+    """
+    glyph_set = font.getGlyphSet()
     component_names = [name for name, _ in glyph_names]
     
-    # Try common ligature name patterns
+    try:
+        ligature_glyph = ligature_index_for(font).resolve(component_names)
+    except Exception as e:
+        print(f"    Note: Could not resolve ligature via GSUB: {e}")
+        ligature_glyph = None
+    
+    if ligature_glyph and ligature_glyph in glyph_set:
+        print(f"    Found ligature via GSUB: {ligature_glyph}")
+        print(f"      Components: {' + '.join(component_names)}")
+        return ligature_glyph
+    
+    # Then try common ligature name patterns
     potential_names = [
         '_'.join(component_names),  # ka_viramatelu_ssatelu
         ''.join([name.replace('telu', '').replace('telugu', '') for name in component_names]),  # kaviramassha
@@ -122,52 +177,17 @@ def resolve_ligature(font, glyph_names, text_string):
             print(f"    Found ligature by name pattern: {potential_name}")
             return potential_name
     
-    # Try GSUB table - search for ligatures that match our sequence
-    if 'GSUB' not in font:
-        return None
-    
-    try:
-        gsub = font['GSUB']
-        if not gsub or not gsub.table:
-            return None
-        
-        lookup_list = gsub.table.LookupList
-        if not lookup_list:
-            return None
-        
-        # Search through all lookups for ligature substitutions
-        for lookup in lookup_list.Lookup:
-            if lookup.LookupType == 4:  # Ligature substitution
-                for subtable in lookup.SubTable:
-                    # subtable.ligatures is a dict mapping first glyph to list of ligatures
-                    first_glyph = glyph_names[0][0]
-                    if first_glyph in subtable.ligatures:
-                        for ligature in subtable.ligatures[first_glyph]:
-                            # Check if components match (excluding the first one which is the key)
-                            # ligature.Component contains the remaining components
-                            if len(ligature.Component) == len(glyph_names) - 1:
-                                match = True
-                                for i, comp_glyph in enumerate(ligature.Component):
-                                    # Component[i] should match glyph_names[i+1]
-                                    if comp_glyph != glyph_names[i+1][0]:
-                                        match = False
-                                        break
-                                if match:
-                                    ligature_glyph = ligature.LigGlyph
-                                    if ligature_glyph in glyph_set:
-                                        print(f"    Found ligature via GSUB: {ligature_glyph}")
-                                        print(f"      Components: {first_glyph} + {' + '.join(ligature.Component)}")
-                                        return ligature_glyph
-    except Exception as e:
-        print(f"    Note: Could not resolve ligature via GSUB: {e}")
-    
     return None
 
 
-def extract_text_path(font_bytes, text_string):
-    """Extract SVG path for a text string, using ligatures when available."""
+def extract_text_path(font_bytes, text_string, font_path=None):
+    """Extract SVG path for a text string, using ligatures when available.
+    
+    With font_path the font is memory-mapped and opened lazily instead of
+    being parsed from font_bytes (see font_loader.py).
+    """
     try:
-        font = TTFont(io.BytesIO(font_bytes))
+        font = open_font(font_path, None if font_path else font_bytes)
         glyph_set = font.getGlyphSet()
         cmap = font.getBestCmap()
         
@@ -221,9 +241,7 @@ def extract_text_path(font_bytes, text_string):
             print(f"  No ligature found, combining component glyphs")
         
         # Fallback: Combine paths from all glyphs (but skip virama if it has no visual)
-        combined_paths = []
-        x_offset = 0
-        
+        drawn = []
         for glyph_name, char in glyph_names:
             print(f"    Processing glyph: {glyph_name} ({char})")
             glyph = glyph_set[glyph_name]
@@ -233,45 +251,20 @@ def extract_text_path(font_bytes, text_string):
             
             if path_d and path_d.strip() != 'M 0 0 Z':
                 print(f"    Path length: {len(path_d)} chars")
-                # Translate path by x_offset
-                if x_offset > 0:
-                    # Simple translation: add x_offset to all X coordinates
-                    translated_path = re.sub(
-                        r'([MmLlHhCcSsQqTtAa])\s*([-\d.,\s]+)',
-                        lambda m: translate_path_command(m.group(1), m.group(2), x_offset),
-                        path_d
-                    )
-                    combined_paths.append(translated_path)
-                else:
-                    combined_paths.append(path_d)
+                drawn.append((glyph_name, path_d))
             else:
                 print(f"    ✗ Empty or invalid path for {glyph_name} (may be invisible virama)")
-            
-            # Get glyph width for next position
-            try:
-                if 'hmtx' in font:
-                    hmtx = font['hmtx']
-                    if hasattr(hmtx, 'metrics') and glyph_name in hmtx.metrics:
-                        glyph_width = hmtx.metrics[glyph_name][0]
-                        print(f"    Glyph width: {glyph_width}")
-                        # Only advance if glyph has visual content
-                        if path_d and path_d.strip() != 'M 0 0 Z':
-                            x_offset += glyph_width
-                    else:
-                        # Estimate width (rough approximation)
-                        if path_d and path_d.strip() != 'M 0 0 Z':
-                            print(f"    Using estimated width: 500")
-                            x_offset += 500
-                else:
-                    # Estimate width (rough approximation)
-                    if path_d and path_d.strip() != 'M 0 0 Z':
-                        print(f"    Using estimated width: 500")
-                        x_offset += 500
-            except (KeyError, AttributeError, IndexError) as e:
-                # Estimate width (rough approximation)
-                if path_d and path_d.strip() != 'M 0 0 Z':
-                    print(f"    Using estimated width: 500 (error: {e})")
-                    x_offset += 500
+        
+        # Place the visible glyphs: marks on their GPOS anchors, everything
+        # else after the previous glyph's advance width (mark_attach.py)
+        layout = mark_attacher_for(font).layout([glyph_name for glyph_name, _ in drawn])
+        combined_paths = []
+        for (glyph_name, path_d), placed in zip(drawn, layout):
+            print(f"    {glyph_name}: {placed.how} at ({placed.x}, {placed.y})")
+            if placed.x or placed.y:
+                combined_paths.append(serialize_path(translate_path(path_d, placed.x, placed.y)))
+            else:
+                combined_paths.append(path_d)
         
         if not combined_paths:
             print(f"  ✗ No valid paths extracted")
@@ -290,276 +283,16 @@ def extract_text_path(font_bytes, text_string):
         return None
 
 
-def translate_path_command(cmd, args, x_offset):
-    """Translate X coordinates in a path command by x_offset."""
-    if not args:
-        return cmd
-    
-    nums = re.findall(r'([-+]?\d*\.?\d+)', args)
-    translated_nums = []
-    
-    cmd_upper = cmd.upper()
-    
-    if cmd_upper == 'H':
-        # Horizontal line: only X
-        for num in nums:
-            try:
-                val = float(num) + x_offset
-                translated_nums.append(f"{val:.2f}")
-            except ValueError:
-                translated_nums.append(num)
-    elif cmd_upper == 'V':
-        # Vertical line: only Y, no translation needed
-        translated_nums = nums
-    elif cmd_upper in ['M', 'L', 'T']:
-        # (x, y) pairs - translate X (even indices)
-        for i, num in enumerate(nums):
-            try:
-                val = float(num)
-                if i % 2 == 0:  # X coordinate
-                    val += x_offset
-                translated_nums.append(f"{val:.2f}")
-            except ValueError:
-                translated_nums.append(num)
-    elif cmd_upper in ['C', 'S']:
-        # Bezier curves - translate X coordinates
-        for i, num in enumerate(nums):
-            try:
-                val = float(num)
-                # X coordinates are at indices 0, 2, 4 for C, and 0, 2 for S
-                if cmd_upper == 'C' and i in [0, 2, 4]:
-                    val += x_offset
-                elif cmd_upper == 'S' and i in [0, 2]:
-                    val += x_offset
-                translated_nums.append(f"{val:.2f}")
-            except ValueError:
-                translated_nums.append(num)
-    elif cmd_upper in ['Q']:
-        # Quadratic bezier - translate X (indices 0, 2)
-        for i, num in enumerate(nums):
-            try:
-                val = float(num)
-                if i in [0, 2]:
-                    val += x_offset
-                translated_nums.append(f"{val:.2f}")
-            except ValueError:
-                translated_nums.append(num)
-    else:
-        # For other commands, keep as is
-        translated_nums = nums
-    
-    return f"{cmd} {' '.join(translated_nums)}"
-
-
 def normalize_path(path_d, em=1000, padding=0.1):
     """
     Normalize SVG path coordinates to fit in viewBox with padding.
     Fonts use Y-up coordinates (Y increases upward), but SVG/Flutter use Y-down.
-    So we first flip Y coordinates, then normalize.
+    The Y flip and the fit are done in one pass over a parsed PathIR.
     """
-    # Step 1: Flip Y coordinates in original path
-    commands = re.findall(r'([MmLlHhVvCcSsQqTtAaZz])\s*([-\d.,\s]+)?', path_d)
-    
-    flipped_commands = []
-    for cmd, args in commands:
-        if not args or cmd.upper() == 'Z':
-            flipped_commands.append((cmd, args))
-            continue
-        
-        cmd_upper = cmd.upper()
-        nums = re.findall(r'([-+]?\d*\.?\d+)', args)
-        flipped_nums = []
-        
-        if cmd_upper == 'H':
-            # Horizontal line: only X coordinate, no Y to flip
-            flipped_nums = nums
-        elif cmd_upper == 'V':
-            # Vertical line: only Y coordinate, flip it
-            for num in nums:
-                try:
-                    val = float(num)
-                    val = em - val  # Flip Y
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'C':
-            # Cubic bezier: (x1, y1, x2, y2, x, y) - 6 numbers
-            # Flip y1, y2, and y (indices 1, 3, 5)
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [1, 3, 5]:  # Y coordinates
-                        val = em - val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'S':
-            # Smooth cubic bezier: (x2, y2, x, y) - 4 numbers
-            # Flip y2 and y (indices 1, 3)
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [1, 3]:  # Y coordinates
-                        val = em - val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'Q':
-            # Quadratic bezier: (x1, y1, x, y) - 4 numbers
-            # Flip y1 and y (indices 1, 3)
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [1, 3]:  # Y coordinates
-                        val = em - val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'T':
-            # Smooth quadratic bezier: (x, y) - 2 numbers
-            # Flip y (index 1)
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i == 1:  # Y coordinate
-                        val = em - val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'A':
-            # Arc: (rx, ry, x-axis-rotation, large-arc-flag, sweep-flag, x, y) - 7 numbers
-            # Flip ry and y (indices 1, 6)
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [1, 6]:  # ry and y coordinates
-                        val = em - val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        else:
-            # M, L, m, l: (x, y) pairs - standard case
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i % 2 == 1:  # Y coordinate (odd index)
-                        val = em - val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        
-        flipped_args = ' '.join(flipped_nums)
-        flipped_commands.append((cmd, flipped_args))
-    
-    # Step 2: Extract coordinates from flipped path for bounding box
-    coords = []
-    for cmd, args in flipped_commands:
-        if not args or cmd.upper() == 'Z':
-            continue
-        nums = re.findall(r'[-+]?\d*\.?\d+', args)
-        for num in nums:
-            try:
-                coords.append(float(num))
-            except ValueError:
-                pass
-    
-    if not coords:
-        return ' '.join([f"{cmd} {args}" if args else cmd for cmd, args in flipped_commands])
-    
-    # Find bounding box of flipped path
-    x_coords = [coords[i] for i in range(0, len(coords), 2) if i < len(coords)]
-    y_coords = [coords[i+1] for i in range(0, len(coords), 2) if i+1 < len(coords)]
-    
-    if not x_coords or not y_coords:
-        return ' '.join([f"{cmd} {args}" if args else cmd for cmd, args in flipped_commands])
-    
-    min_x, max_x = min(x_coords), max(x_coords)
-    min_y, max_y = min(y_coords), max(y_coords)
-    
-    width = max_x - min_x if max_x != min_x else em
-    height = max_y - min_y if max_y != min_y else em
-    
-    # Calculate scale and offset to fit in em x em with padding
-    scale = min(em * (1 - 2*padding) / width, em * (1 - 2*padding) / height) if width > 0 and height > 0 else 1
-    offset_x = em * padding - min_x * scale
-    offset_y = em * padding - min_y * scale
-    
-    # Step 3: Normalize the flipped path
-    def transform_coord(coord_str, is_x):
-        try:
-            val = float(coord_str)
-            if is_x:
-                return val * scale + offset_x
-            else:
-                return val * scale + offset_y
-        except ValueError:
-            return coord_str
-    
-    transformed_commands = []
-    
-    for cmd, args in flipped_commands:
-        if not args or cmd.upper() == 'Z':
-            transformed_commands.append(cmd)
-            continue
-        
-        cmd_upper = cmd.upper()
-        nums = re.findall(r'([-+]?\d*\.?\d+)', args)
-        transformed_nums = []
-        
-        if cmd_upper == 'H':
-            # Horizontal line: only X coordinate
-            for num in nums:
-                transformed_val = transform_coord(num, True)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'V':
-            # Vertical line: only Y coordinate
-            for num in nums:
-                transformed_val = transform_coord(num, False)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'C':
-            # Cubic bezier: (x1, y1, x2, y2, x, y) - 6 numbers
-            for i, num in enumerate(nums):
-                is_x = (i in [0, 2, 4])  # x1, x2, x are X coordinates
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'S':
-            # Smooth cubic bezier: (x2, y2, x, y) - 4 numbers
-            for i, num in enumerate(nums):
-                is_x = (i in [0, 2])  # x2, x are X coordinates
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'Q':
-            # Quadratic bezier: (x1, y1, x, y) - 4 numbers
-            for i, num in enumerate(nums):
-                is_x = (i in [0, 2])  # x1, x are X coordinates
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'T':
-            # Smooth quadratic bezier: (x, y) - 2 numbers
-            for i, num in enumerate(nums):
-                is_x = (i == 0)  # x is X coordinate
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'A':
-            # Arc: (rx, ry, x-axis-rotation, large-arc-flag, sweep-flag, x, y) - 7 numbers
-            for i, num in enumerate(nums):
-                is_x = (i not in [1, 6])  # Everything except ry (1) and y (6)
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        else:
-            # M, L, m, l: (x, y) pairs - standard case
-            for i, num in enumerate(nums):
-                is_x = (i % 2 == 0)
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        
-        transformed_args = ' '.join(transformed_nums)
-        transformed_commands.append(f"{cmd} {transformed_args}")
-    
-    return ' '.join(transformed_commands)
+    return normalize_ir_path(path_d, em=em, padding=padding)
 
 
-def save_svg(path_d, output_path, letter_name, char):
+def save_svg(path_d, output_path, letter_name, char, quiet=False):
     """Save SVG file."""
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
@@ -571,10 +304,11 @@ def save_svg(path_d, output_path, letter_name, char):
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(svg_content)
     
-    print(f"  ✓ Saved SVG to: {output_path}")
+    if not quiet:
+        print(f"  ✓ Saved SVG to: {output_path}")
 
 
-def extract_composite(letter_name, font_bytes, output_dir):
+def extract_composite(letter_name, font_bytes, output_dir, font_path=None):
     """Extract a composite Telugu character."""
     if letter_name not in COMPOSITE_CHARS:
         print(f"Error: Unknown composite character '{letter_name}'")
@@ -584,7 +318,7 @@ def extract_composite(letter_name, font_bytes, output_dir):
     text_string = COMPOSITE_CHARS[letter_name]
     print(f"\nExtracting {text_string} - {letter_name}...")
     
-    result = extract_text_path(font_bytes, text_string)
+    result = extract_text_path(font_bytes, text_string, font_path)
     
     if not result:
         print(f"  ✗ Failed to extract")
@@ -608,18 +342,89 @@ def extract_composite(letter_name, font_bytes, output_dir):
     return True
 
 
+def telugu_consonants():
+    """Consonant names of TELUGU_LETTERS (క .. హ), in table order."""
+    return [name for name, cp in TELUGU_LETTERS.items() if 0x0C15 <= cp <= 0x0C39]
+
+
+def generate_guninthalu():
+    """Every consonant x vowel sign as Syllable(name, text), e.g. ka_aa -> కా."""
+    syllables = []
+    for consonant in telugu_consonants():
+        base = chr(TELUGU_LETTERS[consonant])
+        for vowel, sign in TELUGU_VOWEL_SIGNS.items():
+            syllables.append(Syllable(f"{consonant}_{vowel}", base + sign))
+    return syllables
+
+
+def generate_conjuncts():
+    """Every consonant + virama + consonant, e.g. k_ssa -> క్ష."""
+    consonants = telugu_consonants()
+    syllables = []
+    for first in consonants:
+        # Drop the inherent 'a' of the half form: ka -> k, ta2 -> t2
+        stem = first[:-1] if first.endswith('a') else first.replace('a', '', 1)
+        for second in consonants:
+            text = chr(TELUGU_LETTERS[first]) + TELUGU_VIRAMA + chr(TELUGU_LETTERS[second])
+            syllables.append(Syllable(f"{stem}_{second}", text))
+    return syllables
+
+
+def save_syllable_outputs(syllable, normalized_path, output_dir):
+    """Write a generated syllable's SVG and path text; returns the file paths."""
+    svg_output = os.path.join(output_dir, f"{syllable.name}_extracted.svg")
+    save_svg(normalized_path, svg_output, syllable.name, syllable.text, quiet=True)
+
+    path_output = os.path.join(output_dir, f"{syllable.name}_path.txt")
+    with open(path_output, 'w', encoding='utf-8') as f:
+        f.write(normalized_path)
+    return [svg_output, path_output]
+
+
+def generate(which, output_dir, font_path, jobs=None, restart=False):
+    """Shape guninthalu and/or conjuncts in bulk (see syllable_pipeline.py)."""
+    groups = {
+        'guninthalu': generate_guninthalu,
+        'conjuncts': generate_conjuncts,
+    }
+    if which == 'all':
+        names = list(groups)
+    elif which in groups:
+        names = [which]
+    else:
+        print(f"Error: Unknown syllable group '{which}'")
+        print(f"Available: {', '.join(groups)}, all")
+        return False
+
+    syllables = [syllable for name in names for syllable in groups[name]()]
+    return run_pipeline(
+        syllables, output_dir, save_syllable_outputs, font_path=font_path,
+        shaper_options={'script': 'telu', 'language': 'te',
+                        'probe_codepoints': list(TELUGU_LETTERS.values())},
+        jobs=jobs, restart=restart,
+        manifest_extra={'script': 'telugu', 'groups': names,
+                        'font': os.path.basename(font_path)})
+
+
 def main():
+    jobs = pop_int_option(sys.argv, '--jobs', default=os.cpu_count() or 1)
+    restart = pop_flag(sys.argv, '--restart')
+
     if len(sys.argv) < 2:
         print("Usage: python3 extract_composite_telugu.py [am|aha|ksha|all]")
+        print("       python3 extract_composite_telugu.py generate [guninthalu|conjuncts|all] [output_dir] [--jobs N] [--restart]")
         print(f"\nAvailable composite characters: {', '.join(COMPOSITE_CHARS.keys())}")
         sys.exit(1)
     
     letter_name = sys.argv[1].lower()
-    if len(sys.argv) > 2:
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if letter_name == 'generate':
+        which = sys.argv[2].lower() if len(sys.argv) > 2 else 'all'
+        output_dir = sys.argv[3] if len(sys.argv) > 3 else os.path.join(script_dir, SYLLABLES_DIR)
+    elif len(sys.argv) > 2:
         output_dir = sys.argv[2]
     else:
         # Default to output directory relative to script location
-        script_dir = os.path.dirname(os.path.abspath(__file__))
         output_dir = os.path.join(script_dir, "output")
     
     # Load font
@@ -627,28 +432,29 @@ def main():
     local_font = find_local_font()
     if local_font:
         print(f"Using local font: {local_font}")
-        with open(local_font, 'rb') as f:
-            font_bytes = f.read()
     else:
-        print("Downloading font...")
-        for url in DEFAULT_FONT_URLS:
-            font_bytes = download_font(url)
-            if font_bytes:
-                break
+        print("Using default font from the font store...")
+        local_font = fetch_font(DEFAULT_FONT_URLS, name="Noto Sans Telugu")
     
-    if not font_bytes:
+    if not font_bytes and not local_font:
         print("Error: Could not load font")
         sys.exit(1)
     
     # Extract
-    if letter_name == 'all':
+    if letter_name == 'generate':
+        if not local_font:
+            print("Error: generate needs a font file")
+            sys.exit(1)
+        if not generate(which, output_dir, local_font, jobs=jobs, restart=restart):
+            sys.exit(1)
+    elif letter_name == 'all':
         success_count = 0
         for name in COMPOSITE_CHARS.keys():
-            if extract_composite(name, font_bytes, output_dir):
+            if extract_composite(name, font_bytes, output_dir, local_font):
                 success_count += 1
         print(f"\n✓ Successfully extracted {success_count}/{len(COMPOSITE_CHARS)} composite characters")
     else:
-        if extract_composite(letter_name, font_bytes, output_dir):
+        if extract_composite(letter_name, font_bytes, output_dir, local_font):
             print(f"\n✓ Successfully extracted '{letter_name}'")
         else:
             sys.exit(1)
@@ -7,9 +7,11 @@ This script follows a similar approach to extract_am_aha.py (Telugu):
 - Extract anusvara (U+0902) for अं
 - Extract visarga (U+0903) for अः
 
-Then it positions the diacritic glyphs ABOVE the base character, centered
-horizontally over अ and slightly above its top (matra), and finally normalizes
-the combined path into a 0 0 1000 1000 viewBox.
+Then it places the diacritic with the font's GPOS mark anchors (anusvara) or
+after the base's advance (spacing visarga), see mark_attach.py, and draws the
+combination straight into a 0 0 1000 1000 viewBox. Marks the font gives no
+anchor are centered over a fraction of अ's width, slightly above its top
+(matra).
 
 Usage:
   python3 tools/svg_generator/extract_hindi_am_aha.py am
@@ -19,20 +21,16 @@ Usage:
 
 import sys
 import os
-import io
-import re
 from pathlib import Path
 
-from fontTools.ttLib import TTFont
-from fontTools.pens.svgPathPen import SVGPathPen
-from fontTools.pens.recordingPen import RecordingPen
-
 # Reuse font discovery and normalization from the main Hindi extractor
 SCRIPT_DIR = Path(__file__).resolve().parent
 if str(SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPT_DIR))
 
 import extract_hindi_svg as base  # type: ignore
+from mark_attach import mark_attacher_for
+from path_ir import serialize_path
 
 
 # Unicode values (Devanagari)
@@ -44,7 +42,10 @@ VISARGA = 0x0903    # ः (visarga) -> अः
 def load_font(font_path_or_url=None):
     """Load a Devanagari font, preferring Kohinoor Devanagari if available.
 
-    Handles both regular TTF files and TTC collections (e.g. Kohinoor.ttc).
+    Handles both regular TTF files and TTC collections (e.g. Kohinoor.ttc):
+    the font is opened through the Hindi extractor's FontSession, so a
+    collection's Devanagari face is picked exactly as extract_hindi_svg.py
+    picks it.
     """
     actual_font_path = None
     font_bytes = None
@@ -76,124 +77,8 @@ def load_font(font_path_or_url=None):
         print("Please provide a font path or URL as the second argument")
         sys.exit(1)
 
-    # If we have a TTC path, let TTFont pick the first face via fontNumber=0
-    if actual_font_path and actual_font_path.lower().endswith(".ttc"):
-        return TTFont(actual_font_path, fontNumber=0)
-
-    # Otherwise use bytes (from path or download)
-    if not font_bytes and actual_font_path:
-        with open(actual_font_path, "rb") as f:
-            font_bytes = f.read()
-
-    return TTFont(io.BytesIO(font_bytes))
-
-
-def get_glyph_and_bounds(font, codepoint):
-    """
-    Extract glyph path and bounding box for a given codepoint.
-
-    Returns:
-        (path_d, (xmin, ymin, xmax, ymax), em)
-    """
-    cmap = font.getBestCmap()
-
-    if codepoint not in cmap:
-        for subtable in font["cmap"].tables:
-            if codepoint in subtable.cmap:
-                cmap = subtable.cmap
-                break
-        else:
-            print(f"  ✗ Codepoint U+{codepoint:04X} not found in any cmap")
-            return None
-
-    glyph_name = cmap[codepoint]
-    glyph_set = font.getGlyphSet()
-
-    if glyph_name not in glyph_set:
-        print(f"  ✗ Glyph {glyph_name} not in glyph set")
-        return None
-
-    glyph = glyph_set[glyph_name]
-
-    # Record path commands and bounds in one pass
-    rec_pen = RecordingPen()
-    glyph.draw(rec_pen)
-
-    x_coords = []
-    y_coords = []
-    for op, coords in rec_pen.value:
-        for x, y in coords:
-            x_coords.append(x)
-            y_coords.append(y)
-
-    if not x_coords or not y_coords:
-        print(f"  ✗ Empty outline for glyph {glyph_name}")
-        return None
-
-    xmin = min(x_coords)
-    xmax = max(x_coords)
-    ymin = min(y_coords)
-    ymax = max(y_coords)
-
-    # Now get SVG path string
-    svg_pen = SVGPathPen(glyph_set)
-    glyph.draw(svg_pen)
-    path_d = svg_pen.getCommands()
-
-    if not path_d or path_d.strip() == "M 0 0 Z":
-        print(f"  ✗ Empty path for glyph {glyph_name}")
-        return None
-
-    em = font["head"].unitsPerEm if "head" in font else 1000
-    print(f"  ✓ Extracted {glyph_name}: bounds=({xmin}, {ymin}, {xmax}, {ymax}), em={em}")
-
-    return path_d, (xmin, ymin, xmax, ymax), em
-
-
-def translate_path_xy(path_d, dx, dy):
-    """Translate all coordinates by (dx, dy) in a simple SVG path string."""
-
-    def transform(match):
-        cmd = match.group(1)
-        args = match.group(2) or ""
-        cmd_upper = cmd.upper()
-
-        if not args or cmd_upper == "Z":
-            return cmd
-
-        nums = re.findall(r"([-+]?\d*\.?\d+)", args)
-        transformed = []
-
-        if cmd_upper == "H":
-            # Horizontal: only X
-            for num in nums:
-                try:
-                    transformed.append(f"{float(num) + dx:.2f}")
-                except ValueError:
-                    transformed.append(num)
-        elif cmd_upper == "V":
-            # Vertical: only Y
-            for num in nums:
-                try:
-                    transformed.append(f"{float(num) + dy:.2f}")
-                except ValueError:
-                    transformed.append(num)
-        else:
-            # Commands with (x, y) pairs
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i % 2 == 0:  # X
-                        val += dx
-                    else:           # Y
-                        val += dy
-                    transformed.append(f"{val:.2f}")
-                except ValueError:
-                    transformed.append(num)
-
-        return f"{cmd} {' '.join(transformed)}"
-
-    return re.sub(r"([MmLlHhVvCcSsQqTtAaZz])\s*([-\d.,\s]*)", transform, path_d)
+    # Files on disk are memory-mapped and opened lazily (font_loader.py)
+    return base.open_font_session(font_bytes, actual_font_path).font
 
 
 def position_mark_above_base(base_bounds, mark_bounds, gap, center_factor=0.5):
@@ -220,73 +105,76 @@ def position_mark_above_base(base_bounds, mark_bounds, gap, center_factor=0.5):
     return dx, dy
 
 
-def extract_am(font, output_dir):
-    """Extract अं (am)."""
-    print("\nExtracting अं (am)...")
-
-    print("  Extracting base 'a' (U+0905)...")
-    base_result = get_glyph_and_bounds(font, A_BASE)
-    if not base_result:
-        print("  ✗ Failed to extract base 'a'")
-        return False
-
-    base_path, base_bounds, em = base_result
-
-    print("  Extracting anusvara (U+0902)...")
-    mark_result = get_glyph_and_bounds(font, ANUSVARA)
-    if not mark_result:
-        print("  ✗ Failed to extract anusvara")
-        return False
-
-    mark_path, mark_bounds, _ = mark_result
-
-    # Compute translation to put anusvara above base, with small gap
-    gap = em * 0.05
-    # Place anusvara slightly towards the right side of the base
-    dx, dy = position_mark_above_base(base_bounds, mark_bounds, gap, center_factor=0.75)
-    print(f"  Positioning anusvara with dx={dx:.2f}, dy={dy:.2f}")
-
-    translated_mark = translate_path_xy(mark_path, dx, dy)
-
-    combined = f"{base_path} {translated_mark}"
-    normalized = base.normalize_path_coordinates(combined, em)
+def glyph_name_for(font, codepoint):
+    """Glyph name for a codepoint from any cmap, or None."""
+    glyph_name = (font.getBestCmap() or {}).get(codepoint)
+    if glyph_name is None:
+        for subtable in font["cmap"].tables:
+            if codepoint in subtable.cmap:
+                glyph_name = subtable.cmap[codepoint]
+                break
+    if glyph_name is None or glyph_name not in font.getGlyphSet():
+        return None
+    return glyph_name
 
-    save_svg_and_path(normalized, "am", output_dir, "अं")
-    return True
 
+def extract_with_mark(font, mark_cp, mark_label, letter_name, label_char, output_dir,
+                      center_factor):
+    """Extract अ + mark, placing the mark with the font's GPOS anchors.
 
-def extract_aha(font, output_dir):
-    """Extract अः (aha)."""
-    print("\nExtracting अः (aha)...")
+    The layout comes from mark_attach.py: an anusvara attaches to अ through
+    the MarkBase anchors, a spacing visarga follows अ's advance width.
+    Only a mark the font gives no anchor falls back to
+    position_mark_above_base (center_factor along the base's width).
+    """
+    print(f"\nExtracting {label_char} ({letter_name})...")
 
-    print("  Extracting base 'a' (U+0905)...")
-    base_result = get_glyph_and_bounds(font, A_BASE)
-    if not base_result:
-        print("  ✗ Failed to extract base 'a'")
+    base_glyph = glyph_name_for(font, A_BASE)
+    mark_glyph = glyph_name_for(font, mark_cp)
+    if not base_glyph or not mark_glyph:
+        missing = f"base 'a' (U+{A_BASE:04X})" if not base_glyph else f"{mark_label} (U+{mark_cp:04X})"
+        print(f"  ✗ Failed to find {missing} in the font")
         return False
 
-    base_path, base_bounds, em = base_result
+    em = font["head"].unitsPerEm if "head" in font else 1000
+    attacher = mark_attacher_for(font)
+    layout = attacher.layout([base_glyph, mark_glyph])
+    mark = layout[-1]
+
+    if mark.how == "mark":
+        base_bounds = attacher.bounds(base_glyph)
+        mark_bounds = attacher.bounds(mark_glyph)
+        if base_bounds and mark_bounds:
+            dx, dy = position_mark_above_base(base_bounds, mark_bounds, em * 0.05, center_factor)
+            mark = mark._replace(x=dx, y=dy)
+            layout[-1] = mark
+        print(f"  No GPOS anchor for {mark_glyph}; placed above {base_glyph} "
+              f"with dx={mark.x:.2f}, dy={mark.y:.2f}")
+    elif mark.how == "anchor":
+        print(f"  Attached {mark_glyph} to {base_glyph} by GPOS anchor at dx={mark.x:.2f}, dy={mark.y:.2f}")
+    else:
+        print(f"  Placed spacing {mark_glyph} after {base_glyph} at dx={mark.x:.2f}")
 
-    print("  Extracting visarga (U+0903)...")
-    mark_result = get_glyph_and_bounds(font, VISARGA)
-    if not mark_result:
-        print("  ✗ Failed to extract visarga")
+    # Base and mark are drawn straight into normalized coordinates
+    ir = attacher.draw_normalized(layout, em)
+    if ir is None:
+        print(f"  ✗ Empty outline for {label_char}")
         return False
 
-    mark_path, mark_bounds, _ = mark_result
+    save_svg_and_path(serialize_path(ir), letter_name, output_dir, label_char)
+    return True
 
-    # For visarga, tuck the two dots close to the right edge of अ
-    gap = em * 0.05
-    dx, dy = position_mark_above_base(base_bounds, mark_bounds, gap, center_factor=1.0)
-    print(f"  Positioning visarga with dx={dx:.2f}, dy={dy:.2f}")
 
-    translated_mark = translate_path_xy(mark_path, dx, dy)
+def extract_am(font, output_dir):
+    """Extract अं (am)."""
+    # Without an anchor, place anusvara slightly towards the right side of the base
+    return extract_with_mark(font, ANUSVARA, "anusvara", "am", "अं", output_dir, center_factor=0.75)
 
-    combined = f"{base_path} {translated_mark}"
-    normalized = base.normalize_path_coordinates(combined, em)
 
-    save_svg_and_path(normalized, "aha", output_dir, "अः")
-    return True
+def extract_aha(font, output_dir):
+    """Extract अः (aha)."""
+    # Without an anchor, tuck the two dots close to the right edge of अ
+    return extract_with_mark(font, VISARGA, "visarga", "aha", "अः", output_dir, center_factor=1.0)
 
 
 def save_svg_and_path(path_d, letter_name, output_dir, label_char):
@@ -10,8 +10,8 @@ shaping, such as:
   - am   -> अं   (अ + ं)
   - aha  -> अः  (अ + ः)
 
-It uses HarfBuzz for text shaping and fontTools for extracting glyph outlines,
-then normalizes and saves SVGs into the same folder as the other Hindi SVGs:
+It uses HarfBuzz for text shaping and fontTools for extracting glyph outlines
+(one Shaper per run, see shaper.py), then normalizes and saves SVGs into the same folder as the other Hindi SVGs:
   tools/svg_generator/out_hin
 
 Usage:
@@ -28,6 +28,21 @@ Examples:
   # Using direct Hindi text
   python3 tools/svg_generator/extract_hindi_ligature_svg.py क्ष
 
+  # Whole barakhadi: every consonant x matra, plus anusvara/visarga forms
+  python3 tools/svg_generator/extract_hindi_ligature_svg.py barakhadi [font] [output_dir] [--jobs N] [--restart]
+
+  # Any mode, drawn from a static instance of a variable font (font_instance.py)
+  python3 tools/svg_generator/extract_hindi_ligature_svg.py ksha NotoSansDevanagari-VariableFont_wdth,wght.ttf --axis wght=300
+
+The barakhadi mode shapes every consonant of HINDI_LETTERS with every matra
+(ka_aa -> का, ka_i -> कि, ...) and with anusvara/visarga (ka_am -> कं,
+ka_aha -> कः) through one Shaper per worker, streamed through
+syllable_pipeline.py: outputs are written as they are produced, a rerun
+resumes from progress.jsonl (retrying failures), and manifest.json lists
+everything. The progress log is tied to the font, --axis location, shaper
+options and padding; a rerun with any of them changed regenerates every
+syllable. Default output: tools/svg_generator/out_hin/barakhadi
+
 Dependencies:
   fonttools, uharfbuzz, requests
 
@@ -37,22 +52,18 @@ Install (example):
 
 import sys
 import os
-import io
 from pathlib import Path
 
-from fontTools.ttLib import TTFont
-from fontTools.pens.svgPathPen import SVGPathPen
-from fontTools.pens.transformPen import TransformPen
-
-# HarfBuzz Python bindings (pip package: uharfbuzz)
-import uharfbuzz as hb
-
 # Make sure we can import the base Hindi extractor utilities from the same folder
 SCRIPT_DIR = Path(__file__).resolve().parent
 if str(SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPT_DIR))
 
 import extract_hindi_svg as base  # type: ignore
+from cli_options import pop_flag, pop_int_option, pop_list_option
+from font_instance import instance_font_source, parse_axis_options
+from shaper import Shaper
+from syllable_pipeline import Syllable, run_pipeline
 
 
 # Map symbolic names to Hindi text sequences
@@ -66,6 +77,25 @@ HINDI_SYLLABLES = {
     "aha": "\u0905\u0903",         # अः = अ + ः (visarga)
 }
 
+# Dependent vowel signs (matras), keyed by the vowel names used in
+# HINDI_LETTERS, plus anusvara (am) and visarga (aha)
+HINDI_MATRAS = {
+    "aa": "\u093E",   # ा
+    "i": "\u093F",    # ि
+    "ii": "\u0940",   # ी
+    "u": "\u0941",    # ु
+    "uu": "\u0942",   # ू
+    "ri": "\u0943",   # ृ
+    "e": "\u0947",    # े
+    "ee": "\u0948",   # ै
+    "o": "\u094B",    # ो
+    "oo": "\u094C",   # ौ
+    "am": "\u0902",   # ं
+    "aha": "\u0903",  # ः
+}
+
+BARAKHADI_DIR = "tools/svg_generator/out_hin/barakhadi"
+
 # Optional fine-tuning offsets for specific syllables (units: font design units)
 # These let us nudge marks like visarga if the font's default placement
 # doesn't look good for our tracing UI.
@@ -83,168 +113,67 @@ def load_font(font_path_or_url=None):
     """
     Load a Devanagari font, preferring Kohinoor Devanagari if available.
 
+    Same resolution as extract_hindi_svg.load_font_source: an explicit path,
+    a URL or the fallback Noto font through the font store (font_store.py),
+    or the best installed face from the font catalog (find_local_hindi_font).
+    Local fonts are used by path, so font_bytes is None for them.
+
     Returns:
         (font_bytes, actual_font_path)
     """
-    font_bytes = None
-    actual_font_path = None
-
-    if font_path_or_url:
-        if os.path.isfile(font_path_or_url):
-            print(f"Using specified font: {font_path_or_url}")
-            actual_font_path = font_path_or_url
-            # For TTC we use the path directly; otherwise read bytes
-            if not font_path_or_url.lower().endswith(".ttc"):
-                with open(font_path_or_url, "rb") as f:
-                    font_bytes = f.read()
-        else:
-            font_bytes = base.download_font(font_path_or_url)
-    else:
-        # Prefer local Kohinoor / Devanagari fonts
-        local_font = base.find_local_hindi_font()
-        if local_font:
-            print(f"Using local font: {local_font}")
-            if "Kohinoor" in local_font:
-                print("  ✓ Found Kohinoor Devanagari (better ligature/conjunct support)")
-            actual_font_path = local_font
-            if not local_font.lower().endswith(".ttc"):
-                with open(local_font, "rb") as f:
-                    font_bytes = f.read()
-        else:
-            print("Downloading fallback font (Noto Sans Devanagari)...")
-            print("  Note: Kohinoor Devanagari is recommended for better letter rendering")
-            for url in base.DEFAULT_FONT_URLS:
-                print(f"Trying: {url}")
-                font_bytes = base.download_font(url)
-                if font_bytes:
-                    break
-
-    if not font_bytes and not actual_font_path:
-        print("\nError: Could not load font")
-        print("Please provide a font path or URL as the second argument")
-        print("\nRecommended: Use Kohinoor Devanagari (often pre-installed on macOS)")
-        print("Fallback: Download NotoSansDevanagari-Regular.ttf from:")
-        print("https://fonts.google.com/noto/specimen/Noto+Sans+Devanagari")
-        sys.exit(1)
+    return base.load_font_source(font_path_or_url)
 
-    # Ensure we have raw font bytes for HarfBuzz, even for TTC paths
-    if font_bytes is None and actual_font_path:
-        with open(actual_font_path, "rb") as f:
-            font_bytes = f.read()
 
-    return font_bytes, actual_font_path
+def open_shaper(font_bytes, font_path=None):
+    """Open one Shaper (HarfBuzz + fontTools) for a whole run of syllables."""
+    return Shaper(font_path=font_path, font_bytes=font_bytes, script="deva", language="hi",
+                  probe_codepoints=base.HINDI_LETTERS.values())
 
 
-def shape_text_to_path(text, font_bytes, font_path=None):
-    """
-    Shape a Hindi text sequence with HarfBuzz and return a combined SVG path.
-
-    This will:
-      - Shape the text into glyph IDs and positions
-      - Use fontTools to draw each glyph outline
-      - Apply the HarfBuzz positioning and combine into a single path
+def syllable_nudge(text, shaper):
+    """Extra per-glyph offsets from SYLLABLE_OFFSETS for a text, or None.
 
-    Returns:
-      (path_d, em)  where em is unitsPerEm from the font
+    For 'aha' (अः) the visarga glyph is moved by visarga_dx/visarga_dy. It is
+    matched by glyph rather than by cluster, since HarfBuzz merges अ and ः
+    into one cluster.
     """
-    if not text:
-        raise ValueError("Empty text sequence")
-
-    # Create HarfBuzz face/font from bytes
-    blob = hb.Blob(font_bytes)
-    face = hb.Face(blob, 0)
-    font = hb.Font(face)
-
-    buf = hb.Buffer()
-    buf.add_str(text)
-    buf.guess_segment_properties()
-    # Force Devanagari script and Hindi language for better shaping
-    buf.script = "deva"
-    buf.language = "hi"
-    hb.shape(font, buf, {})
-
-    infos = buf.glyph_infos
-    positions = buf.glyph_positions
-
-    if not infos:
-        raise RuntimeError("HarfBuzz returned no glyphs for text: %r" % text)
-
-    # Open the font with fontTools for glyph outlines
-    # For TTC collections, we use fontNumber=0, which is where Devanagari lives
-    if font_path and font_path.lower().endswith(".ttc"):
-        ttfont = TTFont(font_path, fontNumber=0)
-    else:
-        ttfont = TTFont(io.BytesIO(font_bytes))
-
-    glyph_order = ttfont.getGlyphOrder()
-    glyph_set = ttfont.getGlyphSet()
-
-    # unitsPerEm for later normalization
-    em = ttfont["head"].unitsPerEm if "head" in ttfont else 1000
-
-    # HarfBuzz uses 26.6 fixed-point for positions; convert to float
-    FIXED_26_6 = 64.0
-
-    combined_pen = SVGPathPen(glyph_set)
-
-    x_cursor = 0.0
-    y_cursor = 0.0
-
-    # Special handling for visarga position in "aha" (अः)
-    adjust_visarga = False
-    visarga_dx = visarga_dy = 0.0
-    # Detect our configured 'aha' sequence by exact match
-    if text == HINDI_SYLLABLES.get("aha"):
-        adjust_visarga = True
-        conf = SYLLABLE_OFFSETS.get("aha", {})
-        visarga_dx = float(conf.get("visarga_dx", 0.0))
-        visarga_dy = float(conf.get("visarga_dy", 0.0))
-        # Compute UTF‑8 byte index of the visarga character for cluster matching
-        # text = [अ, ः], so second_char_start is len(first_char_utf8)
-        first_char_utf8 = text[0].encode("utf-8")
-        visarga_cluster_start = len(first_char_utf8)
-    else:
-        visarga_cluster_start = -1
-
-    for info, pos in zip(infos, positions):
-        gid = info.codepoint
-        if gid < 0 or gid >= len(glyph_order):
-            continue
-
-        glyph_name = glyph_order[gid]
-        if glyph_name not in glyph_set:
-            continue
+    if text != HINDI_SYLLABLES.get("aha"):
+        return None
 
-        glyph = glyph_set[glyph_name]
+    conf = SYLLABLE_OFFSETS.get("aha", {})
+    visarga_dx = float(conf.get("visarga_dx", 0.0))
+    visarga_dy = float(conf.get("visarga_dy", 0.0))
+    visarga_glyph = shaper.glyph_name(ord(text[-1]))
 
-        x_offset = pos.x_offset / FIXED_26_6
-        y_offset = pos.y_offset / FIXED_26_6
+    def nudge(glyph):
+        if glyph.glyph_name == visarga_glyph:
+            return visarga_dx, visarga_dy
+        return 0.0, 0.0
 
-        # If this glyph belongs to the visarga in "aha", apply a small offset tweak
-        if adjust_visarga and info.cluster >= visarga_cluster_start:
-            x_offset += visarga_dx
-            y_offset += visarga_dy
+    return nudge
 
-        # In font coordinates, Y-positive is up. We'll flip later in normalization,
-        # so we apply the offsets in the same coordinate system here.
-        tx = x_cursor + x_offset
-        ty = y_cursor + y_offset
 
-        # Draw glyph with translation applied
-        tpen = TransformPen(combined_pen, (1, 0, 0, 1, tx, ty))
-        glyph.draw(tpen)
+def shape_text_to_path(text, font_bytes=None, font_path=None, shaper=None):
+    """
+    Shape a Hindi text sequence with HarfBuzz and return the combined outline.
 
-        x_cursor += pos.x_advance / FIXED_26_6
-        y_cursor += pos.y_advance / FIXED_26_6
+    This will:
+      - Shape the text into glyph IDs and positions (cached per text)
+      - Use fontTools to draw each glyph outline
+      - Apply the HarfBuzz positioning and combine into a single path
 
-    path_d = combined_pen.getCommands()
-    if not path_d or path_d.strip() == "M 0 0 Z":
-        raise RuntimeError("Empty path generated for text: %r" % text)
+    Pass the run's Shaper (see open_shaper) to avoid setting up HarfBuzz and
+    fontTools again for every syllable.
 
-    return path_d, em
+    Returns:
+      (path, em)  where path is a PathIR in font units and em is unitsPerEm
+    """
+    if shaper is None:
+        shaper = open_shaper(font_bytes, font_path)
+    return shaper.draw_ir(text, nudge=syllable_nudge(text, shaper))
 
 
-def extract_syllable(name_or_text, font_bytes, output_dir, font_path=None):
+def extract_syllable(name_or_text, font_bytes, output_dir, font_path=None, shaper=None):
     """
     Extract a Hindi syllable/ligature as SVG.
 
@@ -253,6 +182,7 @@ def extract_syllable(name_or_text, font_bytes, output_dir, font_path=None):
         font_bytes:   font file bytes
         output_dir:   output directory for SVG/TXT
         font_path:    path to font file (for TTC collections)
+        shaper:       already-open Shaper to reuse across syllables
     """
     key = name_or_text.lower()
     if key in HINDI_SYLLABLES:
@@ -266,7 +196,7 @@ def extract_syllable(name_or_text, font_bytes, output_dir, font_path=None):
     print(f"\nShaping text '{text}' for '{label}'...")
 
     try:
-        path_d, em = shape_text_to_path(text, font_bytes, font_path)
+        path_d, em = shape_text_to_path(text, font_bytes, font_path, shaper)
     except Exception as e:
         print(f"  ✗ Failed to shape/extract: {e}")
         return False
@@ -295,9 +225,56 @@ def extract_syllable(name_or_text, font_bytes, output_dir, font_path=None):
     return True
 
 
+def barakhadi_syllables():
+    """Every consonant x matra as Syllable(name, text), e.g. ka_aa -> का."""
+    syllables = []
+    for consonant, cp in base.HINDI_LETTERS.items():
+        if not 0x0915 <= cp <= 0x0939:
+            continue
+        for matra_name, matra in HINDI_MATRAS.items():
+            syllables.append(Syllable(f"{consonant}_{matra_name}", chr(cp) + matra))
+    return syllables
+
+
+def save_syllable_outputs(syllable, normalized_path, output_dir):
+    """Write one barakhadi syllable's SVG and path text; returns the file paths."""
+    svg_output = os.path.join(output_dir, f"{syllable.name}_extracted.svg")
+    base.save_svg_file(normalized_path, svg_output, syllable.name, syllable.text[0], quiet=True)
+
+    path_output = os.path.join(output_dir, f"{syllable.name}_path.txt")
+    with open(path_output, "w", encoding="utf-8") as f:
+        f.write(normalized_path)
+    return [svg_output, path_output]
+
+
+def extract_barakhadi(font_bytes, output_dir, font_path=None, jobs=None, restart=False,
+                      location=None, padding=0.1, syllables=None):
+    """Shape the whole barakhadi in one run (see syllable_pipeline.py).
+
+    location is the --axis location the font was instanced at; it is part of
+    the run fingerprint, so progress from another location is not reused.
+    syllables defaults to the whole barakhadi (check_barakhadi_resume.py
+    passes a single row).
+    """
+    syllables = syllables or barakhadi_syllables()
+    font_label = os.path.basename(font_path) if font_path else "downloaded"
+    return run_pipeline(
+        syllables, output_dir, save_syllable_outputs, font_bytes=font_bytes, font_path=font_path,
+        shaper_options={"script": "deva", "language": "hi",
+                        "probe_codepoints": list(base.HINDI_LETTERS.values())},
+        location=location, padding=padding, jobs=jobs, restart=restart,
+        manifest_extra={"script": "hindi", "groups": ["barakhadi"], "font": font_label})
+
+
 def main():
+    jobs = pop_int_option(sys.argv, "--jobs", default=os.cpu_count() or 1)
+    restart = pop_flag(sys.argv, "--restart")
+    axis_location = parse_axis_options(pop_list_option(sys.argv, "--axis"))
+
     if len(sys.argv) < 2:
         print("Usage: python3 extract_hindi_ligature_svg.py [name_or_text] [font_path_or_url] [output_dir]")
+        print("       python3 extract_hindi_ligature_svg.py barakhadi [font_path_or_url] [output_dir] [--jobs N] [--restart]")
+        print("  Any mode also takes --axis TAG=VALUE (e.g. --axis wght=300) for variable fonts")
         print("\nSymbolic names supported:")
         print("  " + ", ".join(sorted(HINDI_SYLLABLES.keys())))
         print("\nExamples:")
@@ -308,11 +285,22 @@ def main():
 
     name_or_text = sys.argv[1]
     font_arg = sys.argv[2] if len(sys.argv) > 2 else None
-    output_dir = sys.argv[3] if len(sys.argv) > 3 else "tools/svg_generator/out_hin"
+    barakhadi = name_or_text.lower() == "barakhadi"
+    default_output = BARAKHADI_DIR if barakhadi else "tools/svg_generator/out_hin"
+    output_dir = sys.argv[3] if len(sys.argv) > 3 else default_output
 
     font_bytes, actual_font_path = load_font(font_arg)
+    font_bytes, actual_font_path = instance_font_source(font_bytes, actual_font_path, axis_location)
+
+    if barakhadi:
+        if not extract_barakhadi(font_bytes, output_dir, actual_font_path, jobs=jobs,
+                                 restart=restart, location=axis_location):
+            sys.exit(1)
+        return
+
+    shaper = open_shaper(font_bytes, actual_font_path)
 
-    if extract_syllable(name_or_text, font_bytes, output_dir, actual_font_path):
+    if extract_syllable(name_or_text, font_bytes, output_dir, actual_font_path, shaper):
         print(f"\n✓ Successfully extracted '{name_or_text}'")
     else:
         sys.exit(1)
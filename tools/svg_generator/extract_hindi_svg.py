@@ -14,21 +14,34 @@ Usage:
     
     # Extract with custom font path
     python3 tools/svg_generator/extract_hindi_svg.py ka /path/to/font.ttf
+    
+    # Extract all letters across 4 worker processes
+    python3 tools/svg_generator/extract_hindi_svg.py all --jobs 4
+    
+    # Ignore the extraction cache and redraw every glyph
+    python3 tools/svg_generator/extract_hindi_svg.py all --no-cache
+    
+    # Draw from a lighter static instance of the variable Noto font
+    # (built once and cached, see font_instance.py)
+    python3 tools/svg_generator/extract_hindi_svg.py all NotoSansDevanagari-VariableFont_wdth,wght.ttf --axis wght=300
+
+Fonts given by URL, and the fallback download, go through the local font
+store (font_store.py) and are downloaded at most once. Set
+SVG_GENERATOR_OFFLINE=1 to never touch the network.
 
-Dependencies: fonttools, requests
+Dependencies: fonttools, requests (only for downloads)
 Install: python3 -m pip install --user fonttools requests
 """
 import sys
-import io
 import os
-import json
-import re
-import glob
-import requests
-from pathlib import Path
-from fontTools.ttLib import TTFont
-from fontTools.pens.svgPathPen import SVGPathPen
-from fontTools.pens.recordingPen import RecordingPen
+
+from cli_options import pop_flag, pop_int_option, pop_list_option
+from font_catalog import find_font
+from font_instance import instance_font_source, parse_axis_options
+from font_store import fetch_font
+from extraction_cache import codepoint_key, open_glyph_cache
+from font_session import FONT_OPEN_ERRORS, FontOpenError, FontSession, LazyFontSession
+from path_ir import normalize_path, serialize_path
 
 # Hindi (Devanagari) Unicode range: U+0900 to U+097F
 # Complete mapping of Hindi letters (vowels and consonants)
@@ -86,7 +99,8 @@ HINDI_LETTERS = {
     'lla': 0x0933,    # ळ
 }
 
-# Try multiple possible URLs for Noto Sans Devanagari (fallback)
+# Family name the fallback font is stored under (font_store.py)
+DEFAULT_FONT_NAME = "Noto Sans Devanagari"
 DEFAULT_FONT_URLS = [
     "https://github.com/google/fonts/raw/main/ofl/notosansdevanagari/NotoSansDevanagari%5Bwdth%2Cwght%5D.ttf",
     "https://raw.githubusercontent.com/google/fonts/main/ofl/notosansdevanagari/NotoSansDevanagari-Regular.ttf",
@@ -96,505 +110,73 @@ DEFAULT_FONT_URLS = [
 
 
 def find_local_hindi_font():
-    """Search common locations for Hindi/Devanagari fonts, prioritizing Kohinoor Devanagari."""
-    # Prioritize Kohinoor Devanagari (better ligature/conjunct support, prevents letter breaking)
-    kohinoor_paths = [
-        "/System/Library/Fonts/Kohinoor.ttc",  # macOS - contains Kohinoor Devanagari
-        "/Library/Fonts/Kohinoor*.ttc",
-        os.path.expanduser("~/Library/Fonts/Kohinoor*.ttc"),
-        "C:/Windows/Fonts/Kohinoor*.ttc",
-        "C:/Windows/Fonts/Kohinoor*.ttf",
-    ]
-    
-    for pattern in kohinoor_paths:
-        try:
-            matches = glob.glob(pattern)
-            if matches:
-                # Verify it's actually Devanagari by checking font name
-                try:
-                    from fontTools.ttLib import TTFont
-                    for font_path in matches:
-                        # TTC files can contain multiple fonts, check first one
-                        font = TTFont(font_path, fontNumber=0)
-                        font_name = None
-                        if 'name' in font:
-                            for name_record in font['name'].names:
-                                if name_record.nameID == 1:  # Font family name
-                                    font_name = name_record.toUnicode()
-                                    break
-                        if font_name and 'Devanagari' in font_name:
-                            return font_path
-                except Exception:
-                    # If we can't verify, use it anyway (likely correct)
-                    return matches[0]
-        except Exception:
-            pass
-    
-    # Fallback to other Devanagari fonts
-    possible_paths = [
-        "/System/Library/Fonts/*Devanagari*.ttf",
-        "/System/Library/Fonts/*Devanagari*.ttc",
-        "/System/Library/Fonts/*Hindi*.ttf",
-        "/System/Library/Fonts/*Hindi*.ttc",
-        "/Library/Fonts/*Devanagari*.ttf",
-        "/Library/Fonts/*Devanagari*.ttc",
-        "/Library/Fonts/*Hindi*.ttf",
-        "/Library/Fonts/*Hindi*.ttc",
-        os.path.expanduser("~/Library/Fonts/*Devanagari*.ttf"),
-        os.path.expanduser("~/Library/Fonts/*Devanagari*.ttc"),
-        os.path.expanduser("~/Library/Fonts/*Hindi*.ttf"),
-        os.path.expanduser("~/Library/Fonts/*Hindi*.ttc"),
-        "/usr/share/fonts/**/*Devanagari*.ttf",
-        "/usr/share/fonts/**/*Devanagari*.ttc",
-        "/usr/share/fonts/**/*Hindi*.ttf",
-        "/usr/share/fonts/**/*Hindi*.ttc",
-        "/usr/local/share/fonts/**/*Devanagari*.ttf",
-        "/usr/local/share/fonts/**/*Devanagari*.ttc",
-        "/usr/local/share/fonts/**/*Hindi*.ttf",
-        "/usr/local/share/fonts/**/*Hindi*.ttc",
-        "C:/Windows/Fonts/*Devanagari*.ttf",
-        "C:/Windows/Fonts/*Hindi*.ttf",
-    ]
-    
-    for pattern in possible_paths:
-        try:
-            matches = glob.glob(pattern, recursive=True)
-            if matches:
-                return matches[0]
-        except Exception:
-            pass
+    """Find an installed Hindi/Devanagari font, prioritizing Kohinoor Devanagari.
     
-    return None
+    Resolved through the cached font catalog (font_catalog.py), so font
+    directories are not globbed and .ttc name tables are not re-read on
+    every run. Kohinoor Devanagari wins (better ligature/conjunct support,
+    prevents letter breaking), then other Devanagari/Hindi families, then
+    whichever face covers most of the Devanagari block.
+    """
+    face = find_font('devanagari', prefer_families=('Kohinoor Devanagari', 'Devanagari', 'Hindi'))
+    return face.path if face else None
 
 
 def download_font(url):
-    """Download font from URL."""
-    print(f"Downloading font from: {url}")
-    try:
-        r = requests.get(url, allow_redirects=True, timeout=30)
-        r.raise_for_status()
-        return r.content
-    except Exception as e:
-        print(f"Error downloading font: {e}")
+    """Fetch a font by URL through the local font store (font_store.py).
+    
+    A font already in the store (or seeded from the repo) is returned without
+    touching the network. Returns the font bytes, or None.
+    """
+    font_path = fetch_font([url])
+    if not font_path:
         return None
+    with open(font_path, 'rb') as f:
+        return f.read()
 
 
-def extract_glyph_path(font_bytes, codepoint, font_path=None):
+def extract_glyph_path(font_bytes, codepoint, font_path=None, session=None):
     """Extract SVG path for a glyph from font bytes.
     
     Args:
         font_bytes: Font file bytes (for TTF) or None (for TTC file path)
         codepoint: Unicode codepoint to extract
         font_path: Path to font file (required for TTC files)
+        session: Already-open FontSession to draw from; when omitted a
+            one-off session is opened for this glyph
     """
-    try:
-        # Handle TTC files (TrueType Collections) - need file path
-        if font_path and font_path.lower().endswith('.ttc'):
-            # Try different font numbers in the collection (0 is usually Regular)
-            for font_number in [0, 1, 2, 3, 4]:
-                try:
-                    font = TTFont(font_path, fontNumber=font_number)
-                    # Verify it's Devanagari by checking if it has the codepoint
-                    cmap = font.getBestCmap()
-                    if codepoint in cmap:
-                        break
-                except Exception:
-                    continue
-            else:
-                # If no font number worked, use 0 (default)
-                font = TTFont(font_path, fontNumber=0)
-        else:
-            # Regular TTF file
-            font = TTFont(io.BytesIO(font_bytes))
-    except Exception as e:
-        print(f"Error loading font: {e}")
-        return None
-    
-    # Get the best cmap
-    cmap = font.getBestCmap()
-    
-    if codepoint not in cmap:
-        # Try all cmaps
-        for subtable in font['cmap'].tables:
-            if codepoint in subtable.cmap:
-                cmap = subtable.cmap
-                break
-        else:
+    if session is None:
+        try:
+            session = open_font_session(font_bytes, font_path, probe_codepoints=[codepoint])
+        except FONT_OPEN_ERRORS as e:
+            print(f"Error loading font: {e}")
             return None
     
-    glyph_name = cmap[codepoint]
-    glyph_set = font.getGlyphSet()
-    
-    if glyph_name not in glyph_set:
-        return None
-    
-    glyph = glyph_set[glyph_name]
-    pen = SVGPathPen(glyph_set)
-    glyph.draw(pen)
-    path_d = pen.getCommands()
-    
-    if not path_d or path_d.strip() == 'M 0 0 Z':
-        return None
-    
-    # Get units per em for scaling
-    em = font['head'].unitsPerEm if 'head' in font else 1000
+    return session.draw_svg_path(codepoint)
+
+
+def open_font_session(font_bytes, font_path=None, probe_codepoints=None):
+    """Open a FontSession for a Devanagari font (TTF bytes or TTC path).
     
-    return path_d, em
+    For TTC collections the face covering the Hindi letters is resolved once
+    here instead of on every glyph.
+    """
+    if probe_codepoints is None:
+        probe_codepoints = HINDI_LETTERS.values()
+    return FontSession(font_bytes=font_bytes, font_path=font_path, probe_codepoints=probe_codepoints)
 
 
 def normalize_path_coordinates(path_d, em=1000, padding=0.1):
     """Normalize SVG path coordinates to fit in viewBox with padding.
     
     Fonts use Y-up coordinates (Y increases upward), but SVG/Flutter use Y-down.
-    So we first flip Y coordinates, then normalize.
+    The path is parsed once into a PathIR (path_ir.py); the Y flip, scale and
+    offset are applied there in a single pass before formatting it again.
     """
-    # First, flip Y coordinates (fonts use Y-up, SVG uses Y-down)
-    commands = re.findall(r'([MmLlHhVvCcSsQqTtAaZz])\s*([-\d.,\s]+)?', path_d)
-    
-    # Step 1: Flip Y coordinates and extract all X/Y coordinates for bounding box
-    flipped_commands = []
-    x_coords = []
-    y_coords = []
-    
-    # Track position for H/V commands and relative commands
-    current_x, current_y = 0, 0
-    start_x, start_y = 0, 0
-    
-    for cmd, args in commands:
-        if not args or cmd.upper() == 'Z':
-            flipped_commands.append((cmd, args))
-            if cmd.upper() == 'Z':
-                current_x, current_y = start_x, start_y
-            continue
-        
-        cmd_upper = cmd.upper()
-        is_relative = cmd.islower()
-        nums = re.findall(r'([-+]?\d*\.?\d+)', args)
-        flipped_nums = []
-        
-        if cmd_upper == 'H':
-            # Horizontal line: only X coordinate
-            for num in nums:
-                try:
-                    val = float(num)
-                    if is_relative:
-                        current_x += val
-                    else:
-                        current_x = val
-                    flipped_nums.append(f"{val:.2f}")
-                    x_coords.append(current_x)
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'V':
-            # Vertical line: only Y coordinate, flip it
-            for num in nums:
-                try:
-                    val = float(num)
-                    if is_relative:
-                        # For relative V: original_y_new = original_y_old + val
-                        # flipped_y_new = em - original_y_new = em - original_y_old - val
-                        # Since current_y (flipped) = em - original_y_old
-                        # flipped_y_new = current_y - val
-                        current_y = current_y - val
-                    else:
-                        # For absolute V: flip the coordinate
-                        current_y = em - val
-                    flipped_nums.append(f"{current_y:.2f}")
-                    y_coords.append(current_y)
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'C':
-            # Cubic bezier: (x1, y1, x2, y2, x, y) - 6 numbers
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [1, 3, 5]:  # Y coordinates
-                        val = em - val
-                        y_coords.append(val)
-                    else:  # X coordinates
-                        x_coords.append(val)
-                    if i == 4:  # x (second to last)
-                        if is_relative:
-                            current_x += float(nums[i])
-                        else:
-                            current_x = val
-                    elif i == 5:  # y (last)
-                        if is_relative:
-                            # For relative: original_y_new = original_y_old + orig_y
-                            # current_y (flipped) = em - original_y_old
-                            # new_y_flipped = em - original_y_new = current_y - orig_y
-                            orig_y = float(nums[i])
-                            current_y = current_y - orig_y
-                        else:
-                            current_y = val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'S':
-            # Smooth cubic bezier: (x2, y2, x, y) - 4 numbers
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [1, 3]:  # Y coordinates
-                        val = em - val
-                        y_coords.append(val)
-                    else:  # X coordinates
-                        x_coords.append(val)
-                    if i == 2:  # x
-                        if is_relative:
-                            current_x += float(nums[i])
-                        else:
-                            current_x = val
-                    elif i == 3:  # y
-                        if is_relative:
-                            orig_y = float(nums[i])
-                            current_y = em - (em - current_y + orig_y)
-                        else:
-                            current_y = val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'Q':
-            # Quadratic bezier: (x1, y1, x, y) - 4 numbers
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [1, 3]:  # Y coordinates
-                        val = em - val
-                        y_coords.append(val)
-                    else:  # X coordinates
-                        x_coords.append(val)
-                    if i == 2:  # x
-                        if is_relative:
-                            current_x += float(nums[i])
-                        else:
-                            current_x = val
-                    elif i == 3:  # y
-                        if is_relative:
-                            orig_y = float(nums[i])
-                            current_y = em - (em - current_y + orig_y)
-                        else:
-                            current_y = val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'T':
-            # Smooth quadratic bezier: (x, y) - 2 numbers
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i == 1:  # Y coordinate
-                        val = em - val
-                        y_coords.append(val)
-                        if is_relative:
-                            orig_y = float(nums[i])
-                            current_y = em - (em - current_y + orig_y)
-                        else:
-                            current_y = val
-                    else:  # X coordinate
-                        x_coords.append(val)
-                        if is_relative:
-                            current_x += val
-                        else:
-                            current_x = val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'A':
-            # Arc: (rx, ry, x-axis-rotation, large-arc-flag, sweep-flag, x, y) - 7 numbers
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i == 1:  # ry - flip it
-                        val = em - val
-                    elif i == 6:  # y - flip it
-                        val = em - val
-                        y_coords.append(val)
-                        if is_relative:
-                            orig_y = float(nums[i])
-                            current_y = em - (em - current_y + orig_y)
-                        else:
-                            current_y = val
-                    elif i == 5:  # x
-                        x_coords.append(val)
-                        if is_relative:
-                            current_x += val
-                        else:
-                            current_x = val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        else:
-            # M, L, m, l: (x, y) pairs - standard case
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i % 2 == 1:  # Y coordinate (odd index)
-                        val = em - val
-                        y_coords.append(val)
-                        if is_relative:
-                            orig_y = float(nums[i])
-                            current_y = em - (em - current_y + orig_y)
-                        else:
-                            current_y = val
-                    else:  # X coordinate (even index)
-                        x_coords.append(val)
-                        if is_relative:
-                            current_x += val
-                        else:
-                            current_x = val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-            # Set start position after processing M command coordinates
-            if cmd_upper == 'M' and len(nums) >= 2:
-                try:
-                    start_x = float(nums[0]) if not is_relative else current_x
-                    start_y = em - float(nums[1]) if not is_relative else current_y
-                except (ValueError, IndexError):
-                    pass
-        
-        flipped_args = ' '.join(flipped_nums)
-        flipped_commands.append((cmd, flipped_args))
-    
-    # Fallback: if we didn't extract coordinates properly, extract all numbers from flipped path
-    if not x_coords or not y_coords:
-        # Try to extract all coordinates from the flipped path string
-        flipped_path_str = ' '.join([f"{cmd} {args}" if args else cmd for cmd, args in flipped_commands])
-        all_nums = re.findall(r'[-+]?\d*\.?\d+', flipped_path_str)
-        try:
-            all_coords = [float(n) for n in all_nums]
-            if all_coords:
-                # Use all coordinates for bounding box (not perfect for H/V, but better than nothing)
-                # We'll use min/max of all coordinates as a rough bounding box
-                if not x_coords:
-                    x_coords = all_coords[::2] if len(all_coords) > 0 else []
-                if not y_coords:
-                    y_coords = all_coords[1::2] if len(all_coords) > 1 else []
-                # If still empty, use all coordinates as both X and Y (rough approximation)
-                if not x_coords and not y_coords:
-                    x_coords = all_coords
-                    y_coords = all_coords
-                elif not x_coords:
-                    x_coords = y_coords[:]
-                elif not y_coords:
-                    y_coords = x_coords[:]
-        except (ValueError, IndexError):
-            pass
-    
-    if not x_coords or not y_coords:
-        # Still no coordinates - return flipped path as-is
-        return ' '.join([f"{cmd} {args}" if args else cmd for cmd, args in flipped_commands])
-    
-    # Find bounding box of flipped path
-    min_x, max_x = min(x_coords), max(x_coords)
-    min_y, max_y = min(y_coords), max(y_coords)
-    
-    width = max_x - min_x if max_x != min_x else 1
-    height = max_y - min_y if max_y != min_y else 1
-    
-    # Always normalize to fit in em x em with padding (even if already in range)
-    # This ensures the letter is properly centered and scaled
-    if width > 0 and height > 0:
-        scale = min(em * (1 - 2*padding) / width, em * (1 - 2*padding) / height)
-        offset_x = em * padding - min_x * scale
-        offset_y = em * padding - min_y * scale
-    else:
-        # Fallback if width/height is 0
-        scale = 1
-        offset_x = em * padding
-        offset_y = em * padding
-    
-    # Step 2: Normalize the flipped path
-    def transform_coord(coord_str, is_x):
-        try:
-            val = float(coord_str)
-            if is_x:
-                return val * scale + offset_x
-            else:
-                return val * scale + offset_y
-        except ValueError:
-            return coord_str
-    
-    transformed_commands = []
-    
-    for cmd, args in flipped_commands:
-        if not args or cmd.upper() == 'Z':
-            transformed_commands.append(cmd)
-            continue
-        
-        cmd_upper = cmd.upper()
-        nums = re.findall(r'([-+]?\d*\.?\d+)', args)
-        transformed_nums = []
-        
-        if cmd_upper == 'H':
-            # Horizontal line: only X coordinate
-            for num in nums:
-                transformed_val = transform_coord(num, True)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'V':
-            # Vertical line: only Y coordinate
-            for num in nums:
-                transformed_val = transform_coord(num, False)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'C':
-            # Cubic bezier: (x1, y1, x2, y2, x, y) - 6 numbers
-            for i, num in enumerate(nums):
-                is_x = (i in [0, 2, 4])  # x1, x2, x are X coordinates
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'S':
-            # Smooth cubic bezier: (x2, y2, x, y) - 4 numbers
-            for i, num in enumerate(nums):
-                is_x = (i in [0, 2])  # x2, x are X coordinates
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'Q':
-            # Quadratic bezier: (x1, y1, x, y) - 4 numbers
-            for i, num in enumerate(nums):
-                is_x = (i in [0, 2])  # x1, x are X coordinates
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'T':
-            # Smooth quadratic bezier: (x, y) - 2 numbers
-            for i, num in enumerate(nums):
-                is_x = (i == 0)  # x is X coordinate
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'A':
-            # Arc: (rx, ry, x-axis-rotation, large-arc-flag, sweep-flag, x, y) - 7 numbers
-            # Transform rx, x-axis-rotation, x as X; ry, y as Y; flags stay as-is
-            for i, num in enumerate(nums):
-                if i in [2, 3, 4]:  # x-axis-rotation, flags - don't transform
-                    transformed_nums.append(num)
-                elif i == 1:  # ry - Y coordinate
-                    transformed_val = transform_coord(num, False)
-                    transformed_nums.append(f"{transformed_val:.2f}")
-                elif i == 0:  # rx - X coordinate
-                    transformed_val = transform_coord(num, True)
-                    transformed_nums.append(f"{transformed_val:.2f}")
-                elif i == 5:  # x - X coordinate
-                    transformed_val = transform_coord(num, True)
-                    transformed_nums.append(f"{transformed_val:.2f}")
-                elif i == 6:  # y - Y coordinate
-                    transformed_val = transform_coord(num, False)
-                    transformed_nums.append(f"{transformed_val:.2f}")
-                else:
-                    transformed_nums.append(num)
-        else:
-            # M, L, m, l: (x, y) pairs - standard case
-            for i, num in enumerate(nums):
-                is_x = (i % 2 == 0)
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        
-        transformed_args = ' '.join(transformed_nums)
-        transformed_commands.append(f"{cmd} {transformed_args}")
-    
-    return ' '.join(transformed_commands)
+    return normalize_path(path_d, em=em, padding=padding)
 
 
-def save_svg_file(path_d, output_path, letter_name, char):
+def save_svg_file(path_d, output_path, letter_name, char, quiet=False):
     """Save SVG path to a file."""
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
@@ -606,10 +188,55 @@ def save_svg_file(path_d, output_path, letter_name, char):
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(svg_content)
     
-    print(f"  ✓ Saved SVG to: {output_path}")
+    if not quiet:
+        print(f"  ✓ Saved SVG to: {output_path}")
+
+
+def extract_letter_path(letter_name, session, glyph_cache=None):
+    """Draw and normalize one letter from an open FontSession.
+    
+    Returns the normalized path string, or None if the glyph is missing.
+    With a glyph_cache (see extraction_cache.py) a cached path is returned
+    without touching the session, so a LazyFontSession is never opened.
+    Does no output file I/O, so batch workers can call it and let the
+    parent write.
+    """
+    codepoint = HINDI_LETTERS[letter_name]
+    if glyph_cache is not None:
+        cached = glyph_cache.get(codepoint_key(codepoint))
+        if cached:
+            return cached
+    
+    # Drawn straight into normalized coordinates (path_pen.py), so the
+    # only string produced is the final one
+    result = session.draw_normalized(codepoint)
+    if not result:
+        return None
+    
+    normalized_path = serialize_path(result[0])
+    if glyph_cache is not None:
+        glyph_cache.put(codepoint_key(codepoint), normalized_path)
+    return normalized_path
+
+
+def save_letter_outputs(letter_name, normalized_path, output_dir):
+    """Write {letter}_extracted.svg and {letter}_path.txt for one letter."""
+    char = chr(HINDI_LETTERS[letter_name])
+    
+    # Save SVG file
+    svg_output = os.path.join(output_dir, f"{letter_name}_extracted.svg")
+    save_svg_file(normalized_path, svg_output, letter_name, char)
+    
+    # Also save the path as a text file for easy copying
+    path_output = os.path.join(output_dir, f"{letter_name}_path.txt")
+    with open(path_output, 'w', encoding='utf-8') as f:
+        f.write(normalized_path)
+    
+    print(f"  ✓ Saved path to: {path_output}")
+    print(f"  ✓ Path: {normalized_path[:100]}...")
 
 
-def extract_letter(letter_name, font_bytes, output_dir, font_path=None):
+def extract_letter(letter_name, font_bytes, output_dir, font_path=None, session=None, glyph_cache=None):
     """Extract a single Hindi letter.
     
     Args:
@@ -617,6 +244,10 @@ def extract_letter(letter_name, font_bytes, output_dir, font_path=None):
         font_bytes: Font file bytes (None for TTC files)
         output_dir: Output directory for SVG files
         font_path: Path to font file (required for TTC files)
+        session: Shared FontSession; pass one when extracting many letters
+            so the font is parsed only once
+        glyph_cache: Optional GlyphCache (extraction_cache.py) holding
+            previously extracted paths for this font
     """
     if letter_name not in HINDI_LETTERS:
         print(f"Error: Unknown letter '{letter_name}'")
@@ -628,45 +259,34 @@ def extract_letter(letter_name, font_bytes, output_dir, font_path=None):
     
     print(f"\nExtracting {char} (U+{codepoint:04X}) - {letter_name}...")
     
-    result = extract_glyph_path(font_bytes, codepoint, font_path)
+    if session is None:
+        session = LazyFontSession(
+            lambda: open_font_session(font_bytes, font_path, probe_codepoints=[codepoint]))
     
-    if not result:
-        print(f"  ✗ Failed to extract glyph")
+    try:
+        normalized_path = extract_letter_path(letter_name, session, glyph_cache)
+    except FontOpenError as e:
+        print(f"Error loading font: {e}")
         return False
     
-    path_d, em = result
-    normalized_path = normalize_path_coordinates(path_d, em)
-    
-    # Save SVG file
-    svg_output = os.path.join(output_dir, f"{letter_name}_extracted.svg")
-    save_svg_file(normalized_path, svg_output, letter_name, char)
-    
-    # Also save the path as a text file for easy copying
-    path_output = os.path.join(output_dir, f"{letter_name}_path.txt")
-    with open(path_output, 'w', encoding='utf-8') as f:
-        f.write(normalized_path)
-    
-    print(f"  ✓ Saved path to: {path_output}")
-    print(f"  ✓ Path: {normalized_path[:100]}...")
+    if not normalized_path:
+        print(f"  ✗ Failed to extract glyph")
+        return False
     
+    save_letter_outputs(letter_name, normalized_path, output_dir)
     return True
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 extract_hindi_svg.py [letter_name|all] [font_path_or_url] [output_dir]")
-        print(f"\nAvailable letters: {', '.join(sorted(HINDI_LETTERS.keys()))}")
-        print("\nExamples:")
-        print("  python3 extract_hindi_svg.py ka")
-        print("  python3 extract_hindi_svg.py all")
-        print("  python3 extract_hindi_svg.py ka /path/to/font.ttf")
-        sys.exit(1)
+def load_font_source(font_path=None):
+    """Resolve the Devanagari font: an explicit path/URL, a local font, or a download.
     
-    letter_name = sys.argv[1].lower()
-    font_path = sys.argv[2] if len(sys.argv) > 2 else None
-    output_dir = sys.argv[3] if len(sys.argv) > 3 else "tools/svg_generator/out_hin"
+    Prioritizes Kohinoor Devanagari for better ligature support. Local fonts
+    (TTF and TTC alike) are used by path and memory-mapped when first needed,
+    so font_bytes is None for them.
     
-    # Load font - prioritize Kohinoor Devanagari for better ligature support
+    Returns:
+        (font_bytes, actual_font_path)
+    """
     font_bytes = None
     actual_font_path = None
     
@@ -674,12 +294,8 @@ def main():
         if os.path.isfile(font_path):
             print(f"Using specified font: {font_path}")
             actual_font_path = font_path
-            # For TTC files, we'll use the path directly
-            if not font_path.lower().endswith('.ttc'):
-                with open(font_path, 'rb') as f:
-                    font_bytes = f.read()
         else:
-            font_bytes = download_font(font_path)
+            actual_font_path = fetch_font([font_path])
     else:
         # Search for Kohinoor Devanagari first (better for preventing letter breaking)
         local_font = find_local_hindi_font()
@@ -688,18 +304,10 @@ def main():
             if 'Kohinoor' in local_font:
                 print("  ✓ Found Kohinoor Devanagari (better ligature/conjunct support)")
             actual_font_path = local_font
-            # For TTC files, we'll use the path directly
-            if not local_font.lower().endswith('.ttc'):
-                with open(local_font, 'rb') as f:
-                    font_bytes = f.read()
         else:
-            print(f"Downloading fallback font (Noto Sans Devanagari)...")
+            print(f"Using fallback font (Noto Sans Devanagari) from the font store...")
             print("  Note: Kohinoor Devanagari is recommended for better letter rendering")
-            for url in DEFAULT_FONT_URLS:
-                print(f"Trying: {url}")
-                font_bytes = download_font(url)
-                if font_bytes:
-                    break
+            actual_font_path = fetch_font(DEFAULT_FONT_URLS, name=DEFAULT_FONT_NAME)
     
     if not font_bytes and not actual_font_path:
         print("\nError: Could not load font")
@@ -709,16 +317,65 @@ def main():
         print("https://fonts.google.com/noto/specimen/Noto+Sans+Devanagari")
         sys.exit(1)
     
+    return font_bytes, actual_font_path
+
+
+def main():
+    jobs = pop_int_option(sys.argv, '--jobs', default=1)
+    use_cache = not pop_flag(sys.argv, '--no-cache')
+    axis_location = parse_axis_options(pop_list_option(sys.argv, '--axis'))
+    
+    if len(sys.argv) < 2:
+        print("Usage: python3 extract_hindi_svg.py [letter_name|all] [font_path_or_url] [output_dir] [--jobs N] [--no-cache] [--axis TAG=VALUE ...]")
+        print(f"\nAvailable letters: {', '.join(sorted(HINDI_LETTERS.keys()))}")
+        print("\nExamples:")
+        print("  python3 extract_hindi_svg.py ka")
+        print("  python3 extract_hindi_svg.py all")
+        print("  python3 extract_hindi_svg.py all --jobs 4")
+        print("  python3 extract_hindi_svg.py ka /path/to/font.ttf")
+        print("  python3 extract_hindi_svg.py all /path/to/variable.ttf --axis wght=300")
+        sys.exit(1)
+    
+    letter_name = sys.argv[1].lower()
+    font_path = sys.argv[2] if len(sys.argv) > 2 else None
+    output_dir = sys.argv[3] if len(sys.argv) > 3 else "tools/svg_generator/out_hin"
+    
+    # Load font - prioritize Kohinoor Devanagari for better ligature support
+    font_bytes, actual_font_path = load_font_source(font_path)
+    font_bytes, actual_font_path = instance_font_source(font_bytes, actual_font_path, axis_location)
+    glyph_cache = open_glyph_cache(font_bytes, actual_font_path, enabled=use_cache)
+    
+    if letter_name == 'all' and jobs > 1:
+        import batch_extract
+        ok = batch_extract.run_batch(
+            [batch_extract.BatchJob('hindi', font_bytes, actual_font_path, output_dir)],
+            jobs=jobs,
+            use_cache=use_cache,
+        )
+        if not ok:
+            sys.exit(1)
+        return
+    
+    # Parse the font once (and only on the first cache miss) and share it
+    # across every letter
+    def open_session():
+        session = open_font_session(font_bytes, actual_font_path)
+        if session.face_index is not None:
+            print(f"  Using collection face #{session.face_index}")
+        return session
+    
+    session = LazyFontSession(open_session)
+    
     # Extract letter(s)
     if letter_name == 'all':
         print(f"\nExtracting all Hindi letters...")
         success_count = 0
         for name in sorted(HINDI_LETTERS.keys()):
-            if extract_letter(name, font_bytes, output_dir, actual_font_path):
+            if extract_letter(name, font_bytes, output_dir, actual_font_path, session=session, glyph_cache=glyph_cache):
                 success_count += 1
         print(f"\n✓ Successfully extracted {success_count}/{len(HINDI_LETTERS)} letters")
     else:
-        if extract_letter(letter_name, font_bytes, output_dir, actual_font_path):
+        if extract_letter(letter_name, font_bytes, output_dir, actual_font_path, session=session, glyph_cache=glyph_cache):
             print(f"\n✓ Successfully extracted '{letter_name}'")
         else:
             sys.exit(1)
@@ -726,4 +383,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
@@ -14,21 +14,33 @@ Usage:
     
     # Extract with custom font path
     python3 tools/svg_generator/extract_telugu_svg.py aa /path/to/font.ttf
+    
+    # Extract all letters across 4 worker processes
+    python3 tools/svg_generator/extract_telugu_svg.py all --jobs 4
+    
+    # Ignore the extraction cache and redraw every glyph
+    python3 tools/svg_generator/extract_telugu_svg.py all --no-cache
+    
+    # Draw from a static instance of a variable font (see font_instance.py)
+    python3 tools/svg_generator/extract_telugu_svg.py all /path/to/variable.ttf --axis wght=300
+
+Fonts given by URL, and the default download, go through the local font
+store (font_store.py) and are downloaded at most once. Set
+SVG_GENERATOR_OFFLINE=1 to never touch the network.
 
-Dependencies: fonttools, requests
+Dependencies: fonttools, requests (only for downloads)
 Install: python3 -m pip install --user fonttools requests
 """
 import sys
-import io
 import os
-import json
-import re
-import glob
-import requests
-from pathlib import Path
-from fontTools.ttLib import TTFont
-from fontTools.pens.svgPathPen import SVGPathPen
-from fontTools.pens.recordingPen import RecordingPen
+
+from cli_options import pop_flag, pop_int_option, pop_list_option
+from font_catalog import find_font
+from font_instance import instance_font_source, parse_axis_options
+from font_store import fetch_font
+from extraction_cache import codepoint_key, open_glyph_cache
+from font_session import FONT_OPEN_ERRORS, FontOpenError, FontSession, LazyFontSession
+from path_ir import normalize_path, serialize_path
 
 # Telugu Unicode range: U+0C00 to U+0C7F
 # Complete mapping of Telugu letters
@@ -81,7 +93,8 @@ TELUGU_LETTERS = {
     'ha': 0x0C39,     # హ
 }
 
-# Try multiple possible URLs for Noto Sans Telugu
+# Family name the default font is stored under (font_store.py)
+DEFAULT_FONT_NAME = "Noto Sans Telugu"
 DEFAULT_FONT_URLS = [
     "https://github.com/google/fonts/raw/main/apache/notosanstelugu/NotoSansTelugu-Regular.ttf",
     "https://cdn.jsdelivr.net/gh/google/fonts@main/apache/notosanstelugu/NotoSansTelugu-Regular.ttf",
@@ -91,293 +104,59 @@ DEFAULT_FONT_URLS = [
 
 
 def find_local_telugu_font():
-    """Search common locations for Telugu fonts."""
-    # First check for downloaded_font.ttf in the workspace
-    workspace_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    workspace_font = os.path.join(workspace_root, "downloaded_font.ttf")
-    if os.path.isfile(workspace_font):
-        return workspace_font
-    
-    possible_paths = [
-        "/System/Library/Fonts/*Telugu*.ttf",
-        "/Library/Fonts/*Telugu*.ttf",
-        os.path.expanduser("~/Library/Fonts/*Telugu*.ttf"),
-        "/usr/share/fonts/**/*Telugu*.ttf",
-        "/usr/local/share/fonts/**/*Telugu*.ttf",
-        "C:/Windows/Fonts/*Telugu*.ttf",
-    ]
-    
-    for pattern in possible_paths:
-        try:
-            matches = glob.glob(pattern, recursive=True)
-            if matches:
-                return matches[0]
-        except Exception:
-            pass
+    """Find an installed Telugu font via the cached font catalog (font_catalog.py).
     
-    return None
+    downloaded_font.ttf in the workspace wins, then the face covering most of
+    the Telugu block.
+    """
+    workspace_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    workspace_font = os.path.join(workspace_root, "downloaded_font.ttf")
+    face = find_font('telugu', prefer_paths=[workspace_font], prefer_families=('Telugu',))
+    return face.path if face else None
 
 
 def download_font(url):
-    """Download font from URL."""
-    print(f"Downloading font from: {url}")
-    try:
-        r = requests.get(url, allow_redirects=True, timeout=30)
-        r.raise_for_status()
-        return r.content
-    except Exception as e:
-        print(f"Error downloading font: {e}")
+    """Fetch a font by URL through the local font store (font_store.py).
+    
+    A font already in the store (or seeded from the repo) is returned without
+    touching the network. Returns the font bytes, or None.
+    """
+    font_path = fetch_font([url])
+    if not font_path:
         return None
+    with open(font_path, 'rb') as f:
+        return f.read()
 
 
-def extract_glyph_path(font_bytes, codepoint):
-    """Extract SVG path for a glyph from font bytes."""
-    try:
-        font = TTFont(io.BytesIO(font_bytes))
-    except Exception as e:
-        print(f"Error loading font: {e}")
-        return None
-    
-    # Get the best cmap
-    cmap = font.getBestCmap()
+def extract_glyph_path(font_bytes, codepoint, session=None):
+    """Extract SVG path for a glyph from font bytes.
     
-    if codepoint not in cmap:
-        # Try all cmaps
-        for subtable in font['cmap'].tables:
-            if codepoint in subtable.cmap:
-                cmap = subtable.cmap
-                break
-        else:
+    Pass an open FontSession to draw from an already-parsed font; otherwise
+    a one-off session is opened for this glyph.
+    """
+    if session is None:
+        try:
+            session = open_font_session(font_bytes)
+        except FONT_OPEN_ERRORS as e:
+            print(f"Error loading font: {e}")
             return None
     
-    glyph_name = cmap[codepoint]
-    glyph_set = font.getGlyphSet()
-    
-    if glyph_name not in glyph_set:
-        return None
-    
-    glyph = glyph_set[glyph_name]
-    pen = SVGPathPen(glyph_set)
-    glyph.draw(pen)
-    path_d = pen.getCommands()
-    
-    if not path_d or path_d.strip() == 'M 0 0 Z':
-        return None
-    
-    # Get units per em for scaling
-    em = font['head'].unitsPerEm if 'head' in font else 1000
-    
-    return path_d, em
+    return session.draw_svg_path(codepoint)
+
+
+def open_font_session(font_bytes, font_path=None):
+    """Open a FontSession for a Telugu font so it is parsed only once per run."""
+    return FontSession(font_bytes=font_bytes, font_path=font_path, probe_codepoints=TELUGU_LETTERS.values())
 
 
 def normalize_path_coordinates(path_d, em=1000, padding=0.1):
     """Normalize SVG path coordinates to fit in viewBox with padding.
     
     Fonts use Y-up coordinates (Y increases upward), but SVG/Flutter use Y-down.
-    So we first flip Y coordinates, then normalize.
+    The path is parsed once into a PathIR (path_ir.py); the Y flip, scale and
+    offset are applied there in a single pass before formatting it again.
     """
-    # First, flip Y coordinates (fonts use Y-up, SVG uses Y-down)
-    commands = re.findall(r'([MmLlHhVvCcSsQqTtAaZz])\s*([-\d.,\s]+)?', path_d)
-    
-    # Step 1: Flip Y coordinates in original path
-    flipped_commands = []
-    for cmd, args in commands:
-        if not args or cmd.upper() == 'Z':
-            flipped_commands.append((cmd, args))
-            continue
-        
-        cmd_upper = cmd.upper()
-        nums = re.findall(r'([-+]?\d*\.?\d+)', args)
-        flipped_nums = []
-        
-        if cmd_upper == 'H':
-            # Horizontal line: only X coordinate, no Y to flip
-            flipped_nums = nums
-        elif cmd_upper == 'V':
-            # Vertical line: only Y coordinate, flip it
-            for num in nums:
-                try:
-                    val = float(num)
-                    val = em - val  # Flip Y
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'C':
-            # Cubic bezier: (x1, y1, x2, y2, x, y) - 6 numbers
-            # Flip y1, y2, and y (indices 1, 3, 5)
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [1, 3, 5]:  # Y coordinates
-                        val = em - val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'S':
-            # Smooth cubic bezier: (x2, y2, x, y) - 4 numbers
-            # Flip y2 and y (indices 1, 3)
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [1, 3]:  # Y coordinates
-                        val = em - val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'Q':
-            # Quadratic bezier: (x1, y1, x, y) - 4 numbers
-            # Flip y1 and y (indices 1, 3)
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [1, 3]:  # Y coordinates
-                        val = em - val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'T':
-            # Smooth quadratic bezier: (x, y) - 2 numbers
-            # Flip y (index 1)
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i == 1:  # Y coordinate
-                        val = em - val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        elif cmd_upper == 'A':
-            # Arc: (rx, ry, x-axis-rotation, large-arc-flag, sweep-flag, x, y) - 7 numbers
-            # Flip ry and y (indices 1, 6)
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i in [1, 6]:  # ry and y coordinates
-                        val = em - val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        else:
-            # M, L, m, l: (x, y) pairs - standard case
-            for i, num in enumerate(nums):
-                try:
-                    val = float(num)
-                    if i % 2 == 1:  # Y coordinate (odd index)
-                        val = em - val
-                    flipped_nums.append(f"{val:.2f}")
-                except ValueError:
-                    flipped_nums.append(num)
-        
-        flipped_args = ' '.join(flipped_nums)
-        flipped_commands.append((cmd, flipped_args))
-    
-    # Step 2: Extract coordinates from flipped path for bounding box
-    coords = []
-    for cmd, args in flipped_commands:
-        if not args or cmd.upper() == 'Z':
-            continue
-        nums = re.findall(r'[-+]?\d*\.?\d+', args)
-        for num in nums:
-            try:
-                coords.append(float(num))
-            except ValueError:
-                pass
-    
-    if not coords:
-        # Reconstruct path from flipped commands
-        return ' '.join([f"{cmd} {args}" if args else cmd for cmd, args in flipped_commands])
-    
-    # Find bounding box of flipped path
-    x_coords = [coords[i] for i in range(0, len(coords), 2) if i < len(coords)]
-    y_coords = [coords[i+1] for i in range(0, len(coords), 2) if i+1 < len(coords)]
-    
-    if not x_coords or not y_coords:
-        return ' '.join([f"{cmd} {args}" if args else cmd for cmd, args in flipped_commands])
-    
-    min_x, max_x = min(x_coords), max(x_coords)
-    min_y, max_y = min(y_coords), max(y_coords)
-    
-    width = max_x - min_x if max_x != min_x else em
-    height = max_y - min_y if max_y != min_y else em
-    
-    # Calculate scale and offset to fit in em x em with padding
-    scale = min(em * (1 - 2*padding) / width, em * (1 - 2*padding) / height) if width > 0 and height > 0 else 1
-    offset_x = em * padding - min_x * scale
-    offset_y = em * padding - min_y * scale
-    
-    # Step 3: Normalize the flipped path
-    def transform_coord(coord_str, is_x):
-        try:
-            val = float(coord_str)
-            if is_x:
-                return val * scale + offset_x
-            else:
-                return val * scale + offset_y
-        except ValueError:
-            return coord_str
-    
-    transformed_commands = []
-    
-    for cmd, args in flipped_commands:
-        if not args or cmd.upper() == 'Z':
-            transformed_commands.append(cmd)
-            continue
-        
-        cmd_upper = cmd.upper()
-        nums = re.findall(r'([-+]?\d*\.?\d+)', args)
-        transformed_nums = []
-        
-        if cmd_upper == 'H':
-            # Horizontal line: only X coordinate
-            for num in nums:
-                transformed_val = transform_coord(num, True)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'V':
-            # Vertical line: only Y coordinate
-            for num in nums:
-                transformed_val = transform_coord(num, False)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'C':
-            # Cubic bezier: (x1, y1, x2, y2, x, y) - 6 numbers
-            for i, num in enumerate(nums):
-                is_x = (i in [0, 2, 4])  # x1, x2, x are X coordinates
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'S':
-            # Smooth cubic bezier: (x2, y2, x, y) - 4 numbers
-            for i, num in enumerate(nums):
-                is_x = (i in [0, 2])  # x2, x are X coordinates
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'Q':
-            # Quadratic bezier: (x1, y1, x, y) - 4 numbers
-            for i, num in enumerate(nums):
-                is_x = (i in [0, 2])  # x1, x are X coordinates
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'T':
-            # Smooth quadratic bezier: (x, y) - 2 numbers
-            for i, num in enumerate(nums):
-                is_x = (i == 0)  # x is X coordinate
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        elif cmd_upper == 'A':
-            # Arc: (rx, ry, x-axis-rotation, large-arc-flag, sweep-flag, x, y) - 7 numbers
-            for i, num in enumerate(nums):
-                is_x = (i not in [1, 6])  # Everything except ry (1) and y (6)
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        else:
-            # M, L, m, l: (x, y) pairs - standard case
-            for i, num in enumerate(nums):
-                is_x = (i % 2 == 0)
-                transformed_val = transform_coord(num, is_x)
-                transformed_nums.append(f"{transformed_val:.2f}")
-        
-        transformed_args = ' '.join(transformed_nums)
-        transformed_commands.append(f"{cmd} {transformed_args}")
-    
-    return ' '.join(transformed_commands)
+    return normalize_path(path_d, em=em, padding=padding)
 
 
 def save_svg_file(path_d, output_path, letter_name, char):
@@ -395,26 +174,36 @@ def save_svg_file(path_d, output_path, letter_name, char):
     print(f"  ✓ Saved SVG to: {output_path}")
 
 
-def extract_letter(letter_name, font_bytes, output_dir):
-    """Extract a single Telugu letter."""
-    if letter_name not in TELUGU_LETTERS:
-        print(f"Error: Unknown letter '{letter_name}'")
-        print(f"Available letters: {', '.join(sorted(TELUGU_LETTERS.keys()))}")
-        return False
-    
+def extract_letter_path(letter_name, session, glyph_cache=None):
+    """Draw and normalize one letter from an open FontSession.
+    
+    Returns the normalized path string, or None if the glyph is missing.
+    With a glyph_cache (see extraction_cache.py) a cached path is returned
+    without touching the session, so a LazyFontSession is never opened.
+    Does no output file I/O, so batch workers can call it and let the
+    parent write.
+    """
     codepoint = TELUGU_LETTERS[letter_name]
-    char = chr(codepoint)
-    
-    print(f"\nExtracting {char} (U+{codepoint:04X}) - {letter_name}...")
-    
-    result = extract_glyph_path(font_bytes, codepoint)
-    
+    if glyph_cache is not None:
+        cached = glyph_cache.get(codepoint_key(codepoint))
+        if cached:
+            return cached
+    
+    # Drawn straight into normalized coordinates (path_pen.py), so the
+    # only string produced is the final one
+    result = session.draw_normalized(codepoint)
     if not result:
-        print(f"  ✗ Failed to extract glyph")
-        return False
+        return None
     
-    path_d, em = result
-    normalized_path = normalize_path_coordinates(path_d, em)
+    normalized_path = serialize_path(result[0])
+    if glyph_cache is not None:
+        glyph_cache.put(codepoint_key(codepoint), normalized_path)
+    return normalized_path
+
+
+def save_letter_outputs(letter_name, normalized_path, output_dir):
+    """Write {letter}_extracted.svg and {letter}_path.txt for one letter."""
+    char = chr(TELUGU_LETTERS[letter_name])
     
     # Save SVG file
     svg_output = os.path.join(output_dir, f"{letter_name}_extracted.svg")
@@ -427,64 +216,127 @@ def extract_letter(letter_name, font_bytes, output_dir):
     
     print(f"  ✓ Saved path to: {path_output}")
     print(f"  ✓ Path: {normalized_path[:100]}...")
+
+
+def extract_letter(letter_name, font_bytes, output_dir, session=None, glyph_cache=None, font_path=None):
+    """Extract a single Telugu letter.
+    
+    Pass a shared FontSession when extracting many letters so the font is
+    parsed only once, and a glyph_cache to reuse previously extracted paths.
+    """
+    if letter_name not in TELUGU_LETTERS:
+        print(f"Error: Unknown letter '{letter_name}'")
+        print(f"Available letters: {', '.join(sorted(TELUGU_LETTERS.keys()))}")
+        return False
+    
+    codepoint = TELUGU_LETTERS[letter_name]
+    char = chr(codepoint)
+    
+    print(f"\nExtracting {char} (U+{codepoint:04X}) - {letter_name}...")
+    
+    if session is None:
+        session = LazyFontSession(lambda: open_font_session(font_bytes, font_path))
     
+    try:
+        normalized_path = extract_letter_path(letter_name, session, glyph_cache)
+    except FontOpenError as e:
+        print(f"Error loading font: {e}")
+        return False
+    
+    if not normalized_path:
+        print(f"  ✗ Failed to extract glyph")
+        return False
+    
+    save_letter_outputs(letter_name, normalized_path, output_dir)
     return True
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 extract_telugu_svg.py [letter_name|all] [font_path_or_url] [output_dir]")
-        print(f"\nAvailable letters: {', '.join(sorted(TELUGU_LETTERS.keys()))}")
-        print("\nExamples:")
-        print("  python3 extract_telugu_svg.py aa")
-        print("  python3 extract_telugu_svg.py all")
-        print("  python3 extract_telugu_svg.py aa /path/to/font.ttf")
-        sys.exit(1)
+def load_font_source(font_path=None):
+    """Resolve the font to use: an explicit path/URL, a local font, or a download.
     
-    letter_name = sys.argv[1].lower()
-    font_path = sys.argv[2] if len(sys.argv) > 2 else None
-    output_dir = sys.argv[3] if len(sys.argv) > 3 else "tools/svg_generator/output"
+    Fonts are not read into memory here: local fonts are used by path and
+    downloads are saved to the font store (font_store.py) and used by their
+    stored path, so font_bytes is None and the font is memory-mapped from
+    actual_font_path when first needed.
     
-    # Load font
+    Returns:
+        (font_bytes, actual_font_path)
+    """
     font_bytes = None
+    actual_font_path = None
     if font_path:
         if os.path.isfile(font_path):
             print(f"Using local font: {font_path}")
-            with open(font_path, 'rb') as f:
-                font_bytes = f.read()
+            actual_font_path = font_path
         else:
-            font_bytes = download_font(font_path)
+            actual_font_path = fetch_font([font_path])
     else:
         local_font = find_local_telugu_font()
         if local_font:
             print(f"Using local font: {local_font}")
-            with open(local_font, 'rb') as f:
-                font_bytes = f.read()
+            actual_font_path = local_font
         else:
-            print(f"Downloading default font...")
-            for url in DEFAULT_FONT_URLS:
-                print(f"Trying: {url}")
-                font_bytes = download_font(url)
-                if font_bytes:
-                    break
-    
-    if not font_bytes:
+            print(f"Using default font from the font store...")
+            actual_font_path = fetch_font(DEFAULT_FONT_URLS, name=DEFAULT_FONT_NAME)
+    
+    if not font_bytes and not actual_font_path:
         print("\nError: Could not load font")
         print("Please provide a font path or URL as the second argument")
         print("\nYou can download NotoSansTelugu-Regular.ttf from:")
         print("https://fonts.google.com/noto/specimen/Noto+Sans+Telugu")
         sys.exit(1)
     
+    return font_bytes, actual_font_path
+
+
+def main():
+    jobs = pop_int_option(sys.argv, '--jobs', default=1)
+    use_cache = not pop_flag(sys.argv, '--no-cache')
+    axis_location = parse_axis_options(pop_list_option(sys.argv, '--axis'))
+    
+    if len(sys.argv) < 2:
+        print("Usage: python3 extract_telugu_svg.py [letter_name|all] [font_path_or_url] [output_dir] [--jobs N] [--no-cache] [--axis TAG=VALUE ...]")
+        print(f"\nAvailable letters: {', '.join(sorted(TELUGU_LETTERS.keys()))}")
+        print("\nExamples:")
+        print("  python3 extract_telugu_svg.py aa")
+        print("  python3 extract_telugu_svg.py all")
+        print("  python3 extract_telugu_svg.py all --jobs 4")
+        print("  python3 extract_telugu_svg.py aa /path/to/font.ttf")
+        sys.exit(1)
+    
+    letter_name = sys.argv[1].lower()
+    font_path = sys.argv[2] if len(sys.argv) > 2 else None
+    output_dir = sys.argv[3] if len(sys.argv) > 3 else "tools/svg_generator/output"
+    
+    # Load font
+    font_bytes, actual_font_path = load_font_source(font_path)
+    font_bytes, actual_font_path = instance_font_source(font_bytes, actual_font_path, axis_location)
+    glyph_cache = open_glyph_cache(font_bytes, actual_font_path, enabled=use_cache)
+    
     # Extract letter(s)
     if letter_name == 'all':
+        if jobs > 1:
+            import batch_extract
+            ok = batch_extract.run_batch(
+                [batch_extract.BatchJob('telugu', font_bytes, actual_font_path, output_dir)],
+                jobs=jobs,
+                use_cache=use_cache,
+            )
+            if not ok:
+                sys.exit(1)
+            return
+        
         print(f"\nExtracting all Telugu letters...")
+        # Parsed on the first cache miss only, then shared across letters
+        session = LazyFontSession(lambda: open_font_session(font_bytes, actual_font_path))
         success_count = 0
         for name in sorted(TELUGU_LETTERS.keys()):
-            if extract_letter(name, font_bytes, output_dir):
+            if extract_letter(name, font_bytes, output_dir, session=session, glyph_cache=glyph_cache):
                 success_count += 1
         print(f"\n✓ Successfully extracted {success_count}/{len(TELUGU_LETTERS)} letters")
     else:
-        if extract_letter(letter_name, font_bytes, output_dir):
+        if extract_letter(letter_name, font_bytes, output_dir, glyph_cache=glyph_cache,
+                          font_path=actual_font_path):
             print(f"\n✓ Successfully extracted '{letter_name}'")
         else:
             sys.exit(1)
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+extraction_cache.py - Content-addressed on-disk cache for extracted glyph paths
+
+Every run of the svg_generator scripts used to redraw and renormalize every
+glyph even when neither the font nor the code had changed. This cache stores
+the final normalized path for each glyph under a key made of:
+
+  (font SHA-256, face index, codepoint or shaped text, em, padding, TOOL_VERSION)
+
+so a repeat run reads the paths back without opening the font at all.
+
+Entries live in one small JSON file each, under
+  $SVG_GENERATOR_CACHE_DIR  (default: ~/.cache/svg_generator)/paths/
+and are evicted least-recently-used first once the total size passes
+$SVG_GENERATOR_CACHE_MAX_MB (default: 64). Reading an entry refreshes its
+mtime, which is what the LRU order is based on.
+
+The static variable-font instances of font_instance.py, in instances/ under
+the same root, count towards that size and are evicted the same way. Their
+LRU stamp is the access time (see touch_instance), since their mtime is part
+of the font hash index key.
+
+Pass --no-cache to the extractor scripts to bypass the cache entirely.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+import time
+from pathlib import Path
+
+
+# Bump whenever a change to drawing or normalization changes the paths the
+# extractors produce, so stale cache entries stop matching.
+TOOL_VERSION = "2"
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "svg_generator")
+DEFAULT_MAX_MB = 64
+
+# Name of the file that remembers font hashes by (path, size, mtime), so a
+# multi-megabyte font is not re-hashed on every run.
+FONT_HASH_INDEX = "font_hashes.json"
+
+# Subfolder of the cache root holding font_instance.py's static instances
+INSTANCES_DIR = "instances"
+
+
+def cache_dir_from_env():
+    """Return the cache root directory ($SVG_GENERATOR_CACHE_DIR or the default)."""
+    return os.environ.get("SVG_GENERATOR_CACHE_DIR") or DEFAULT_CACHE_DIR
+
+
+def _atomic_write(path, data):
+    """Write bytes to path via a temp file + rename, safe for parallel workers."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class ExtractionCache:
+    """On-disk, size-bounded LRU cache of normalized glyph paths.
+
+    Args:
+        cache_dir: Cache root (defaults to $SVG_GENERATOR_CACHE_DIR)
+        max_bytes: Size limit for stored paths before LRU eviction kicks in
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        self.root = Path(cache_dir or cache_dir_from_env())
+        self.paths_dir = self.root / "paths"
+        self.instances_dir = self.root / INSTANCES_DIR
+        if max_bytes is None:
+            max_mb = float(os.environ.get("SVG_GENERATOR_CACHE_MAX_MB", DEFAULT_MAX_MB))
+            max_bytes = int(max_mb * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self._total_bytes = None
+
+    # ------------------------------------------------------------------
+    # Font hashing
+    # ------------------------------------------------------------------
+
+    def font_hash(self, font_bytes=None, font_path=None):
+        """SHA-256 of the font file contents.
+
+        For files on disk the digest is remembered by (path, size, mtime) so
+        repeat runs only stat the font instead of hashing it again.
+        """
+        if not font_path or not os.path.isfile(font_path):
+            return hashlib.sha256(font_bytes).hexdigest()
+
+        stat = os.stat(font_path)
+        stamp = f"{os.path.abspath(font_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        index_path = self.root / FONT_HASH_INDEX
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+
+        digest = index.get(stamp)
+        if digest:
+            return digest
+
+        if font_bytes is None:
+            h = hashlib.sha256()
+            with open(font_path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    h.update(block)
+            digest = h.hexdigest()
+        else:
+            digest = hashlib.sha256(font_bytes).hexdigest()
+
+        index[stamp] = digest
+        _atomic_write(str(index_path), json.dumps(index, indent=2).encode("utf-8"))
+        return digest
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(font_sha, face_index, glyph, em, padding):
+        """Build the content-addressed key for one glyph extraction."""
+        fields = {
+            "font": font_sha,
+            "face": "auto" if face_index is None else face_index,
+            "glyph": glyph,
+            "em": "font" if em is None else em,
+            "padding": padding,
+            "version": TOOL_VERSION,
+        }
+        blob = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key):
+        return self.paths_dir / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        """Return the stored value for key, or None. Refreshes the LRU stamp."""
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key, value):
+        """Store a JSON-serializable value under key, evicting old entries if needed."""
+        data = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        entry = self._entry_path(key)
+        _atomic_write(str(entry), data)
+
+        if self._total_bytes is None:
+            self._total_bytes = self._scan_total()
+        else:
+            self._total_bytes += len(data)
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        """(LRU stamp, size, path) of every stored path and font instance."""
+        entries = []
+        for folder, pattern, use_atime in ((self.paths_dir, "*/*.json", False),
+                                           (self.instances_dir, "*.ttf", True)):
+            if not folder.is_dir():
+                continue
+            for entry in folder.glob(pattern):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                stamp = max(stat.st_atime, stat.st_mtime) if use_atime else stat.st_mtime
+                entries.append((stamp, stat.st_size, entry))
+        return entries
+
+    def touch_instance(self, instance_path):
+        """Refresh a font instance's LRU stamp without changing its mtime."""
+        try:
+            stat = os.stat(instance_path)
+            os.utime(instance_path, ns=(time.time_ns(), stat.st_mtime_ns))
+        except OSError:
+            pass
+
+    def trim(self, keep=None):
+        """Evict least-recently-used entries if the cache is over max_bytes.
+
+        keep: a file that must survive (e.g. the instance just built)
+        """
+        self._total_bytes = self._scan_total()
+        if self._total_bytes > self.max_bytes:
+            self.evict(keep=keep)
+
+    def _scan_total(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, target_bytes=None, keep=None):
+        """Delete least-recently-used entries until the cache fits target_bytes.
+
+        Defaults to 90% of max_bytes so eviction does not run on every put.
+        The file keep, if given, is never deleted.
+        """
+        if target_bytes is None:
+            target_bytes = int(self.max_bytes * 0.9)
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry in entries:
+            if total <= target_bytes:
+                break
+            if keep is not None and os.path.abspath(entry) == os.path.abspath(keep):
+                continue
+            try:
+                entry.unlink()
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+        self._total_bytes = total
+        return removed
+
+    def bind(self, font_bytes=None, font_path=None, face_index=None, em=None, padding=0.1):
+        """Return a GlyphCache for one font and normalization setting."""
+        return GlyphCache(self, self.font_hash(font_bytes, font_path), face_index, em, padding)
+
+
+class GlyphCache:
+    """ExtractionCache view bound to a single font, face, em and padding."""
+
+    def __init__(self, cache, font_sha, face_index=None, em=None, padding=0.1):
+        self.cache = cache
+        self.font_sha = font_sha
+        self.face_index = face_index
+        self.em = em
+        self.padding = padding
+
+    def _key(self, glyph):
+        return self.cache.make_key(self.font_sha, self.face_index, glyph, self.em, self.padding)
+
+    def get(self, glyph):
+        """Return the cached normalized path for a glyph key, or None."""
+        value = self.cache.get(self._key(glyph))
+        return value.get("path") if value else None
+
+    def put(self, glyph, path_d):
+        """Store the normalized path for a glyph key."""
+        self.cache.put(self._key(glyph), {"glyph": glyph, "path": path_d})
+
+
+def codepoint_key(codepoint):
+    """Glyph key used for single-codepoint extractions, e.g. 'U+0915'."""
+    return f"U+{codepoint:04X}"
+
+
+def open_glyph_cache(font_bytes=None, font_path=None, enabled=True, face_index=None, padding=0.1):
+    """Convenience for the extractor scripts: a GlyphCache, or None when disabled."""
+    if not enabled:
+        return None
+    try:
+        return ExtractionCache().bind(font_bytes, font_path, face_index=face_index, padding=padding)
+    except OSError as e:
+        print(f"  Note: extraction cache unavailable ({e}); continuing without it")
+        return None
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+font_catalog.py - Persistent index of installed fonts and the scripts they cover
+
+find_local_hindi_font / find_local_telugu_font used to run recursive globs
+over /usr/share/fonts/** (and friends) on every call, and the Kohinoor check
+opened every candidate .ttc to walk its name table. The catalog scans the
+font directories once and remembers, for every face:
+
+  path, face index (for .ttc collections), family name,
+  and how many codepoints it maps in each Unicode block of BLOCKS
+
+It is stored as JSON next to the extraction cache
+($SVG_GENERATOR_CACHE_DIR/font_catalog.json). On later runs a directory is
+only re-listed when its mtime changed, and a font is only re-read when its
+size or mtime changed, so resolving "the best Devanagari face" is a few
+stat calls.
+
+Usage:
+  python3 tools/svg_generator/font_catalog.py [devanagari|telugu|...] [--rescan]
+
+From another script in this folder:
+
+    from font_catalog import find_font
+
+    face = find_font('telugu', prefer_paths=[workspace_font])
+    if face:
+        print(face.path, face.face_index, face.family)
+
+Dependencies: fonttools
+"""
+
+import os
+import sys
+import json
+from collections import namedtuple
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from extraction_cache import _atomic_write, cache_dir_from_env
+
+
+# Bump when the entry format below changes
+CATALOG_VERSION = 1
+CATALOG_FILE = "font_catalog.json"
+
+FONT_EXTENSIONS = (".ttf", ".otf", ".ttc", ".otc")
+
+# Unicode blocks whose coverage is recorded per face
+BLOCKS = {
+    'latin': (0x0020, 0x007F),
+    'arabic': (0x0600, 0x06FF),
+    'devanagari': (0x0900, 0x097F),
+    'telugu': (0x0C00, 0x0C7F),
+}
+
+# A face must map at least this many codepoints of a block to count as
+# covering it (keeps e.g. Latin fonts with a danda or two out)
+MIN_BLOCK_COVERAGE = 40
+
+WORKSPACE_ROOT = SCRIPT_DIR.parent.parent
+
+# (directory, recursive)
+DEFAULT_ROOTS = [
+    ("/System/Library/Fonts", True),
+    ("/Library/Fonts", True),
+    (os.path.expanduser("~/Library/Fonts"), True),
+    ("/usr/share/fonts", True),
+    ("/usr/local/share/fonts", True),
+    (os.path.expanduser("~/.fonts"), True),
+    (os.path.expanduser("~/.local/share/fonts"), True),
+    ("C:/Windows/Fonts", False),
+    # Fonts checked into this repo
+    (str(WORKSPACE_ROOT), False),
+    (str(SCRIPT_DIR), False),
+]
+
+FontFace = namedtuple('FontFace', ['path', 'face_index', 'family', 'coverage'])
+
+
+def _read_faces(font_path):
+    """Read family name and block coverage of every face in a font file."""
+    from fontTools.ttLib import TTFont
+
+    with open(font_path, "rb") as f:
+        header = f.read(12)
+    if header[:4] == b"ttcf":
+        count = int.from_bytes(header[8:12], "big")
+        indices = list(range(count))
+    else:
+        indices = [None]
+
+    faces = []
+    for index in indices:
+        try:
+            if index is None:
+                font = TTFont(font_path, lazy=True)
+            else:
+                font = TTFont(font_path, fontNumber=index, lazy=True)
+            cmap = font.getBestCmap() or {}
+            family = None
+            if 'name' in font:
+                family = font['name'].getBestFamilyName()
+            font.close()
+        except Exception:
+            continue
+
+        coverage = {}
+        for block, (first, last) in BLOCKS.items():
+            hits = sum(1 for cp in cmap if first <= cp <= last)
+            if hits:
+                coverage[block] = hits
+        faces.append({"index": index, "family": family or "", "coverage": coverage})
+    return faces
+
+
+class FontCatalog:
+    """Scanned font directories plus per-face coverage, persisted as JSON.
+
+    Args:
+        cache_dir: Where font_catalog.json lives (defaults to the
+            extraction cache root)
+        roots: list of (directory, recursive) to scan
+    """
+
+    def __init__(self, cache_dir=None, roots=None):
+        self.path = Path(cache_dir or cache_dir_from_env()) / CATALOG_FILE
+        self.roots = roots if roots is not None else DEFAULT_ROOTS
+        self._data = None
+        self._dirty = False
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CATALOG_VERSION:
+                return data
+        except (OSError, ValueError):
+            pass
+        return {"version": CATALOG_VERSION, "dirs": {}, "fonts": {}}
+
+    def _save(self):
+        if not self._dirty:
+            return
+        try:
+            _atomic_write(str(self.path), json.dumps(self._data, indent=1).encode("utf-8"))
+        except OSError as e:
+            print(f"  Note: could not save font catalog ({e})")
+        self._dirty = False
+
+    def _list_dir(self, directory, recursive, seen_files):
+        """Collect font files under directory, reusing listings whose mtime is unchanged."""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return
+
+        dirs = self._data["dirs"]
+        entry = dirs.get(directory)
+        if entry is None or entry["mtime"] != mtime:
+            files, subdirs = [], []
+            try:
+                with os.scandir(directory) as it:
+                    for item in it:
+                        try:
+                            if item.is_dir(follow_symlinks=False):
+                                subdirs.append(item.path)
+                            elif item.name.lower().endswith(FONT_EXTENSIONS):
+                                files.append(item.path)
+                        except OSError:
+                            continue
+            except OSError:
+                return
+            entry = {"mtime": mtime, "files": sorted(files), "subdirs": sorted(subdirs)}
+            dirs[directory] = entry
+            self._dirty = True
+
+        seen_files.extend(entry["files"])
+        if recursive:
+            for subdir in entry["subdirs"]:
+                self._list_dir(subdir, True, seen_files)
+
+    def refresh(self, rescan=False):
+        """Bring the catalog up to date with the font directories on disk."""
+        self._data = {"version": CATALOG_VERSION, "dirs": {}, "fonts": {}} if rescan else self._load()
+        if rescan:
+            self._dirty = True
+
+        font_files = []
+        for directory, recursive in self.roots:
+            self._list_dir(os.path.abspath(directory), recursive, font_files)
+
+        fonts = self._data["fonts"]
+        live = set()
+        for font_path in font_files:
+            try:
+                stat = os.stat(font_path)
+            except OSError:
+                continue
+            live.add(font_path)
+            entry = fonts.get(font_path)
+            if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime_ns:
+                continue
+            try:
+                faces = _read_faces(font_path)
+            except Exception:
+                faces = []
+            fonts[font_path] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "faces": faces}
+            self._dirty = True
+
+        for stale in set(fonts) - live:
+            del fonts[stale]
+            self._dirty = True
+
+        self._save()
+        return self
+
+    def faces(self):
+        """Iterate over every cataloged FontFace."""
+        if self._data is None:
+            self.refresh()
+        for font_path, entry in sorted(self._data["fonts"].items()):
+            for face in entry["faces"]:
+                yield FontFace(font_path, face["index"], face["family"], face["coverage"])
+
+    def best_face(self, block, prefer_families=(), prefer_paths=(), min_coverage=MIN_BLOCK_COVERAGE):
+        """Pick the face that best covers a Unicode block.
+
+        Faces whose path is in prefer_paths win first (in that order), then
+        faces whose family contains one of prefer_families (in that order),
+        then the face mapping the most codepoints of the block.
+
+        Returns:
+            FontFace, or None if no face covers the block
+        """
+        preferred = [os.path.abspath(p) for p in prefer_paths]
+
+        def rank(face):
+            path_rank = preferred.index(face.path) if face.path in preferred else len(preferred)
+            family_rank = next((i for i, name in enumerate(prefer_families) if name in face.family),
+                               len(prefer_families))
+            return (path_rank, family_rank, -face.coverage.get(block, 0), face.path,
+                    face.face_index or 0)
+
+        candidates = [face for face in self.faces() if face.coverage.get(block, 0) >= min_coverage]
+        return min(candidates, key=rank) if candidates else None
+
+
+def find_font(block, prefer_families=(), prefer_paths=()):
+    """Best installed face for a Unicode block (see FontCatalog.best_face), or None."""
+    try:
+        return FontCatalog().best_face(block, prefer_families, prefer_paths)
+    except OSError as e:
+        print(f"  Note: font catalog unavailable ({e})")
+        return None
+
+
+def main():
+    rescan = '--rescan' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != '--rescan']
+
+    catalog = FontCatalog().refresh(rescan=rescan)
+    blocks = [args[0].lower()] if args else list(BLOCKS.keys())
+    for block in blocks:
+        if block not in BLOCKS:
+            print(f"Error: Unknown block '{block}'")
+            print(f"Available blocks: {', '.join(BLOCKS.keys())}")
+            sys.exit(1)
+
+    print(f"Catalog: {catalog.path}")
+    for block in blocks:
+        faces = [face for face in catalog.faces() if face.coverage.get(block, 0) >= MIN_BLOCK_COVERAGE]
+        print(f"\n{block}: {len(faces)} face(s)")
+        for face in sorted(faces, key=lambda f: -f.coverage[block]):
+            index = "" if face.face_index is None else f" #{face.face_index}"
+            print(f"  {face.coverage[block]:4d}  {face.family}{index}  ({face.path})")
+        best = catalog.best_face(block)
+        if best:
+            print(f"  ✓ Best: {best.family} ({best.path})")
+
+
+if __name__ == "__main__":
+    main()
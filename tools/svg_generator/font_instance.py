@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+font_instance.py - Pinned static instances of variable fonts, cached on disk
+
+The bundled NotoSansDevanagari-VariableFont_wdth,wght.ttf is a variable
+font; drawn as-is every glyph comes out at the default instance (wght=400,
+wdth=100). With `--axis wght=300` (repeatable, one per axis) the extractors
+draw from a static instance at that location instead.
+
+Instancing with fontTools.varLib.instancer takes about a second for that
+font, so the instance is built once and stored in the extraction cache:
+
+  $SVG_GENERATOR_CACHE_DIR/instances/<font sha256[:16]>-<location>.ttf
+
+keyed by the source font's SHA-256 and the full axis location (axes that are
+not given are pinned at their defaults, so `wght=300` and
+`wght=300 wdth=100` share one instance). Later runs at the same location
+just open that file. Since the instance is a different font file, glyph
+cache entries for different locations never mix either.
+
+Each instance is a full copy of the font, so instances count towards the
+extraction cache's size limit ($SVG_GENERATOR_CACHE_MAX_MB) and are evicted
+least-recently-used first together with the cached paths; an evicted
+instance is simply rebuilt the next time its location is asked for.
+
+Usage:
+  python3 tools/svg_generator/font_instance.py <font_file> wght=300 [wdth=100 ...]
+
+From another script in this folder:
+
+    from font_instance import instance_font_source, parse_axis_options
+
+    location = parse_axis_options(pop_list_option(sys.argv, '--axis'))
+    font_bytes, font_path = instance_font_source(font_bytes, font_path, location)
+
+Dependencies: fonttools
+"""
+
+import io
+import os
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from extraction_cache import INSTANCES_DIR, ExtractionCache, _atomic_write, cache_dir_from_env
+from font_session import is_font_collection
+
+
+def parse_axis_options(specs):
+    """Turn ['wght=300', 'wdth=100'] into {'wght': 300.0, 'wdth': 100.0}."""
+    location = {}
+    for spec in specs or []:
+        tag, sep, value = spec.partition("=")
+        tag = tag.strip()
+        if not sep or not tag or len(tag) > 4:
+            raise SystemExit(f"Error: --axis expects TAG=VALUE (e.g. wght=300), got '{spec}'")
+        try:
+            location[tag] = float(value)
+        except ValueError:
+            raise SystemExit(f"Error: --axis {tag} expects a number, got '{value}'")
+    return location
+
+
+def location_label(location):
+    """File-name-safe label of a full axis location, e.g. 'wdth100-wght300'."""
+    return "-".join(f"{tag}{value:g}" for tag, value in sorted(location.items()))
+
+
+def _open_source(font_bytes, font_path):
+    from fontTools.ttLib import TTFont
+
+    if font_path:
+        return TTFont(font_path)
+    return TTFont(io.BytesIO(font_bytes))
+
+
+def _full_location(font, location):
+    """Validate a location against the font's fvar axes and add defaults.
+
+    Returns:
+        {tag: value} for every axis of the font
+    """
+    axes = {axis.axisTag: axis for axis in font["fvar"].axes}
+    unknown = sorted(set(location) - set(axes))
+    if unknown:
+        raise SystemExit(f"Error: Font has no axis {', '.join(unknown)} "
+                         f"(available: {', '.join(axes)})")
+
+    full = {}
+    for tag, axis in axes.items():
+        value = location.get(tag, axis.defaultValue)
+        if not axis.minValue <= value <= axis.maxValue:
+            raise SystemExit(f"Error: {tag}={value:g} is outside the font's range "
+                             f"{axis.minValue:g}..{axis.maxValue:g}")
+        full[tag] = value
+    return full
+
+
+def instance_font_source(font_bytes, font_path, location, cache_dir=None):
+    """Resolve a font source to a cached static instance at `location`.
+
+    Args:
+        font_bytes / font_path: the font as returned by load_font_source
+        location: {axis tag: value}; empty means use the font as-is
+        cache_dir: cache root (defaults to $SVG_GENERATOR_CACHE_DIR)
+
+    Returns:
+        (font_bytes, font_path) to extract from; for an instance font_bytes
+        is None and font_path points into the cache
+    """
+    if not location:
+        return font_bytes, font_path
+    if is_font_collection(font_bytes, font_path):
+        print("  Note: --axis is not supported for font collections; using the font as-is")
+        return font_bytes, font_path
+
+    font = _open_source(font_bytes, font_path)
+    if "fvar" not in font:
+        print("  Note: font is not a variable font; --axis ignored")
+        return font_bytes, font_path
+
+    full = _full_location(font, location)
+    root = Path(cache_dir or cache_dir_from_env())
+    cache = ExtractionCache(cache_dir=root)
+    font_sha = cache.font_hash(font_bytes, font_path)
+    instance_path = root / INSTANCES_DIR / f"{font_sha[:16]}-{location_label(full)}.ttf"
+
+    if instance_path.is_file():
+        print(f"  Using cached instance {location_label(full)}: {instance_path}")
+        cache.touch_instance(instance_path)
+        return None, str(instance_path)
+
+    from fontTools.varLib import instancer
+
+    print(f"  Building static instance {location_label(full)} (once per font and location)...")
+    instance = instancer.instantiateVariableFont(font, full)
+    buf = io.BytesIO()
+    instance.save(buf)
+    _atomic_write(str(instance_path), buf.getvalue())
+    print(f"  ✓ Saved instance: {instance_path}")
+    # The new instance is the most recently used entry, so older ones go first
+    cache.trim(keep=instance_path)
+    return None, str(instance_path)
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: python3 font_instance.py <font_file> TAG=VALUE [TAG=VALUE ...]")
+        print("Example: python3 font_instance.py NotoSansDevanagari-VariableFont_wdth,wght.ttf wght=300")
+        sys.exit(1)
+
+    font_path = sys.argv[1]
+    if not os.path.isfile(font_path):
+        print(f"Error: Font not found: {font_path}")
+        sys.exit(1)
+
+    _, instance_path = instance_font_source(None, font_path, parse_axis_options(sys.argv[2:]))
+    print(f"✓ {instance_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+font_loader.py - Memory-mapped, lazy font loading for the extraction tools
+
+The tools used to read a whole font file into memory and parse it with
+`TTFont(io.BytesIO(font_bytes))`. For the multi-megabyte variable Noto Sans
+Devanagari, every worker process paid for its own copy of the bytes.
+
+open_font() instead memory-maps the file and opens it with `lazy=True`:
+
+  - nothing is read up front except the table directory
+  - a table (cmap, head, hmtx, glyf/loca or CFF, GSUB, ...) is decompiled
+    the first time a glyph lookup touches it, and glyf outlines are expanded
+    glyph by glyph
+  - the mapped pages are shared through the OS page cache, so N workers
+    holding the same font do not hold N copies of it
+
+Downloaded fonts (bytes only) still go through BytesIO, but lazily.
+
+Usage (from another script in this folder):
+
+    from font_loader import open_font
+
+    font = open_font(font_path)                  # .ttf / .otf
+    font = open_font(font_path, font_number=1)   # face 1 of a .ttc
+    font = open_font(font_bytes=downloaded)
+
+Dependencies: fonttools
+"""
+
+import io
+import mmap
+
+from fontTools.ttLib import TTFont, TTCollection
+
+
+def _map_file(font_path):
+    """Memory-map a font file read-only."""
+    with open(font_path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _source(font_path=None, font_bytes=None):
+    """A seekable file object over the font: an mmap for paths, else BytesIO."""
+    if font_path:
+        try:
+            return _map_file(font_path)
+        except (OSError, ValueError):
+            # Empty files and some special filesystems cannot be mapped
+            pass
+        with open(font_path, "rb") as f:
+            return io.BytesIO(f.read())
+    if font_bytes is None:
+        raise ValueError("open_font needs font_path or font_bytes")
+    return io.BytesIO(font_bytes)
+
+
+def open_font(font_path=None, font_bytes=None, font_number=-1):
+    """Open one font face lazily, memory-mapping font_path when given.
+
+    Args:
+        font_path: Font file on disk (preferred; mapped, not read)
+        font_bytes: Raw font bytes, used when there is no file
+        font_number: Face index for .ttc collections (-1 for plain fonts)
+
+    Returns:
+        TTFont whose tables are decompiled on first access
+    """
+    source = _source(font_path, font_bytes)
+    font = TTFont(source, fontNumber=font_number, lazy=True)
+    # Keep the mapping alive as long as the font; TTFont reads from it lazily
+    font._font_loader_source = source
+    return font
+
+
+def open_collection(font_path=None, font_bytes=None):
+    """Open every face of a .ttc collection lazily over one shared mapping."""
+    source = _source(font_path, font_bytes)
+    collection = TTCollection(source, lazy=True)
+    collection._font_loader_source = source
+    return collection
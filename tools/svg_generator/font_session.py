@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+font_session.py - Open a font once and reuse it for a whole extraction run
+
+The extractors used to build a fresh TTFont for every glyph they drew (and,
+for .ttc collections, probe fontNumber 0..4 every single time). A FontSession
+parses the font once, resolves the right face of a collection once, and keeps
+the best cmap and glyph set around so every later glyph lookup is a dict hit.
+Fonts on disk are memory-mapped and opened lazily (font_loader.py), so only
+the tables a glyph lookup touches are ever decompiled.
+
+Usage (from another script in this folder):
+
+    from font_session import FontSession
+
+    session = FontSession(font_bytes=font_bytes, font_path=font_path,
+                          probe_codepoints=HINDI_LETTERS.values())
+    result = session.draw_svg_path(0x0915)   # (path_d, em) or None
+    result = session.draw_normalized(0x0915) # (PathIR, em) or None
+
+Dependencies: fonttools
+"""
+
+import struct
+
+from fontTools.pens.svgPathPen import SVGPathPen
+from fontTools.ttLib import TTLibError
+
+from font_loader import open_collection, open_font
+from path_pen import IRPen, draw_normalized
+
+
+# Collections rarely hold more than a handful of faces; the old per-glyph
+# probing tried fontNumber 0..4, so keep the same upper bound.
+MAX_COLLECTION_FACES = 5
+
+# What a missing, unreadable or malformed font file raises while being opened
+FONT_OPEN_ERRORS = (OSError, ValueError, struct.error, TTLibError)
+
+
+class FontOpenError(Exception):
+    """A LazyFontSession's font could not be opened."""
+
+
+def is_font_collection(font_bytes=None, font_path=None):
+    """Return True if the font source is a TrueType/OpenType collection (.ttc)."""
+    if font_bytes is not None:
+        return font_bytes[:4] == b"ttcf"
+    if font_path:
+        if font_path.lower().endswith(".ttc"):
+            return True
+        try:
+            with open(font_path, "rb") as f:
+                return f.read(4) == b"ttcf"
+        except OSError:
+            return False
+    return False
+
+
+class FontSession:
+    """A parsed font face with its cmap and glyph set cached for reuse.
+
+    Args:
+        font_bytes: Raw font file bytes (may be None when font_path is given)
+        font_path: Path to the font file (used for TTC collections)
+        probe_codepoints: Codepoints used to pick the right face of a
+            collection; the face covering most of them wins
+        face_index: Explicit collection face to use (skips probing)
+    """
+
+    def __init__(self, font_bytes=None, font_path=None, probe_codepoints=None, face_index=None):
+        if font_bytes is None and not font_path:
+            raise ValueError("FontSession needs font_bytes or font_path")
+
+        self.font_path = font_path
+        self.face_index = None
+        self.font = self._open(font_bytes, font_path, probe_codepoints, face_index)
+
+        self.cmap = self.font.getBestCmap() or {}
+        self.glyph_set = self.font.getGlyphSet()
+        self.em = self.font["head"].unitsPerEm if "head" in self.font else 1000
+        self._glyph_names = {}
+
+    def _open(self, font_bytes, font_path, probe_codepoints, face_index):
+        """Parse the font lazily (see font_loader.py), resolving the collection face once."""
+        # A file on disk is memory-mapped even when its bytes were passed in
+        if font_path:
+            font_bytes = None
+
+        if not is_font_collection(font_bytes, font_path):
+            return open_font(font_path, font_bytes)
+
+        if face_index is not None:
+            self.face_index = face_index
+            return open_font(font_path, font_bytes, font_number=face_index)
+
+        collection = open_collection(font_path, font_bytes)
+        faces = collection.fonts[:MAX_COLLECTION_FACES]
+        probes = list(probe_codepoints or [])
+
+        best_index, best_hits = 0, -1
+        for index, face in enumerate(faces):
+            try:
+                cmap = face.getBestCmap() or {}
+            except Exception:
+                continue
+            hits = sum(1 for cp in probes if cp in cmap)
+            if hits > best_hits:
+                best_index, best_hits = index, hits
+            if probes and hits == len(probes):
+                break
+
+        self.face_index = best_index
+        return faces[best_index]
+
+    def glyph_name(self, codepoint):
+        """Return the glyph name for a codepoint, or None if the font lacks it."""
+        if codepoint in self._glyph_names:
+            return self._glyph_names[codepoint]
+
+        glyph_name = self.cmap.get(codepoint)
+        if glyph_name is None:
+            # Try all cmaps
+            for subtable in self.font["cmap"].tables:
+                if codepoint in subtable.cmap:
+                    glyph_name = subtable.cmap[codepoint]
+                    break
+
+        if glyph_name is not None and glyph_name not in self.glyph_set:
+            glyph_name = None
+
+        self._glyph_names[codepoint] = glyph_name
+        return glyph_name
+
+    def draw_svg_path(self, codepoint):
+        """Draw a codepoint's glyph as an SVG path string in font units.
+
+        Returns:
+            (path_d, em) or None if the glyph is missing or empty
+        """
+        glyph_name = self.glyph_name(codepoint)
+        if glyph_name is None:
+            return None
+
+        pen = SVGPathPen(self.glyph_set)
+        self.glyph_set[glyph_name].draw(pen)
+        path_d = pen.getCommands()
+
+        if not path_d or path_d.strip() == 'M 0 0 Z':
+            return None
+
+        return path_d, self.em
+
+    def draw_ir(self, codepoint):
+        """Draw a codepoint's glyph into a PathIR in font units (no string).
+
+        Returns:
+            (PathIR, em) or None if the glyph is missing or empty
+        """
+        glyph_name = self.glyph_name(codepoint)
+        if glyph_name is None:
+            return None
+
+        pen = IRPen(self.glyph_set)
+        self.glyph_set[glyph_name].draw(pen)
+        ir = pen.get_ir()
+        return (ir, self.em) if len(ir) else None
+
+    def draw_normalized(self, codepoint, padding=0.1):
+        """Draw a codepoint's glyph directly in normalized coordinates.
+
+        Equivalent to normalizing draw_svg_path's string, without producing
+        or parsing that string (see path_pen.py).
+
+        Returns:
+            (PathIR, em) or None if the glyph is missing or empty
+        """
+        glyph_name = self.glyph_name(codepoint)
+        if glyph_name is None:
+            return None
+
+        ir = draw_normalized(self.glyph_set, glyph_name, self.em, padding)
+        return (ir, self.em) if ir is not None else None
+
+
+class LazyFontSession:
+    """Open a FontSession only when a glyph actually has to be drawn.
+
+    Used together with the extraction cache: a run whose glyphs are all cached
+    never parses the font. `factory` is a zero-argument callable returning a
+    FontSession.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._session = None
+
+    @property
+    def is_open(self):
+        return self._session is not None
+
+    def get(self):
+        """Return the underlying FontSession, opening it on first use.
+
+        Raises:
+            FontOpenError: the font could not be opened; errors raised while
+                drawing or caching glyphs are not wrapped
+        """
+        if self._session is None:
+            try:
+                self._session = self._factory()
+            except FONT_OPEN_ERRORS as e:
+                raise FontOpenError(str(e)) from e
+        return self._session
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
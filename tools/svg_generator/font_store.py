@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+font_store.py - Offline-first, content-addressed store for the fonts the tools use
+
+The extractors used to call `download_font` (requests.get, 30 s timeout) for
+every URL in DEFAULT_FONT_URLS whenever no local font was found, on every
+run. The store keeps every font it has seen under its SHA-256:
+
+  $SVG_GENERATOR_CACHE_DIR/fonts/<sha256>.ttf    downloaded fonts
+  $SVG_GENERATOR_CACHE_DIR/fonts/index.json      name -> sha, url -> sha,
+                                                 sha -> file (or repo path)
+
+It is seeded from the fonts checked into this repo (referenced in place, not
+copied), so a font can be asked for by family or file name
+("Noto Sans Telugu", "downloaded_font.ttf"), by URL, or by hash. fetch_font
+only goes to the network when none of those match, and:
+
+  - never when SVG_GENERATOR_OFFLINE=1 is set
+  - stops trying further URLs after the first connection failure, and skips
+    the network entirely for NETWORK_RETRY_SECONDS after one
+  - stores what it downloads, so a font is downloaded at most once
+
+Usage:
+  python3 tools/svg_generator/font_store.py list
+  python3 tools/svg_generator/font_store.py add <font_file> [name]
+  python3 tools/svg_generator/font_store.py fetch <url> [name]
+
+From another script in this folder:
+
+    from font_store import fetch_font
+
+    font_path = fetch_font(DEFAULT_FONT_URLS, name='Noto Sans Telugu')
+
+Dependencies: fonttools, requests (only when a download is needed)
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from extraction_cache import ExtractionCache, _atomic_write, cache_dir_from_env
+
+
+INDEX_FILE = "index.json"
+
+# After a failed connection, don't try the network again for this long
+NETWORK_RETRY_SECONDS = 600
+
+# (connect, read) timeouts for downloads
+DOWNLOAD_TIMEOUT = (5, 30)
+
+WORKSPACE_ROOT = SCRIPT_DIR.parent.parent
+
+# Fonts checked into this repo; referenced in place when seeding the store
+REPO_FONTS = [
+    WORKSPACE_ROOT / "downloaded_font.ttf",
+    SCRIPT_DIR / "NotoSansDevanagari-VariableFont_wdth,wght.ttf",
+]
+
+
+def is_offline():
+    """True when SVG_GENERATOR_OFFLINE is set to a non-empty, non-zero value."""
+    return os.environ.get("SVG_GENERATOR_OFFLINE", "") not in ("", "0", "false", "no")
+
+
+def _font_names(font_path):
+    """Names a font can be looked up by: its file name and family name(s)."""
+    names = {os.path.basename(font_path)}
+    try:
+        from font_loader import open_font
+
+        font = open_font(font_path)
+        if 'name' in font:
+            family = font['name'].getBestFamilyName()
+            if family:
+                names.add(family)
+        font.close()
+    except Exception:
+        pass
+    return names
+
+
+class FontStore:
+    """Content-addressed font files plus a name/URL index.
+
+    Args:
+        root: Store directory (defaults to $SVG_GENERATOR_CACHE_DIR/fonts)
+    """
+
+    def __init__(self, root=None):
+        self.root = Path(root or os.path.join(cache_dir_from_env(), "fonts"))
+        self.index_path = self.root / INDEX_FILE
+        self._hasher = ExtractionCache(cache_dir=self.root.parent)
+        self._index = None
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    @property
+    def index(self):
+        if self._index is None:
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+            for key in ("files", "names", "urls"):
+                self._index.setdefault(key, {})
+        return self._index
+
+    def _save(self):
+        try:
+            _atomic_write(str(self.index_path), json.dumps(self.index, indent=2).encode("utf-8"))
+        except OSError as e:
+            print(f"  Note: could not save font store index ({e})")
+
+    def path_for(self, sha):
+        """Path of the stored font with this SHA-256, or None if it is gone."""
+        entry = self.index["files"].get(sha)
+        if not entry:
+            return None
+        path = entry.get("path") or str(self.root / f"{sha}{entry.get('ext', '.ttf')}")
+        return path if os.path.isfile(path) else None
+
+    # ------------------------------------------------------------------
+    # Adding fonts
+    # ------------------------------------------------------------------
+
+    def add_file(self, font_path, names=(), copy=False):
+        """Register a font file (by reference, or copied in with copy=True).
+
+        Returns:
+            The font's SHA-256
+        """
+        font_path = os.path.abspath(font_path)
+        sha = self._hasher.font_hash(None, font_path)
+        ext = os.path.splitext(font_path)[1].lower() or ".ttf"
+        if copy:
+            with open(font_path, "rb") as f:
+                return self.add_bytes(f.read(), names=set(names) | _font_names(font_path), ext=ext)
+
+        files = self.index["files"]
+        if files.get(sha, {}).get("path") != font_path and not self.path_for(sha):
+            files[sha] = {"path": font_path, "ext": ext}
+        for name in set(names) | _font_names(font_path):
+            self.index["names"][name] = sha
+        self._save()
+        return sha
+
+    def add_bytes(self, font_bytes, names=(), url=None, ext=".ttf"):
+        """Store downloaded font bytes under their hash.
+
+        Returns:
+            The font's SHA-256
+        """
+        sha = hashlib.sha256(font_bytes).hexdigest()
+        target = self.root / f"{sha}{ext}"
+        if not target.is_file():
+            _atomic_write(str(target), font_bytes)
+        self.index["files"][sha] = {"ext": ext}
+        for name in set(names) | _font_names(str(target)):
+            self.index["names"][name] = sha
+        if url:
+            self.index["urls"][url] = sha
+        self._save()
+        return sha
+
+    def seed(self, font_paths=None):
+        """Register the repo's own fonts (once per file version)."""
+        for font_path in font_paths if font_paths is not None else REPO_FONTS:
+            font_path = str(font_path)
+            if not os.path.isfile(font_path):
+                continue
+            sha = self._hasher.font_hash(None, font_path)
+            if self.path_for(sha) and os.path.basename(font_path) in self.index["names"]:
+                continue
+            self.add_file(font_path)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def find(self, name=None, urls=()):
+        """Find a stored font by name or by any of the URLs. Returns a path or None."""
+        if name:
+            path = self.path_for(self.index["names"].get(name, ""))
+            if path:
+                return path
+        for url in urls:
+            path = self.path_for(self.index["urls"].get(url, ""))
+            if path:
+                return path
+            # A URL's file name can also match a seeded font
+            path = self.path_for(self.index["names"].get(_url_file_name(url), ""))
+            if path:
+                return path
+        return None
+
+    def _network_recently_failed(self):
+        failed_at = self.index.get("network_failed_at", 0)
+        return time.time() - failed_at < NETWORK_RETRY_SECONDS
+
+    def download(self, urls, name=None):
+        """Try URLs in order; store and return the first font downloaded.
+
+        Gives up on the first connection-level failure, since the remaining
+        URLs would time out the same way on a machine without network.
+        """
+        if is_offline():
+            print("  Offline (SVG_GENERATOR_OFFLINE is set); not downloading fonts")
+            return None
+        if self._network_recently_failed():
+            print(f"  Network failed less than {NETWORK_RETRY_SECONDS // 60} minutes ago; "
+                  f"not downloading fonts")
+            return None
+
+        try:
+            import requests
+        except ImportError:
+            print("  Note: 'requests' is not installed; cannot download fonts")
+            return None
+
+        for url in urls:
+            print(f"Downloading font from: {url}")
+            try:
+                r = requests.get(url, allow_redirects=True, timeout=DOWNLOAD_TIMEOUT)
+                r.raise_for_status()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                print(f"Error downloading font: {e}")
+                print("  Network unreachable; skipping remaining URLs")
+                self.index["network_failed_at"] = time.time()
+                self._save()
+                return None
+            except Exception as e:
+                print(f"Error downloading font: {e}")
+                continue
+
+            names = [name] if name else []
+            file_name = _url_file_name(url)
+            if file_name:
+                names.append(file_name)
+            ext = os.path.splitext(file_name)[1].lower() or ".ttf"
+            sha = self.add_bytes(r.content, names=names, url=url, ext=ext)
+            return self.path_for(sha)
+        return None
+
+    def fetch(self, urls, name=None):
+        """Stored font for name/URLs, downloading (once) only if none matches."""
+        self.seed()
+        return self.find(name, urls) or self.download(urls, name)
+
+
+def _url_file_name(url):
+    """Decoded last path segment of a URL, e.g. 'NotoSansTelugu-Regular.ttf'."""
+    return unquote(os.path.basename(urlparse(url).path))
+
+
+def fetch_font(urls, name=None):
+    """Path of a font from the store (see FontStore.fetch), or None."""
+    try:
+        return FontStore().fetch(list(urls), name)
+    except OSError as e:
+        print(f"  Note: font store unavailable ({e})")
+        return None
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ("list", "add", "fetch"):
+        print("Usage: python3 font_store.py [list | add <font_file> [name] | fetch <url> [name]]")
+        sys.exit(1)
+
+    store = FontStore()
+    store.seed()
+    command = sys.argv[1]
+
+    if command == "add":
+        if len(sys.argv) < 3 or not os.path.isfile(sys.argv[2]):
+            print("Error: add needs an existing font file")
+            sys.exit(1)
+        names = sys.argv[3:4]
+        sha = store.add_file(sys.argv[2], names=names, copy=True)
+        print(f"✓ Stored {sys.argv[2]} as {sha[:12]}")
+        return
+
+    if command == "fetch":
+        if len(sys.argv) < 3:
+            print("Error: fetch needs a URL")
+            sys.exit(1)
+        path = store.fetch([sys.argv[2]], sys.argv[3] if len(sys.argv) > 3 else None)
+        if not path:
+            print("✗ Could not fetch font")
+            sys.exit(1)
+        print(f"✓ {path}")
+        return
+
+    print(f"Font store: {store.root}")
+    names_by_sha = {}
+    for name, sha in store.index["names"].items():
+        names_by_sha.setdefault(sha, []).append(name)
+    for sha in sorted(store.index["files"]):
+        path = store.path_for(sha) or "(missing)"
+        print(f"  {sha[:12]}  {', '.join(sorted(names_by_sha.get(sha, [])))}")
+        print(f"                {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+ligature_index.py - Prebuilt index of a font's GSUB ligature substitutions
+
+extract_composite_telugu.resolve_ligature used to walk every lookup in
+GSUB.LookupList, and every subtable's `ligatures` dict, on each call, and it
+only looked at type 4 lookups at the top level (extension lookups and
+ligatures used from contextual lookups were never found). The index walks
+the table once per font and keeps:
+
+  - one trie per ligature lookup (type 4, or type 7 extension wrapping
+    type 4), keyed by the component glyph sequence
+  - a flat dict from complete component sequences to ligature glyphs, so an
+    exact match such as katelu + viramatelu + ssatelu is one dict lookup
+
+Lookups reached only from contextual lookups (types 5/6, and 7 wrapping
+them) are indexed too, with their context ignored.
+
+resolve() also follows chains of ligatures, e.g. ka + e-sign -> kevowel,
+then kevowel + ai-length-mark -> kaivowel, by applying the lookups in
+LookupList order, and memoizes every sequence it has seen.
+
+Usage:
+  python3 tools/svg_generator/ligature_index.py <font_file> [text]
+
+From another script in this folder:
+
+    from ligature_index import ligature_index_for
+
+    index = ligature_index_for(font)   # built once, kept on the TTFont
+    glyph = index.resolve(['katelu', 'viramatelu', 'ssatelu'])
+
+Dependencies: fonttools
+"""
+
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+
+LIGATURE_SUBST = 4
+CONTEXT_SUBST = 5
+CHAIN_CONTEXT_SUBST = 6
+EXTENSION_SUBST = 7
+
+# Trie key marking "a ligature ends here" (glyph names are never None)
+_END = None
+
+
+def _subtables(lookup):
+    """(lookup type, subtable) pairs of a lookup, unwrapping extensions."""
+    for subtable in lookup.SubTable:
+        if lookup.LookupType == EXTENSION_SUBST:
+            yield subtable.ExtensionLookupType, subtable.ExtSubTable
+        else:
+            yield lookup.LookupType, subtable
+
+
+def _nested_lookup_indices(subtable):
+    """Lookup indices a (chain) context subtable applies, in any format."""
+    records = list(getattr(subtable, "SubstLookupRecord", None) or [])
+    for set_name, rule_name in (("SubRuleSet", "SubRule"), ("SubClassSet", "SubClassRule"),
+                                ("ChainSubRuleSet", "ChainSubRule"),
+                                ("ChainSubClassSet", "ChainSubClassRule")):
+        for rule_set in getattr(subtable, set_name, None) or []:
+            if rule_set is None:
+                continue
+            for rule in getattr(rule_set, rule_name, None) or []:
+                records.extend(getattr(rule, "SubstLookupRecord", None) or [])
+    return {record.LookupListIndex for record in records}
+
+
+def _feature_lookup_indices(gsub_table, script=None):
+    """Lookup indices referenced by features (of one script, if given)."""
+    features = gsub_table.FeatureList.FeatureRecord if gsub_table.FeatureList else []
+    if script is None or not gsub_table.ScriptList:
+        feature_indices = range(len(features))
+    else:
+        feature_indices = set()
+        for record in gsub_table.ScriptList.ScriptRecord:
+            if record.ScriptTag != script:
+                continue
+            lang_systems = [record.Script.DefaultLangSys]
+            lang_systems += [lang.LangSys for lang in record.Script.LangSysRecord]
+            for lang_sys in lang_systems:
+                if lang_sys is not None:
+                    feature_indices.update(lang_sys.FeatureIndex)
+    indices = set()
+    for i in feature_indices:
+        indices.update(features[i].Feature.LookupListIndex)
+    return indices
+
+
+class LigatureIndex:
+    """Ligature substitutions of one GSUB table, indexed by component sequence.
+
+    Args:
+        gsub_table: font['GSUB'].table, or None for a font without GSUB
+        script: OpenType script tag (e.g. 'tel2'); when given, only lookups
+            used by that script's features (and what they call) are indexed
+    """
+
+    def __init__(self, gsub_table=None, script=None):
+        # [(lookup_index, trie)] in LookupList order
+        self.lookups = []
+        # complete component sequence -> ligature glyph (first lookup wins)
+        self.sequences = {}
+        self._resolved = {}
+        if gsub_table is not None and gsub_table.LookupList:
+            self._build(gsub_table, script)
+
+    def _build(self, gsub_table, script):
+        lookup_list = gsub_table.LookupList.Lookup
+
+        # Lookups the features use, plus every lookup a contextual one calls
+        wanted = _feature_lookup_indices(gsub_table, script)
+        pending = list(wanted)
+        while pending:
+            index = pending.pop()
+            if not 0 <= index < len(lookup_list):
+                continue
+            for lookup_type, subtable in _subtables(lookup_list[index]):
+                if lookup_type in (CONTEXT_SUBST, CHAIN_CONTEXT_SUBST):
+                    for nested in _nested_lookup_indices(subtable) - wanted:
+                        wanted.add(nested)
+                        pending.append(nested)
+
+        for index in sorted(wanted):
+            if not 0 <= index < len(lookup_list):
+                continue
+            trie = {}
+            for lookup_type, subtable in _subtables(lookup_list[index]):
+                if lookup_type != LIGATURE_SUBST:
+                    continue
+                for first, ligatures in subtable.ligatures.items():
+                    for ligature in ligatures:
+                        components = (first,) + tuple(ligature.Component)
+                        node = trie
+                        for glyph in components:
+                            node = node.setdefault(glyph, {})
+                        # Within a lookup the first listed ligature wins
+                        node.setdefault(_END, ligature.LigGlyph)
+                        self.sequences.setdefault(components, ligature.LigGlyph)
+            if trie:
+                self.lookups.append((index, trie))
+
+    def __len__(self):
+        return len(self.sequences)
+
+    def lookup(self, glyphs):
+        """Ligature glyph for exactly this component sequence, or None."""
+        return self.sequences.get(tuple(glyphs))
+
+    def _longest_match(self, trie, glyphs, start):
+        """(ligature, length) of the longest match at glyphs[start:], or None."""
+        node = trie
+        best = None
+        for i in range(start, len(glyphs)):
+            node = node.get(glyphs[i])
+            if node is None:
+                break
+            if _END in node:
+                best = (node[_END], i - start + 1)
+        return best
+
+    def reduce(self, glyphs):
+        """Apply every ligature lookup in order, left to right.
+
+        Returns:
+            tuple of glyph names after all ligatures that match were formed
+        """
+        glyphs = list(glyphs)
+        for _, trie in self.lookups:
+            out = []
+            i = 0
+            while i < len(glyphs):
+                match = self._longest_match(trie, glyphs, i)
+                if match:
+                    out.append(match[0])
+                    i += match[1]
+                else:
+                    out.append(glyphs[i])
+                    i += 1
+            glyphs = out
+        return tuple(glyphs)
+
+    def resolve(self, glyphs):
+        """Single glyph a component sequence turns into, or None.
+
+        An exact entry wins; otherwise the sequence is reduced through the
+        lookups (for chained ligatures). Results are memoized.
+        """
+        key = tuple(glyphs)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        result = self.sequences.get(key)
+        if result is None and len(key) > 1:
+            reduced = self.reduce(key)
+            if len(reduced) == 1:
+                result = reduced[0]
+
+        self._resolved[key] = result
+        return result
+
+
+def ligature_index_for(font, script=None):
+    """The LigatureIndex of a TTFont, built on first use and kept on the font."""
+    cache = getattr(font, "_ligature_indexes", None)
+    if cache is None:
+        cache = font._ligature_indexes = {}
+    index = cache.get(script)
+    if index is None:
+        gsub_table = font["GSUB"].table if "GSUB" in font else None
+        index = LigatureIndex(gsub_table, script)
+        cache[script] = index
+    return index
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python3 ligature_index.py <font_file> [text]")
+        sys.exit(1)
+
+    import time
+    from font_loader import open_font
+
+    font = open_font(sys.argv[1])
+    start = time.perf_counter()
+    index = ligature_index_for(font)
+    elapsed = time.perf_counter() - start
+    print(f"✓ Indexed {len(index)} ligatures from {len(index.lookups)} lookups "
+          f"in {elapsed * 1000:.1f} ms")
+
+    if len(sys.argv) > 2:
+        cmap = font.getBestCmap() or {}
+        glyphs = [cmap.get(ord(char)) for char in sys.argv[2]]
+        if None in glyphs:
+            print("✗ Font does not map every character of the text")
+            sys.exit(1)
+        ligature = index.resolve(glyphs)
+        print(f"  {' + '.join(glyphs)}")
+        if ligature:
+            print(f"  ✓ -> {ligature}")
+        else:
+            print(f"  ✗ no single ligature (reduces to {' + '.join(index.reduce(glyphs))})")
+
+
+if __name__ == "__main__":
+    main()
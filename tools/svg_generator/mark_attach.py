@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+mark_attach.py - Place marks on bases with the font's own GPOS anchors
+
+The am/aha tools positioned marks without the font's help:
+extract_hindi_am_aha.py centers the mark over a fraction of the base's
+bounding box (position_mark_above_base), and extract_am_aha.py /
+extract_composite_telugu.py add up hmtx advances, falling back to a
+hard-coded 500. The font already says where marks go:
+
+  GPOS MarkBase (type 4) and MarkMark (type 6) lookups, including ones
+  wrapped in extension (type 9) lookups, give every base / mark glyph an
+  anchor per mark class; a mark is placed so its anchor lands on the
+  anchor of the glyph it attaches to.
+
+AnchorIndex reads all of those anchors once per font into per-glyph dicts,
+so attaching any base x mark pair is a couple of dict lookups.
+MarkAttacher lays out a glyph sequence the way a shaper would for these
+cases (marks with anchors attach, GDEF marks without one sit on the base,
+everything else advances by its hmtx width) and draws the result straight
+into a normalized PathIR in one pass: the combined control bounds give the
+normalize transform, and each part is drawn through one IRPen with its
+offset folded into that transform.
+
+Usage (from another script in this folder):
+
+    from mark_attach import mark_attacher_for
+
+    attacher = mark_attacher_for(font)        # built once, kept on the TTFont
+    layout = attacher.layout(['uni0905', 'uni0902'])
+    ir = attacher.draw_normalized(layout, em=1000, padding=0.1)
+
+Dependencies: fonttools
+"""
+
+from collections import namedtuple
+
+from fontTools.pens.boundsPen import ControlBoundsPen
+
+from path_ir import normalize_transform
+from path_pen import IRPen
+
+
+MARK_BASE_POS = 4
+MARK_MARK_POS = 6
+EXTENSION_POS = 9
+
+# GDEF glyph class of combining marks
+GDEF_MARK = 3
+
+# One glyph of a layout, in font units (Y-up). `how` is 'base', 'anchor',
+# 'mark' (unanchored mark left on its base) or 'advance'.
+PlacedGlyph = namedtuple('PlacedGlyph', ['glyph_name', 'x', 'y', 'how'])
+
+
+def _subtables(lookup):
+    """(lookup type, subtable) pairs of a GPOS lookup, unwrapping extensions."""
+    for subtable in lookup.SubTable:
+        if lookup.LookupType == EXTENSION_POS:
+            yield subtable.ExtensionLookupType, subtable.ExtSubTable
+        else:
+            yield lookup.LookupType, subtable
+
+
+def _xy(anchor):
+    return (anchor.XCoordinate, anchor.YCoordinate)
+
+
+class AnchorIndex:
+    """Every MarkBase/MarkMark anchor of one GPOS table, keyed by glyph.
+
+    Mark classes are only meaningful within their subtable, so anchors are
+    stored under (lookup index, subtable index, class) keys. Keys keep
+    LookupList order, so the first lookup that can attach a pair wins.
+
+    Args:
+        gpos_table: font['GPOS'].table, or None for a font without GPOS
+    """
+
+    def __init__(self, gpos_table=None):
+        # glyph -> {key: (x, y)} for glyphs used as marks
+        self.mark_anchors = {}
+        # glyph -> {key: (x, y)} for bases (MarkBase) and for marks that
+        # other marks stack on (MarkMark)
+        self.base_anchors = {}
+        self._pairs = {}
+        if gpos_table is not None and gpos_table.LookupList:
+            self._build(gpos_table)
+
+    def _build(self, gpos_table):
+        for lookup_index, lookup in enumerate(gpos_table.LookupList.Lookup):
+            for sub_index, (lookup_type, subtable) in enumerate(_subtables(lookup)):
+                if getattr(subtable, "Format", 1) != 1:
+                    continue
+                if lookup_type == MARK_BASE_POS:
+                    marks, mark_array = subtable.MarkCoverage.glyphs, subtable.MarkArray
+                    bases = subtable.BaseCoverage.glyphs
+                    base_records = [record.BaseAnchor for record in subtable.BaseArray.BaseRecord]
+                elif lookup_type == MARK_MARK_POS:
+                    marks, mark_array = subtable.Mark1Coverage.glyphs, subtable.Mark1Array
+                    bases = subtable.Mark2Coverage.glyphs
+                    base_records = [record.Mark2Anchor for record in subtable.Mark2Array.Mark2Record]
+                else:
+                    continue
+
+                for glyph, record in zip(marks, mark_array.MarkRecord):
+                    key = (lookup_index, sub_index, record.Class)
+                    self.mark_anchors.setdefault(glyph, {}).setdefault(key, _xy(record.MarkAnchor))
+                for glyph, anchors in zip(bases, base_records):
+                    for mark_class, anchor in enumerate(anchors):
+                        if anchor is None:
+                            continue
+                        key = (lookup_index, sub_index, mark_class)
+                        self.base_anchors.setdefault(glyph, {}).setdefault(key, _xy(anchor))
+
+    def attachment(self, base_glyph, mark_glyph):
+        """Offset of mark_glyph's origin from base_glyph's origin, or None.
+
+        The offset puts the mark's anchor exactly on the base's anchor for
+        the first lookup that has both.
+        """
+        pair = (base_glyph, mark_glyph)
+        if pair in self._pairs:
+            return self._pairs[pair]
+
+        offset = None
+        base = self.base_anchors.get(base_glyph)
+        mark = self.mark_anchors.get(mark_glyph)
+        if base and mark:
+            for key in sorted(mark):
+                if key in base:
+                    (bx, by), (mx, my) = base[key], mark[key]
+                    offset = (bx - mx, by - my)
+                    break
+
+        self._pairs[pair] = offset
+        return offset
+
+
+class MarkAttacher:
+    """Lay out base + mark glyph sequences of one font and draw them.
+
+    Args:
+        font: TTFont (GPOS, GDEF and hmtx are read if present)
+    """
+
+    def __init__(self, font):
+        self.glyph_set = font.getGlyphSet()
+        self.index = AnchorIndex(font["GPOS"].table if "GPOS" in font else None)
+        self.glyph_classes = {}
+        if "GDEF" in font and font["GDEF"].table.GlyphClassDef:
+            self.glyph_classes = font["GDEF"].table.GlyphClassDef.classDefs
+        self.metrics = font["hmtx"].metrics if "hmtx" in font else {}
+        self._bounds = {}
+
+    def is_mark(self, glyph_name):
+        return self.glyph_classes.get(glyph_name) == GDEF_MARK
+
+    def bounds(self, glyph_name):
+        """Control bounds of a glyph (cached), or None if it has no outline."""
+        if glyph_name not in self._bounds:
+            pen = ControlBoundsPen(self.glyph_set)
+            self.glyph_set[glyph_name].draw(pen)
+            self._bounds[glyph_name] = pen.bounds
+        return self._bounds[glyph_name]
+
+    def advance(self, glyph_name):
+        """hmtx advance width; the ink's right edge for fonts without hmtx."""
+        if glyph_name in self.metrics:
+            return self.metrics[glyph_name][0]
+        bounds = self.bounds(glyph_name)
+        return bounds[2] if bounds else 0
+
+    def layout(self, glyph_names):
+        """Position a base followed by marks (or further spacing glyphs).
+
+        A glyph attaches by anchor to the closest earlier glyph that has a
+        matching anchor (the previous mark first, for stacked marks, then
+        the base). A GDEF mark without any anchor stays on its base's
+        origin; every other glyph is placed at the pen position and
+        advances it.
+
+        Returns:
+            list of PlacedGlyph
+        """
+        placed = []
+        pen_x = 0
+        cluster = []
+        for glyph_name in glyph_names:
+            attached = None
+            for target in reversed(cluster):
+                offset = self.index.attachment(target.glyph_name, glyph_name)
+                if offset is not None:
+                    attached = PlacedGlyph(glyph_name, target.x + offset[0],
+                                           target.y + offset[1], 'anchor')
+                    break
+
+            if attached is None and self.is_mark(glyph_name) and cluster:
+                attached = PlacedGlyph(glyph_name, cluster[0].x, cluster[0].y, 'mark')
+
+            if attached is not None:
+                placed.append(attached)
+                cluster.append(attached)
+                continue
+
+            glyph = PlacedGlyph(glyph_name, pen_x, 0, 'base' if not placed else 'advance')
+            placed.append(glyph)
+            cluster = [glyph]
+            pen_x += self.advance(glyph_name)
+        return placed
+
+    def layout_bounds(self, layout):
+        """Control bounds of a whole layout in font units, or None."""
+        boxes = []
+        for glyph in layout:
+            bounds = self.bounds(glyph.glyph_name)
+            if bounds:
+                x_min, y_min, x_max, y_max = bounds
+                boxes.append((x_min + glyph.x, y_min + glyph.y, x_max + glyph.x, y_max + glyph.y))
+        if not boxes:
+            return None
+        return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+    def draw_normalized(self, layout, em=1000, padding=0.1):
+        """Draw a layout straight into em x em, Y-down, padded coordinates.
+
+        Returns:
+            PathIR, or None if nothing in the layout has an outline
+        """
+        bounds = self.layout_bounds(layout)
+        if bounds is None:
+            return None
+        scale, offset_x, offset_y = normalize_transform(bounds, em, padding)
+
+        # x' = (x + gx)*s + ox ;  y' = (em - (y + gy))*s + oy
+        pen = IRPen(self.glyph_set, scale, flip_em=em)
+        for glyph in layout:
+            pen.dx = glyph.x * scale + offset_x
+            pen.dy = offset_y - glyph.y * scale
+            self.glyph_set[glyph.glyph_name].draw(pen)
+        ir = pen.get_ir()
+        return ir if len(ir) else None
+
+
+def mark_attacher_for(font):
+    """The MarkAttacher of a TTFont, built on first use and kept on the font."""
+    attacher = getattr(font, "_mark_attacher", None)
+    if attacher is None:
+        attacher = font._mark_attacher = MarkAttacher(font)
+    return attacher
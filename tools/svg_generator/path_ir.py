@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+path_ir.py - Parse an SVG path once into a compact IR and transform it there
+
+The extractors used to normalize glyph outlines by regex-parsing the `d`
+string, formatting every number back to a string with `:.2f`, and then
+re-parsing those strings in a second pass. That code was copied into five
+scripts. This module replaces it with one shared representation:
+
+  PathIR.commands  array('B') of command codes (MOVE, LINE, ... CLOSE)
+  PathIR.coords    array('d') of all command arguments, flattened
+
+Relative commands are resolved to absolute ones while parsing, so every
+transform is a plain per-axis affine map. Flip, translate, scale and bounds
+all work on the IR; it is only turned back into a string by serialize_path.
+
+Usage (from another script in this folder):
+
+    from path_ir import parse_path, normalize_ir, serialize_path
+
+    ir = parse_path(path_d)
+    normalized = serialize_path(normalize_ir(ir, em=1000, padding=0.1))
+
+    # or in one call
+    normalized = normalize_path(path_d, em=1000, padding=0.1)
+"""
+
+import re
+from array import array
+
+
+# Command codes (index into COMMAND_LETTERS / ARG_COUNTS / ARG_ROLES)
+MOVE, LINE, HLINE, VLINE, CUBIC, SMOOTH_CUBIC, QUAD, SMOOTH_QUAD, ARC, CLOSE = range(10)
+
+COMMAND_LETTERS = "MLHVCSQTAZ"
+_CODES = {letter: code for code, letter in enumerate(COMMAND_LETTERS)}
+
+# Argument roles: which axis each number lives on
+ROLE_X, ROLE_Y, ROLE_RX, ROLE_RY, ROLE_ANGLE, ROLE_FLAG = range(6)
+
+ARG_ROLES = (
+    (ROLE_X, ROLE_Y),                                   # M x y
+    (ROLE_X, ROLE_Y),                                   # L x y
+    (ROLE_X,),                                          # H x
+    (ROLE_Y,),                                          # V y
+    (ROLE_X, ROLE_Y, ROLE_X, ROLE_Y, ROLE_X, ROLE_Y),   # C x1 y1 x2 y2 x y
+    (ROLE_X, ROLE_Y, ROLE_X, ROLE_Y),                   # S x2 y2 x y
+    (ROLE_X, ROLE_Y, ROLE_X, ROLE_Y),                   # Q x1 y1 x y
+    (ROLE_X, ROLE_Y),                                   # T x y
+    (ROLE_RX, ROLE_RY, ROLE_ANGLE, ROLE_FLAG, ROLE_FLAG, ROLE_X, ROLE_Y),  # A
+    (),                                                 # Z
+)
+ARG_COUNTS = tuple(len(roles) for roles in ARG_ROLES)
+
+# One token = a command letter or a number (with optional exponent)
+_TOKEN_RE = re.compile(r"[MmLlHhVvCcSsQqTtAaZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+class PathIR:
+    """Command codes plus a flat float array of their (absolute) arguments."""
+
+    __slots__ = ("commands", "coords", "_roles")
+
+    def __init__(self, commands=None, coords=None):
+        self.commands = commands if commands is not None else array("B")
+        self.coords = coords if coords is not None else array("d")
+        self._roles = None
+
+    def roles(self):
+        """Per-coordinate axis roles (ROLE_X, ROLE_Y, ...), built once."""
+        if self._roles is None or len(self._roles) != len(self.coords):
+            roles = array("B")
+            for code in self.commands:
+                roles.extend(ARG_ROLES[code])
+            self._roles = roles
+        return self._roles
+
+    def copy(self):
+        return PathIR(array("B", self.commands), array("d", self.coords))
+
+    def __len__(self):
+        return len(self.commands)
+
+
+def parse_path(path_d):
+    """Tokenize an SVG path `d` string once into a PathIR.
+
+    Relative commands are converted to absolute coordinates, and implicit
+    repeats ("L 1 2 3 4", or extra pairs after M) become separate commands.
+    """
+    commands = array("B")
+    coords = array("d")
+    tokens = _TOKEN_RE.findall(path_d)
+
+    cur_x = cur_y = start_x = start_y = 0.0
+    letter = None
+    i = 0
+    n = len(tokens)
+    while i < n:
+        token = tokens[i]
+        if token[0].isalpha():
+            letter = token
+            i += 1
+            if letter in "Zz":
+                commands.append(CLOSE)
+                cur_x, cur_y = start_x, start_y
+                continue
+            if i >= n:
+                break
+        elif letter is None or letter in "Zz":
+            raise ValueError(f"Path data must start with a command: {path_d[:40]!r}")
+
+        code = _CODES[letter.upper()]
+        count = ARG_COUNTS[code]
+        if i + count > n:
+            break
+        try:
+            args = [float(t) for t in tokens[i:i + count]]
+        except ValueError:
+            raise ValueError(f"Malformed {letter} command in path data")
+        i += count
+
+        if letter.islower():
+            if code == HLINE:
+                args[0] += cur_x
+            elif code == VLINE:
+                args[0] += cur_y
+            elif code == ARC:
+                args[5] += cur_x
+                args[6] += cur_y
+            else:
+                for k in range(0, count, 2):
+                    args[k] += cur_x
+                    args[k + 1] += cur_y
+
+        if code == HLINE:
+            cur_x = args[0]
+        elif code == VLINE:
+            cur_y = args[0]
+        else:
+            cur_x, cur_y = args[-2], args[-1]
+
+        commands.append(code)
+        coords.extend(args)
+
+        if code == MOVE:
+            start_x, start_y = cur_x, cur_y
+            # Extra coordinate pairs after a moveto are implicit linetos
+            letter = "l" if letter == "m" else "L"
+
+    return PathIR(commands, coords)
+
+
+def as_path_ir(path):
+    """Accept either a PathIR or a `d` string."""
+    return path if isinstance(path, PathIR) else parse_path(path)
+
+
+def concat_paths(paths):
+    """Join several paths (PathIR or strings) into one PathIR."""
+    result = PathIR()
+    for path in paths:
+        ir = as_path_ir(path)
+        result.commands.extend(ir.commands)
+        result.coords.extend(ir.coords)
+    return result
+
+
+def path_bounds(path):
+    """Bounding box over all on-curve and control points.
+
+    Returns:
+        (min_x, min_y, max_x, max_y), or None if the path has no X or no Y
+    """
+    ir = as_path_ir(path)
+    coords = ir.coords
+    xs = [coords[k] for k, role in enumerate(ir.roles()) if role == ROLE_X]
+    ys = [coords[k] for k, role in enumerate(ir.roles()) if role == ROLE_Y]
+    if not xs or not ys:
+        return None
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def affine_path(path, scale=1.0, tx=0.0, ty=0.0, flip_em=None, scale_y=None):
+    """Apply x' = x*scale + tx and y' = y*scale_y + ty in one pass.
+
+    With flip_em set, Y is mirrored first: y' = (flip_em - y)*scale_y + ty,
+    which turns font (Y-up) coordinates into SVG (Y-down) ones. Arc radii are
+    scaled, and the sweep flag is toggled when Y is mirrored.
+    """
+    ir = as_path_ir(path)
+    if scale_y is None:
+        scale_y = scale
+    coords = array("d", ir.coords)
+    roles = ir.roles()
+    mirrored = (flip_em is not None) != (scale_y < 0)
+
+    for k, role in enumerate(roles):
+        if role == ROLE_X:
+            coords[k] = coords[k] * scale + tx
+        elif role == ROLE_Y:
+            if flip_em is not None:
+                coords[k] = (flip_em - coords[k]) * scale_y + ty
+            else:
+                coords[k] = coords[k] * scale_y + ty
+        elif role == ROLE_RX:
+            coords[k] = abs(coords[k] * scale)
+        elif role == ROLE_RY:
+            coords[k] = abs(coords[k] * scale_y)
+        elif role == ROLE_ANGLE and mirrored:
+            coords[k] = -coords[k]
+        elif role == ROLE_FLAG and mirrored and roles[k - 1] == ROLE_FLAG:
+            # Second flag of an arc is the sweep flag
+            coords[k] = 1.0 - coords[k]
+
+    return PathIR(array("B", ir.commands), coords)
+
+
+def translate_path(path, dx=0.0, dy=0.0):
+    """Translate every point of a path by (dx, dy)."""
+    return affine_path(path, 1.0, dx, dy)
+
+
+def flip_y(path, em=1000):
+    """Mirror Y around em (fonts are Y-up, SVG/Flutter are Y-down)."""
+    return affine_path(path, 1.0, 0.0, 0.0, flip_em=em)
+
+
+def normalize_transform(bounds, em=1000, padding=0.1):
+    """Scale and offsets that fit Y-flipped bounds into em x em with padding.
+
+    Args:
+        bounds: (min_x, min_y, max_x, max_y) in font (Y-up) coordinates
+
+    Returns:
+        (scale, offset_x, offset_y) to use as
+        x' = x*scale + offset_x,  y' = (em - y)*scale + offset_y
+    """
+    min_x, raw_min_y, max_x, raw_max_y = bounds
+    # Bounds of the flipped path
+    min_y, max_y = em - raw_max_y, em - raw_min_y
+
+    width = max_x - min_x if max_x != min_x else em
+    height = max_y - min_y if max_y != min_y else em
+
+    # Calculate scale and offset to fit in em x em with padding
+    if width > 0 and height > 0:
+        scale = min(em * (1 - 2 * padding) / width, em * (1 - 2 * padding) / height)
+    else:
+        scale = 1
+    offset_x = em * padding - min_x * scale
+    offset_y = em * padding - min_y * scale
+    return scale, offset_x, offset_y
+
+
+def normalize_ir(path, em=1000, padding=0.1):
+    """Flip Y and fit a font-unit path into an em x em box with padding.
+
+    One bounds pass plus one transform pass; no intermediate strings.
+    """
+    ir = as_path_ir(path)
+    bounds = path_bounds(ir)
+    if bounds is None:
+        return flip_y(ir, em)
+    scale, offset_x, offset_y = normalize_transform(bounds, em, padding)
+    return affine_path(ir, scale, offset_x, offset_y, flip_em=em)
+
+
+def serialize_path(path, precision=2):
+    """Format a PathIR as an SVG `d` string, e.g. "M 100.00 200.00 L ... Z"."""
+    ir = as_path_ir(path)
+    coords = ir.coords
+    parts = []
+    k = 0
+    for code in ir.commands:
+        count = ARG_COUNTS[code]
+        if not count:
+            parts.append(COMMAND_LETTERS[code])
+            continue
+        if code == ARC:
+            nums = [f"{coords[k + j]:.{precision}f}" if j not in (3, 4) else str(int(coords[k + j]))
+                    for j in range(count)]
+        else:
+            nums = [f"{coords[k + j]:.{precision}f}" for j in range(count)]
+        parts.append(COMMAND_LETTERS[code] + " " + " ".join(nums))
+        k += count
+    return " ".join(parts)
+
+
+def normalize_path(path_d, em=1000, padding=0.1):
+    """Normalize SVG path coordinates to fit in viewBox with padding.
+
+    Fonts use Y-up coordinates (Y increases upward), but SVG/Flutter use
+    Y-down, so Y is flipped as part of the same transform.
+    """
+    return serialize_path(normalize_ir(path_d, em, padding))
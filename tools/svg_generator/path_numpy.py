@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+path_numpy.py - NumPy backend for normalizing PathIR glyph outlines
+
+path_ir.py normalizes one glyph with a per-coordinate Python loop. This
+module does the same work on NumPy arrays: the coordinates of one glyph, or
+of a whole batch of glyphs, live in one float64 array with an axis-role
+array next to it, and
+
+  bounds          = masked min/max reductions (per glyph via reduceat)
+  flip+scale+move = one fused multiply-add over every coordinate
+
+so normalizing an entire script is a handful of array operations. The
+arithmetic matches path_ir.affine_path term for term ((em - y)*scale + dy),
+so both backends format to identical strings.
+
+Usage (from another script in this folder):
+
+    from path_numpy import normalize_batch
+
+    irs = normalize_batch([path_d_1, path_d_2, ...], em=1000, padding=0.1)
+
+If NumPy is not installed, HAVE_NUMPY is False and normalize_batch falls back
+to path_ir.normalize_ir for each glyph.
+
+Dependencies: numpy (optional)
+"""
+
+from array import array
+
+from path_ir import (ROLE_ANGLE, ROLE_FLAG, ROLE_RX, ROLE_RY, ROLE_X, ROLE_Y,
+                     PathIR, as_path_ir, normalize_ir)
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
+
+
+def ir_arrays(path):
+    """Return (coords, roles) of a path as float64 / uint8 NumPy arrays."""
+    ir = as_path_ir(path)
+    coords = np.frombuffer(ir.coords, dtype=np.float64) if len(ir.coords) else np.zeros(0)
+    roles = np.frombuffer(ir.roles(), dtype=np.uint8) if len(ir.coords) else np.zeros(0, np.uint8)
+    return coords, roles
+
+
+def _segment_minmax(values, mask, starts, empty):
+    """Per-glyph min and max of values[mask]; glyphs without any get NaN."""
+    lo = np.where(mask, values, np.inf)
+    hi = np.where(mask, values, -np.inf)
+    mins = np.minimum.reduceat(lo, starts[~empty]) if len(values) else np.zeros(0)
+    maxs = np.maximum.reduceat(hi, starts[~empty]) if len(values) else np.zeros(0)
+    full_min = np.full(len(starts), np.nan)
+    full_max = np.full(len(starts), np.nan)
+    full_min[~empty] = mins
+    full_max[~empty] = maxs
+    full_min[~np.isfinite(full_min)] = np.nan
+    full_max[~np.isfinite(full_max)] = np.nan
+    return full_min, full_max
+
+
+def normalize_batch(paths, em=1000, padding=0.1):
+    """Flip Y and fit every path into an em x em box with padding.
+
+    Args:
+        paths: list of PathIR or `d` strings (font units, Y-up)
+        em: units per em, shared by the batch (one font)
+        padding: fraction of em left empty on each side
+
+    Returns:
+        list of normalized PathIR, in input order
+    """
+    irs = [as_path_ir(path) for path in paths]
+    if not HAVE_NUMPY:
+        return [normalize_ir(ir, em, padding) for ir in irs]
+    if not irs:
+        return []
+
+    # One flat array for the whole batch plus each glyph's slice start
+    lengths = np.array([len(ir.coords) for ir in irs], dtype=np.int64)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    coords = np.concatenate([ir_arrays(ir)[0] for ir in irs]) if lengths.sum() else np.zeros(0)
+    roles = np.concatenate([ir_arrays(ir)[1] for ir in irs]) if lengths.sum() else np.zeros(0, np.uint8)
+    empty = lengths == 0
+    glyph_of = np.repeat(np.arange(len(irs)), lengths)
+
+    is_x = roles == ROLE_X
+    is_y = roles == ROLE_Y
+
+    # Bounds of the Y-flipped glyphs
+    min_x, max_x = _segment_minmax(coords, is_x, starts, empty)
+    raw_min_y, raw_max_y = _segment_minmax(coords, is_y, starts, empty)
+    min_y, max_y = em - raw_max_y, em - raw_min_y
+    missing = np.isnan(min_x) | np.isnan(min_y)
+
+    width = np.where(max_x != min_x, max_x - min_x, em)
+    height = np.where(max_y != min_y, max_y - min_y, em)
+    usable = em * (1 - 2 * padding)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where((width > 0) & (height > 0),
+                         np.minimum(usable / width, usable / height), 1.0)
+    offset_x = em * padding - min_x * scale
+    offset_y = em * padding - min_y * scale
+
+    # Glyphs without bounds are only flipped (same as path_ir.normalize_ir)
+    scale[missing] = 1.0
+    offset_x[missing] = 0.0
+    offset_y[missing] = 0.0
+
+    # Fused affine over every coordinate: out = (c*sign + base)*mul + add
+    # X:  (x)*s + ox        Y:  (em - y)*s + oy
+    # RX/RY: |r*s|          angle: negated      sweep flag: 1 - f
+    s = scale[glyph_of]
+    sign = np.where(is_y | (roles == ROLE_ANGLE), -1.0, 1.0)
+    base = np.where(is_y, float(em), 0.0)
+    mul = np.where(is_x | is_y | (roles == ROLE_RX) | (roles == ROLE_RY), s, 1.0)
+    add = np.where(is_x, offset_x[glyph_of], np.where(is_y, offset_y[glyph_of], 0.0))
+
+    sweep = (roles == ROLE_FLAG) & np.concatenate(([False], roles[:-1] == ROLE_FLAG))
+    sign[sweep] = -1.0
+    base[sweep] = 1.0
+
+    out = (coords * sign + base) * mul + add
+    radius = (roles == ROLE_RX) | (roles == ROLE_RY)
+    out[radius] = np.abs(out[radius])
+
+    results = []
+    for ir, start, length in zip(irs, starts, lengths):
+        chunk = out[start:start + length]
+        results.append(PathIR(array("B", ir.commands), array("d", chunk.tobytes())))
+    return results
+
+
+def normalize_ir_numpy(path, em=1000, padding=0.1):
+    """NumPy counterpart of path_ir.normalize_ir for a single glyph."""
+    return normalize_batch([path], em, padding)[0]
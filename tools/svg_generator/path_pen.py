@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+path_pen.py - Draw glyphs straight into normalized PathIR coordinates
+
+The string pipeline draws a glyph with SVGPathPen, gets a `d` string back,
+parses it into a PathIR and then flips and rescales it. This module skips the
+first string entirely:
+
+  1. ControlBoundsPen measures the glyph's control-point bounds
+  2. path_ir.normalize_transform turns them into scale/offsets
+  3. IRPen records the outline with that transform applied on the fly
+
+so the only string work left is the final serialize_path call.
+
+IRPen emits the same command sequence SVGPathPen does: H/V for axis-aligned
+lines, duplicate points dropped, a moveTo directly followed by another moveTo
+dropped. It applies the same arithmetic as path_ir.affine_path
+((em - y)*scale + offset_y), so the result serializes to exactly the
+string the string pipeline produces.
+
+Usage (from another script in this folder):
+
+    from path_pen import draw_normalized
+
+    ir = draw_normalized(glyph_set, glyph_name, em=1000, padding=0.1)
+    path_d = serialize_path(ir)
+
+Dependencies: fonttools
+"""
+
+from array import array
+
+from fontTools.pens.basePen import BasePen
+from fontTools.pens.boundsPen import ControlBoundsPen
+
+from path_ir import CLOSE, CUBIC, HLINE, LINE, MOVE, QUAD, VLINE, PathIR, normalize_transform
+
+
+class IRPen(BasePen):
+    """A pen that records into a PathIR, mapping points as it goes.
+
+    Points are mapped with x' = x*scale + dx and
+    y' = (flip_em - y)*scale + dy (or y*scale + dy when flip_em is None).
+    """
+
+    def __init__(self, glyphSet=None, scale=1.0, dx=0.0, dy=0.0, flip_em=None):
+        super().__init__(glyphSet)
+        self.commands = array("B")
+        self.coords = array("d")
+        self.scale = scale
+        self.dx = dx
+        self.dy = dy
+        self.flip_em = flip_em
+        self._last_command = None
+        self._last = None
+
+    def _x(self, x):
+        return x * self.scale + self.dx
+
+    def _y(self, y):
+        if self.flip_em is not None:
+            return (self.flip_em - y) * self.scale + self.dy
+        return y * self.scale + self.dy
+
+    def _emit(self, code, *values):
+        self.commands.append(code)
+        self.coords.extend(values)
+        self._last_command = code
+
+    def _moveTo(self, pt):
+        # A moveTo directly after another one replaces it
+        if self._last_command == MOVE:
+            self.commands.pop()
+            del self.coords[-2:]
+        self._emit(MOVE, self._x(pt[0]), self._y(pt[1]))
+        self._last = pt
+
+    def _lineTo(self, pt):
+        last = self._last
+        if last is not None and pt[0] == last[0] and pt[1] == last[1]:
+            return
+        if last is not None and pt[0] == last[0]:
+            self._emit(VLINE, self._y(pt[1]))
+        elif last is not None and pt[1] == last[1]:
+            self._emit(HLINE, self._x(pt[0]))
+        else:
+            self._emit(LINE, self._x(pt[0]), self._y(pt[1]))
+        self._last = pt
+
+    def _curveToOne(self, pt1, pt2, pt3):
+        self._emit(CUBIC, self._x(pt1[0]), self._y(pt1[1]), self._x(pt2[0]), self._y(pt2[1]),
+                   self._x(pt3[0]), self._y(pt3[1]))
+        self._last = pt3
+
+    def _qCurveToOne(self, pt1, pt2):
+        self._emit(QUAD, self._x(pt1[0]), self._y(pt1[1]), self._x(pt2[0]), self._y(pt2[1]))
+        self._last = pt2
+
+    def _closePath(self):
+        self._emit(CLOSE)
+        self._last = None
+
+    def _endPath(self):
+        self._last_command = None
+        self._last = None
+
+    def get_ir(self):
+        """Return the recorded outline as a PathIR."""
+        return PathIR(self.commands, self.coords)
+
+
+def glyph_control_bounds(glyph_set, glyph_name):
+    """(xMin, yMin, xMax, yMax) over all on-curve and control points, or None."""
+    pen = ControlBoundsPen(glyph_set)
+    glyph_set[glyph_name].draw(pen)
+    return pen.bounds
+
+
+def draw_normalized(glyph_set, glyph_name, em=1000, padding=0.1):
+    """Draw a glyph directly into em x em, Y-down, padded coordinates.
+
+    Returns:
+        PathIR, or None if the glyph has no outline
+    """
+    bounds = glyph_control_bounds(glyph_set, glyph_name)
+    if bounds is None:
+        return None
+    scale, offset_x, offset_y = normalize_transform(bounds, em, padding)
+    pen = IRPen(glyph_set, scale, offset_x, offset_y, flip_em=em)
+    glyph_set[glyph_name].draw(pen)
+    ir = pen.get_ir()
+    return ir if len(ir) else None
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+shaper.py - Shape text with one HarfBuzz face/font for a whole run
+
+extract_hindi_ligature_svg.py and extract_composite_hindi.py used to build a
+new hb.Blob, hb.Face, hb.Font and TTFont for every syllable they shaped. A
+Shaper sets all of that up once:
+
+  - the HarfBuzz face/font (the blob is mapped from the font file by
+    HarfBuzz itself when there is a path)
+  - a FontSession (font_session.py) for the fontTools glyph set, which also
+    resolves the right face of a .ttc collection, so HarfBuzz and fontTools
+    always look at the same face
+  - a cache of shaped glyph sequences per input string, so shaping the same
+    syllable again (e.g. am/aha in several tools) is a dict hit
+
+Generating hundreds of conjuncts then costs one font setup plus one
+hb.shape call per distinct syllable.
+
+Usage (from another script in this folder):
+
+    from shaper import Shaper
+
+    shaper = Shaper(font_path=font_path, script='deva', language='hi')
+    glyphs = shaper.shape('क्ष')  # tuple of ShapedGlyph
+    path_d, em = shaper.draw_svg_path('क्ष')
+    ir, em = shaper.draw_ir('क्ष')
+
+Dependencies: fonttools, uharfbuzz
+"""
+
+from collections import namedtuple
+
+from fontTools.pens.svgPathPen import SVGPathPen
+from fontTools.pens.transformPen import TransformPen
+
+# HarfBuzz Python bindings (pip package: uharfbuzz)
+import uharfbuzz as hb
+
+from font_session import FontSession
+from path_pen import IRPen
+
+
+# Positions are requested in 26.6 fixed point (font scale = upem * 64) and
+# divided by this to get font units
+FIXED_26_6 = 64.0
+
+# One positioned glyph of a shaped string, in font units (Y-up).
+# x/y already include the pen position and HarfBuzz's x/y offsets.
+ShapedGlyph = namedtuple('ShapedGlyph', ['glyph_name', 'cluster', 'x', 'y'])
+
+
+class Shaper:
+    """A HarfBuzz font plus fontTools glyph set, kept open for a whole run.
+
+    Args:
+        font_path: Font file on disk (preferred; mapped, not read)
+        font_bytes: Raw font bytes, used when there is no file
+        script: OpenType script tag the buffer is forced to (e.g. 'deva')
+        language: BCP 47 language the buffer is forced to (e.g. 'hi')
+        features: HarfBuzz feature dict passed to every hb.shape call
+        probe_codepoints: Codepoints used to pick the face of a collection
+        face_index: Explicit collection face to use (skips probing)
+    """
+
+    def __init__(self, font_path=None, font_bytes=None, script=None, language=None,
+                 features=None, probe_codepoints=None, face_index=None):
+        self.session = FontSession(font_bytes=font_bytes, font_path=font_path,
+                                   probe_codepoints=probe_codepoints, face_index=face_index)
+        self.script = script
+        self.language = language
+        self.features = dict(features or {})
+
+        if font_path:
+            blob = hb.Blob.from_file_path(font_path)
+        else:
+            blob = hb.Blob(font_bytes)
+        self.hb_face = hb.Face(blob, self.session.face_index or 0)
+        self.hb_font = hb.Font(self.hb_face)
+        # hb.Font defaults to a scale of upem (plain font units); ask for
+        # 26.6 explicitly so dividing by FIXED_26_6 is right
+        upem = self.hb_face.upem
+        self.hb_font.scale = (upem * int(FIXED_26_6), upem * int(FIXED_26_6))
+
+        self.glyph_order = self.session.font.getGlyphOrder()
+        self._shaped = {}
+
+    @property
+    def em(self):
+        return self.session.em
+
+    @property
+    def glyph_set(self):
+        return self.session.glyph_set
+
+    def shape(self, text):
+        """Shape text once and return its positioned glyphs (cached per string).
+
+        Glyph ids HarfBuzz returns that the glyph set cannot draw are dropped.
+
+        Returns:
+            tuple of ShapedGlyph
+        """
+        if not text:
+            raise ValueError("Empty text sequence")
+
+        cached = self._shaped.get(text)
+        if cached is not None:
+            return cached
+
+        buf = hb.Buffer()
+        buf.add_str(text)
+        buf.guess_segment_properties()
+        if self.script:
+            buf.script = self.script
+        if self.language:
+            buf.language = self.language
+        hb.shape(self.hb_font, buf, self.features)
+
+        infos = buf.glyph_infos
+        positions = buf.glyph_positions
+        if not infos:
+            raise RuntimeError("HarfBuzz returned no glyphs for text: %r" % text)
+
+        glyphs = []
+        x_cursor = 0.0
+        y_cursor = 0.0
+        for info, pos in zip(infos, positions):
+            gid = info.codepoint
+            if 0 <= gid < len(self.glyph_order):
+                glyph_name = self.glyph_order[gid]
+                if glyph_name in self.glyph_set:
+                    glyphs.append(ShapedGlyph(glyph_name, info.cluster,
+                                              x_cursor + pos.x_offset / FIXED_26_6,
+                                              y_cursor + pos.y_offset / FIXED_26_6))
+            x_cursor += pos.x_advance / FIXED_26_6
+            y_cursor += pos.y_advance / FIXED_26_6
+
+        glyphs = tuple(glyphs)
+        self._shaped[text] = glyphs
+        return glyphs
+
+    def glyph_name(self, codepoint):
+        """Glyph name the font's cmap maps a codepoint to, or None."""
+        return self.session.glyph_name(codepoint)
+
+    def draw(self, text, pen, nudge=None):
+        """Draw the shaped glyphs of text into a (font-unit) pen.
+
+        Args:
+            nudge: Optional callable(ShapedGlyph) -> (dx, dy) adding an extra
+                offset to individual glyphs, e.g. to move a mark
+        """
+        for glyph in self.shape(text):
+            dx, dy = nudge(glyph) if nudge else (0.0, 0.0)
+            tpen = TransformPen(pen, (1, 0, 0, 1, glyph.x + dx, glyph.y + dy))
+            self.glyph_set[glyph.glyph_name].draw(tpen)
+
+    def draw_svg_path(self, text, nudge=None):
+        """Shape and draw text as one SVG path string in font units.
+
+        Returns:
+            (path_d, em)
+        """
+        pen = SVGPathPen(self.glyph_set)
+        self.draw(text, pen, nudge)
+        path_d = pen.getCommands()
+        if not path_d or path_d.strip() == "M 0 0 Z":
+            raise RuntimeError("Empty path generated for text: %r" % text)
+        return path_d, self.em
+
+    def draw_ir(self, text, nudge=None):
+        """Shape and draw text into one PathIR in font units (no string).
+
+        Each glyph is drawn through one IRPen, offset to its shaped position.
+
+        Returns:
+            (PathIR, em)
+        """
+        pen = IRPen(self.glyph_set)
+        for glyph in self.shape(text):
+            dx, dy = nudge(glyph) if nudge else (0.0, 0.0)
+            pen.dx = glyph.x + dx
+            pen.dy = glyph.y + dy
+            self.glyph_set[glyph.glyph_name].draw(pen)
+        ir = pen.get_ir()
+        if not len(ir):
+            raise RuntimeError("Empty path generated for text: %r" % text)
+        return ir, self.em
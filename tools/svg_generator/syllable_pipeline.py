@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+syllable_pipeline.py - Shape, normalize and save large sets of syllables
+
+Generating every gunintham / barakhadi form or every conjunct of a script
+is a thousand or more syllables. Driving the one-syllable CLIs for that
+re-reads the font on every launch. run_pipeline instead:
+
+  - splits the syllables into chunks and streams them through a process
+    pool, keeping only a few chunks in flight
+  - has each worker open one Shaper (shaper.py) for the font and reuse it,
+    then normalizes the whole chunk with one path_numpy.normalize_batch call
+  - writes each syllable's outputs as soon as its chunk comes back, and
+    appends a line per syllable to <output_dir>/progress.jsonl
+  - on the next run skips every syllable the progress log records as done
+    (whose files still exist), so an interrupted or partly failed run
+    resumes where it stopped
+  - heads the progress log with the run's fingerprint (font SHA-256, axis
+    location, shaper options, padding); a run with a different fingerprint
+    starts over instead of keeping outputs made with the old settings
+  - finally writes <output_dir>/manifest.json listing every syllable
+
+Usage (from another script in this folder):
+
+    from syllable_pipeline import Syllable, run_pipeline
+
+    syllables = [Syllable('ka_aa', 'కా'), ...]
+    run_pipeline(syllables, output_dir, save_outputs, font_path=font_path,
+                 shaper_options={'script': 'telu', 'language': 'te'},
+                 location={'wght': 300.0}, jobs=4)
+
+Dependencies: fonttools, uharfbuzz, numpy (optional)
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from extraction_cache import ExtractionCache, _atomic_write
+from path_ir import serialize_path
+from path_numpy import normalize_batch
+
+
+PROGRESS_FILE = "progress.jsonl"
+MANIFEST_FILE = "manifest.json"
+
+# Syllables per task sent to a worker
+CHUNK_SIZE = 32
+
+# Chunks kept in flight per worker; bounds memory for very large runs
+CHUNKS_IN_FLIGHT = 2
+
+# name: file-name-safe label, text: the Unicode string to shape
+Syllable = namedtuple('Syllable', ['name', 'text'])
+
+# Per-process Shapers, keyed by font source and shaper options
+_SHAPERS = {}
+
+
+def worker_shaper(font_bytes, font_path, shaper_options):
+    """Open (once per worker process) a Shaper for a font and options."""
+    from shaper import Shaper
+
+    source = font_path or hashlib.sha256(font_bytes).hexdigest()
+    key = (source, json.dumps(shaper_options, sort_keys=True, default=list))
+    shaper = _SHAPERS.get(key)
+    if shaper is None:
+        shaper = Shaper(font_path=font_path, font_bytes=font_bytes, **shaper_options)
+        _SHAPERS[key] = shaper
+    return shaper
+
+
+def shape_chunk(font_bytes, font_path, shaper_options, syllables, padding=0.1):
+    """Worker entry point: shape, draw and normalize a chunk of syllables.
+
+    Returns:
+        [(name, normalized_path_or_None, error_or_None), ...] in input order
+    """
+    shaper = worker_shaper(font_bytes, font_path, shaper_options)
+
+    results = {}
+    drawn = []
+    for syllable in syllables:
+        try:
+            ir, _ = shaper.draw_ir(syllable.text)
+            drawn.append((syllable.name, ir))
+        except Exception as e:
+            results[syllable.name] = (None, str(e))
+
+    if drawn:
+        normalized = normalize_batch([ir for _, ir in drawn], em=shaper.em, padding=padding)
+        for (name, _), ir in zip(drawn, normalized):
+            results[name] = (serialize_path(ir), None)
+
+    return [(s.name,) + results[s.name] for s in syllables]
+
+
+def run_fingerprint(font_bytes=None, font_path=None, shaper_options=None, location=None,
+                    padding=0.1):
+    """Everything a run's outputs depend on, as a JSON-ready dict.
+
+    Args:
+        font_bytes / font_path: the font actually shaped (an instance font
+            when --axis was given)
+        shaper_options: keyword arguments for Shaper (script, language,
+            features, ...)
+        location: {axis tag: value} the font was instanced at, if any
+        padding: normalization padding
+    """
+    fingerprint = {
+        "font_sha256": ExtractionCache().font_hash(font_bytes, font_path),
+        "location": dict(sorted((location or {}).items())),
+        "shaper_options": shaper_options or {},
+        "padding": padding,
+    }
+    # Round-trip so it compares equal to the copy read back from the log
+    return json.loads(json.dumps(fingerprint, sort_keys=True, default=list))
+
+
+def split_into_chunks(items, size=CHUNK_SIZE):
+    """Consecutive slices of at most `size` items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class ProgressLog:
+    """Append-only record of finished syllables in <output_dir>/progress.jsonl.
+
+    The first line is {"fingerprint": ...} (see run_fingerprint); every
+    other line is one JSON object {name, text, status, files, error} and the
+    last line for a name wins. With restart=True, or when the log was written
+    under a different fingerprint, the previous log is discarded.
+    """
+
+    def __init__(self, output_dir, restart=False, fingerprint=None):
+        self.path = Path(output_dir) / PROGRESS_FILE
+        self.fingerprint = fingerprint
+        self.entries = {}
+        self._recorded_fingerprint = None
+        if not restart:
+            self._load()
+            if self.path.exists() and self._recorded_fingerprint != fingerprint:
+                if self.entries:
+                    print("  Note: the progress log was written with a different font or options;"
+                          " regenerating every syllable")
+                restart = True
+        if restart:
+            self.entries = {}
+            if self.path.exists():
+                self.path.unlink()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        if self._file.tell() == 0:
+            self._file.write(json.dumps({"fingerprint": fingerprint}, ensure_ascii=False) + "\n")
+            self._file.flush()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A line cut short by an interrupted run
+                        continue
+                    if "fingerprint" in entry:
+                        self._recorded_fingerprint = entry["fingerprint"]
+                        continue
+                    self.entries[entry["name"]] = entry
+        except OSError:
+            pass
+
+    def is_done(self, name):
+        """True if the syllable finished earlier and its files are still there."""
+        entry = self.entries.get(name)
+        if not entry or entry.get("status") != "ok":
+            return False
+        return all(os.path.isfile(path) for path in entry.get("files", []))
+
+    def record(self, name, text, status, files=(), error=None):
+        entry = {"name": name, "text": text, "status": status, "files": list(files)}
+        if error:
+            entry["error"] = error
+        self.entries[name] = entry
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def write_manifest(output_dir, syllables, progress, extra=None):
+    """Write <output_dir>/manifest.json for syllables, in their given order."""
+    items = []
+    for syllable in syllables:
+        entry = progress.entries.get(syllable.name, {})
+        item = {
+            "name": syllable.name,
+            "text": syllable.text,
+            "status": entry.get("status", "pending"),
+            "files": [os.path.basename(path) for path in entry.get("files", [])],
+        }
+        if entry.get("error"):
+            item["error"] = entry["error"]
+        items.append(item)
+
+    manifest = dict(extra or {})
+    manifest["count"] = len(items)
+    manifest["ok"] = sum(1 for item in items if item["status"] == "ok")
+    manifest["syllables"] = items
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    _atomic_write(path, json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"))
+    return path
+
+
+def run_pipeline(syllables, output_dir, save_outputs, font_bytes=None, font_path=None,
+                 shaper_options=None, location=None, padding=0.1, jobs=None, restart=False,
+                 manifest_extra=None, worker=shape_chunk):
+    """Generate every syllable's outputs, resuming from an earlier run.
+
+    Args:
+        syllables: list of Syllable
+        output_dir: where outputs, progress.jsonl and manifest.json go
+        save_outputs: callable(syllable, normalized_path, output_dir) that
+            writes a syllable's files and returns their paths; runs in
+            this process
+        font_bytes / font_path: the font (workers map font_path themselves)
+        shaper_options: keyword arguments for Shaper (script, language, ...)
+        location: {axis tag: value} the font was instanced at, if any; with
+            the font, shaper options and padding it forms the run
+            fingerprint, and progress from another fingerprint is not reused
+        padding: normalization padding
+        jobs: number of worker processes (defaults to the CPU count)
+        restart: ignore progress.jsonl and regenerate everything
+        manifest_extra: extra top-level keys for manifest.json (the
+            fingerprint is always added)
+        worker: chunk function with shape_chunk's signature (must be
+            importable by the workers)
+
+    Returns:
+        True if every syllable has its outputs
+    """
+    jobs = jobs or os.cpu_count() or 1
+    shaper_options = dict(shaper_options or {})
+    os.makedirs(output_dir, exist_ok=True)
+    fingerprint = run_fingerprint(font_bytes, font_path, shaper_options, location, padding)
+    progress = ProgressLog(output_dir, restart=restart, fingerprint=fingerprint)
+    manifest_extra = dict(manifest_extra or {}, fingerprint=fingerprint)
+
+    by_name = {syllable.name: syllable for syllable in syllables}
+    todo = [syllable for syllable in syllables if not progress.is_done(syllable.name)]
+    skipped = len(syllables) - len(todo)
+    chunks = split_into_chunks(todo)
+    # Send bytes only when there is no file the workers could map
+    task_bytes = font_bytes if not font_path else None
+
+    print(f"\nGenerating {len(todo)} syllable(s) in {len(chunks)} chunk(s) on {jobs} worker(s)"
+          + (f" ({skipped} already done)" if skipped else "") + "...")
+
+    start = time.perf_counter()
+    done = 0
+    failed = 0
+
+    def write_results(results):
+        nonlocal done, failed
+        for name, normalized_path, error in results:
+            syllable = by_name[name]
+            if not normalized_path:
+                print(f"  ✗ {name} ({syllable.text}): {error}")
+                progress.record(name, syllable.text, "failed", error=error)
+                failed += 1
+                continue
+            try:
+                files = save_outputs(syllable, normalized_path, output_dir)
+            except OSError as e:
+                print(f"  ✗ {name} ({syllable.text}): {e}")
+                progress.record(name, syllable.text, "failed", error=str(e))
+                failed += 1
+                continue
+            progress.record(name, syllable.text, "ok", files=files)
+            done += 1
+        print(f"  ✓ {done + failed}/{len(todo)} shaped ({failed} failed)")
+
+    try:
+        if jobs == 1:
+            for chunk in chunks:
+                write_results(worker(task_bytes, font_path, shaper_options, chunk, padding))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                pending = set()
+                queue = iter(chunks)
+                for chunk in queue:
+                    pending.add(pool.submit(worker, task_bytes, font_path, shaper_options, chunk,
+                                            padding))
+                    if len(pending) >= jobs * CHUNKS_IN_FLIGHT:
+                        break
+                while pending:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        write_results(future.result())
+                        chunk = next(queue, None)
+                        if chunk is not None:
+                            pending.add(pool.submit(worker, task_bytes, font_path,
+                                                    shaper_options, chunk, padding))
+    finally:
+        progress.close()
+        manifest_path = write_manifest(output_dir, syllables, progress, manifest_extra)
+
+    elapsed = time.perf_counter() - start
+    total_ok = sum(1 for s in syllables if progress.is_done(s.name))
+    print(f"\n✓ Generated {done} syllable(s) in {elapsed:.1f}s; "
+          f"{total_ok}/{len(syllables)} complete")
+    print(f"✓ Manifest: {manifest_path}")
+    if failed:
+        print(f"✗ {failed} syllable(s) failed; run again to retry them")
+    return total_ok == len(syllables)